@@ -1,5 +1,14 @@
-from .fitness_coach import create_fitness_coach_agent
-from .nutrition_expert import create_nutrition_expert_agent
-from .medical_advisor import create_medical_advisor_agent
-from .progress_tracker import create_progress_tracker_agent
-from .shopping_assistant import create_shopping_assistant_agent
\ No newline at end of file
+import importlib
+
+from .lazy_agent import SPECIALISTS, LazyAgent, lazy_sub_agents, resumes_at_specialist
+
+
+_FACTORY_MODULES = {factory: module for module, factory, _ in SPECIALISTS.values()}
+
+
+def __getattr__(name):
+    # create_*_agent factories are imported on first access, not with the package
+    module = _FACTORY_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    return getattr(importlib.import_module(module, __name__), name)
@@ -0,0 +1,79 @@
+"""
+FitX Fast Path - Answer obvious routing decisions without an LLM round trip
+"""
+
+import os
+from typing import Optional
+
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.models import LlmRequest, LlmResponse
+from google.genai import types
+
+from ..tools.intent_router import get_intent_router
+from ..tools.log_parser import DEFAULT_BODY_WEIGHT_KG
+
+
+FAST_PATH_TOOLS = ('log_workout', 'log_meal')
+
+# Invocation-scoped (temp:) so it never leaks into the persisted session
+_FAST_PATH_STATE_KEY = 'temp:fitx_fast_path'
+# Optional user profile value used for MET calorie estimates
+BODY_WEIGHT_STATE_KEY = 'user:weight_kg'
+
+
+def _enabled() -> bool:
+    return os.getenv('FITX_FAST_PATH', '1').lower() not in ('0', 'false', 'no')
+
+
+def _function_call(name: str, args: dict) -> LlmResponse:
+    return LlmResponse(content=types.Content(
+        role='model',
+        parts=[types.Part(function_call=types.FunctionCall(name=name, args=args))]
+    ))
+
+
+def _confirmation(responses) -> LlmResponse:
+    lines = []
+    for response in responses:
+        result = response.response or {}
+        lines.append(result.get('message') or f'{response.name} done.')
+        for achievement in result.get('achievements') or ():
+            lines.append(f"🏆 {achievement.get('milestone') or achievement.get('type')}")
+    return LlmResponse(content=types.Content(role='model', parts=[types.Part(text='\n'.join(lines))]))
+
+
+def route_before_model(callback_context: CallbackContext, llm_request: LlmRequest) -> Optional[LlmResponse]:
+    """
+    ``before_model_callback`` for the orchestrator.
+
+    For a new user message the intent router is consulted; a confident
+    decision is returned as a synthetic model response calling
+    ``transfer_to_agent`` (or log_workout/log_meal with arguments from
+    the log parser), which ADK then executes as if the model had chosen it.
+    After a fast-path tool call the tool's own confirmation message is
+    returned, so a fully specified log request needs no LLM call at all.
+    Returning None lets the request go to the model as usual.
+    """
+    if not _enabled() or not llm_request.contents:
+        return None
+    last = llm_request.contents[-1]
+    if last.role != 'user' or not last.parts:
+        return None
+
+    responses = [part.function_response for part in last.parts if part.function_response]
+    if responses:
+        if callback_context.state.get(_FAST_PATH_STATE_KEY) and all(
+                response.name in FAST_PATH_TOOLS for response in responses):
+            callback_context.state[_FAST_PATH_STATE_KEY] = False
+            return _confirmation(responses)
+        return None
+
+    text = ''.join(part.text for part in last.parts if part.text)
+    body_weight_kg = callback_context.state.get(BODY_WEIGHT_STATE_KEY) or DEFAULT_BODY_WEIGHT_KG
+    decision = get_intent_router().route(text, float(body_weight_kg))
+    if decision is None:
+        return None
+    if decision.tool in FAST_PATH_TOOLS:
+        callback_context.state[_FAST_PATH_STATE_KEY] = True
+        return _function_call(decision.tool, decision.args)
+    return _function_call('transfer_to_agent', {'agent_name': decision.agent})
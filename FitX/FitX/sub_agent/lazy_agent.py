@@ -0,0 +1,149 @@
+"""
+FitX Lazy Agent - Defer specialist construction until the first transfer
+"""
+
+import importlib
+import threading
+from typing import AsyncGenerator, List, Optional
+
+from google.adk.agents import BaseAgent, LlmAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event
+from pydantic import PrivateAttr
+
+
+# Specialist name -> (module, factory, routing description). The description
+# is all the orchestrator needs to route; the module (its instructions and
+# tool imports) is only loaded when the specialist is first used.
+SPECIALISTS = {
+    'fitness_coach': (
+        '.fitness_coach', 'create_fitness_coach_agent',
+        'Expert fitness coach for workout planning, exercise form guidance, '
+        'training routines and muscle-building strategies.'
+    ),
+    'nutrition_expert': (
+        '.nutrition_expert', 'create_nutrition_expert_agent',
+        'Certified nutritionist for meal planning, macro calculations, '
+        'calorie targets and diet strategies for fitness goals.'
+    ),
+    'medical_advisor': (
+        '.medical_advisor', 'create_medical_advisor_agent',
+        'Sports medicine advisor for injury prevention, recovery and exercise '
+        'physiology; always recommends professional medical consultation.'
+    ),
+    'progress_tracker': (
+        '.progress_tracker', 'create_progress_tracker_agent',
+        'Fitness data analyst that logs workouts and meals, reports progress, '
+        'streaks and achievements.'
+    ),
+    'shopping_assistant': (
+        '.shopping_assistant', 'create_shopping_assistant_agent',
+        'Shopping advisor for fitness equipment, healthy food and athletic wear '
+        'from Amazon, Flipkart, Myntra and Blinkit.'
+    )
+}
+
+
+class LazyAgent(BaseAgent):
+    """
+    Placeholder sub-agent that builds the real specialist on first run.
+
+    It carries only the specialist's name and routing description, so the
+    orchestrator can list it in ``sub_agents`` and transfer to it. The
+    first invocation (or name lookup) imports the specialist module, calls
+    its factory and swaps the built agent into the parent's ``sub_agents``
+    in place of the placeholder.
+
+    The swap matters for follow-up turns: ADK's Runner only resumes a
+    conversation at the agent that last replied if every agent on its path
+    to the root is an ``LlmAgent``. A plain BaseAgent placeholder would send
+    every turn back through the orchestrator (one extra LLM round trip).
+    ``find_agent`` resolves too, so a fresh process resuming a stored
+    session finds the real specialist; ``resumes_at_specialist`` checks this.
+
+    Example:
+        >>> coach = LazyAgent(name='fitness_coach', description='...',
+        ...                   module='.fitness_coach', factory='create_fitness_coach_agent')
+    """
+
+    module: str
+    factory: str
+
+    _agent: Optional[BaseAgent] = PrivateAttr(default=None)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    @property
+    def is_built(self) -> bool:
+        return self._agent is not None
+
+    def resolve(self) -> BaseAgent:
+        """Build the specialist (once per process) and return it"""
+        if self._agent is None:
+            with self._lock:
+                if self._agent is None:
+                    factory = getattr(importlib.import_module(self.module, __package__), self.factory)
+                    agent = factory()
+                    if agent.name != self.name:
+                        raise ValueError(f'{self.factory}() built agent {agent.name!r}, expected {self.name!r}')
+                    # Peers and the orchestrator stay reachable for transfers
+                    agent.parent_agent = self.parent_agent
+                    if self.parent_agent is not None:
+                        siblings = self.parent_agent.sub_agents
+                        for index, sub_agent in enumerate(siblings):
+                            if sub_agent is self:
+                                siblings[index] = agent
+                    self._agent = agent
+        return self._agent
+
+    def find_agent(self, name: str) -> Optional[BaseAgent]:
+        # Lookups by name (Runner resuming a session, transfer_to_agent) get the built specialist
+        if name == self.name:
+            return self.resolve()
+        return self._agent.find_agent(name) if self._agent is not None else None
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        async for event in self.resolve().run_async(ctx):
+            yield event
+
+    async def _run_live_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        async for event in self.resolve().run_live(ctx):
+            yield event
+
+
+def resumes_at_specialist(root_agent: BaseAgent, name: str) -> bool:
+    """
+    Whether a follow-up turn after ``name`` replied stays with that specialist.
+
+    Mirrors the check in ADK's ``Runner._find_agent_to_run``: the agent that
+    authored the last event is looked up from the root, and it is resumed
+    only if it and every ancestor are transferable LlmAgents.
+
+    Example:
+        >>> resumes_at_specialist(root_agent, 'fitness_coach')
+        True
+    """
+    agent = root_agent.find_sub_agent(name)
+    if agent is None:
+        return False
+    while agent is not None:
+        if not isinstance(agent, LlmAgent) or agent.disallow_transfer_to_parent:
+            return False
+        agent = agent.parent_agent
+    return True
+
+
+def lazy_sub_agents(names: Optional[List[str]] = None) -> List[LazyAgent]:
+    """
+    Create lazy placeholders for the given specialists (all by default).
+
+    Args:
+        names: Specialist names from SPECIALISTS, e.g. ['fitness_coach']
+
+    Returns:
+        List of LazyAgent instances, ready to pass as ``sub_agents``
+    """
+    agents = []
+    for name in names or SPECIALISTS:
+        module, factory, description = SPECIALISTS[name]
+        agents.append(LazyAgent(name=name, description=description, module=module, factory=factory))
+    return agents
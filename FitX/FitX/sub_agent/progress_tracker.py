@@ -7,7 +7,10 @@ from google.adk.agents import Agent
 from .tools.tracking_tools import (
     log_workout,
     log_meal,
-    get_progress_summary
+    get_progress_summary,
+    get_achievements,
+    bulk_log_workouts,
+    bulk_log_meals
 )
 
 
@@ -46,6 +49,11 @@ def create_progress_tracker_agent() -> Agent:
           * Confirm logging with positive reinforcement
           * Note: "Meal logged! Staying consistent!"
         
+        - **bulk_log_workouts / bulk_log_meals**: When users paste or import
+          past history (several entries at once)
+          * Send all entries in a single call, with timestamps when known
+          * Report how many entries were imported and which rows were rejected
+        
         ### Progress Analysis:
         Use get_progress_summary to analyze:
         - Workout frequency and consistency
@@ -54,6 +62,10 @@ def create_progress_tracker_agent() -> Agent:
         - Adherence to plans
         - Week-over-week changes
         
+        Use get_achievements for streaks, personal records and milestones
+        (optionally for a single exercise). When log_workout returns
+        achievements, celebrate each new record or milestone.
+        
         Provide insights on:
         - What's working well
         - Areas for improvement
@@ -158,6 +170,9 @@ def create_progress_tracker_agent() -> Agent:
         tools=[
             log_workout,
             log_meal,
-            get_progress_summary
+            get_progress_summary,
+            get_achievements,
+            bulk_log_workouts,
+            bulk_log_meals
         ]
     )
@@ -53,6 +53,7 @@ def create_shopping_assistant_agent() -> Agent:
           * Healthy fats (nuts, avocados)
           * Supplements (protein powder, vitamins)
           * Quick delivery from Blinkit/Instamart
+          * Rank by protein, protein_per_rupee, fiber, net_carbs, calories or price (sort_by)
         
         - **search_athletic_wear**: For workout clothing
           * Running shoes and training shoes
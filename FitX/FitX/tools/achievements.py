@@ -0,0 +1,192 @@
+"""
+FitX Achievements - Streak, personal-record and milestone index maintained on write
+"""
+
+import threading
+from datetime import date, datetime
+from typing import Dict, List, Optional
+
+from .event_store import EventProjection, get_event_store
+from .progress_aggregates import day_ordinal
+
+
+WORKOUT_COUNT_MILESTONES = (1, 5, 10, 25, 50, 100, 250, 500, 1000)
+STREAK_MILESTONES = (3, 7, 14, 30, 60, 100, 365)
+
+
+class ExerciseRecord:
+    """Best single-session duration and calories for one exercise."""
+
+    __slots__ = ('sessions', 'best_duration', 'best_duration_ts', 'best_calories', 'best_calories_ts')
+
+    def __init__(self):
+        self.sessions = 0
+        self.best_duration = 0
+        self.best_duration_ts = 0.0
+        self.best_calories = 0
+        self.best_calories_ts = 0.0
+
+    def to_dict(self) -> Dict:
+        return {
+            'sessions': self.sessions,
+            'best_duration_minutes': self.best_duration,
+            'best_duration_date': date.fromtimestamp(self.best_duration_ts).isoformat(),
+            'best_calories': self.best_calories,
+            'best_calories_date': date.fromtimestamp(self.best_calories_ts).isoformat()
+        }
+
+
+class UserAchievements:
+    """Running streak state, per-exercise records and milestones for one user."""
+
+    def __init__(self):
+        self.total_workouts = 0
+        self.workout_days = set()
+        self.last_day: Optional[int] = None
+        self.current_run = 0
+        self.longest_streak = 0
+        self.records: Dict[str, ExerciseRecord] = {}
+        self.milestones: List[Dict] = []
+
+    def _add_day(self, day: int) -> None:
+        if day in self.workout_days:
+            return
+        self.workout_days.add(day)
+        if self.last_day is None or day > self.last_day:
+            consecutive = self.last_day is not None and day == self.last_day + 1
+            self.current_run = self.current_run + 1 if consecutive else 1
+            self.last_day = day
+            self.longest_streak = max(self.longest_streak, self.current_run)
+            return
+        # Backfilled day: rebuild runs from the day set (rare, O(distinct days))
+        longest = run = 0
+        prev = None
+        for d in sorted(self.workout_days):
+            run = run + 1 if prev is not None and d == prev + 1 else 1
+            longest = max(longest, run)
+            prev = d
+        self.current_run = run
+        self.longest_streak = longest
+
+    def record_workout(self, exercise: str, duration: int, calories: int, ts: float) -> List[Dict]:
+        """Update the index for one workout and return any newly earned achievements."""
+        earned = []
+        previous_longest = self.longest_streak
+
+        self.total_workouts += 1
+        self._add_day(day_ordinal(ts))
+
+        record = self.records.get(exercise)
+        if record is None:
+            record = self.records[exercise] = ExerciseRecord()
+        if record.sessions and duration > record.best_duration:
+            earned.append({'type': 'personal_record', 'exercise': exercise, 'metric': 'duration_minutes',
+                           'previous': record.best_duration, 'value': duration})
+        if record.sessions and calories > record.best_calories:
+            earned.append({'type': 'personal_record', 'exercise': exercise, 'metric': 'calories',
+                           'previous': record.best_calories, 'value': calories})
+        record.sessions += 1
+        if duration > record.best_duration or record.sessions == 1:
+            record.best_duration, record.best_duration_ts = duration, ts
+        if calories > record.best_calories or record.sessions == 1:
+            record.best_calories, record.best_calories_ts = calories, ts
+
+        if self.total_workouts in WORKOUT_COUNT_MILESTONES:
+            label = 'First workout logged' if self.total_workouts == 1 else f'{self.total_workouts} workouts logged'
+            earned.append({'type': 'milestone', 'milestone': label})
+        for threshold in STREAK_MILESTONES:
+            if previous_longest < threshold <= self.longest_streak:
+                earned.append({'type': 'milestone', 'milestone': f'{threshold}-day workout streak'})
+
+        achieved_at = datetime.fromtimestamp(ts).isoformat()
+        for achievement in earned:
+            if achievement['type'] == 'milestone':
+                self.milestones.append({'milestone': achievement['milestone'], 'achieved_at': achieved_at})
+        return earned
+
+    def current_streak(self, today: int) -> int:
+        """Consecutive workout days ending today (or yesterday, if not yet trained today)."""
+        if self.last_day is None or self.last_day < today - 1:
+            return 0
+        return self.current_run
+
+    def next_milestone(self) -> Dict:
+        target = next((m for m in WORKOUT_COUNT_MILESTONES if m > self.total_workouts), None)
+        if target is None:
+            target = (self.total_workouts // 1000 + 1) * 1000
+        return {
+            'target': f'{target} workouts',
+            'current': self.total_workouts,
+            'remaining': target - self.total_workouts
+        }
+
+
+class AchievementIndex(EventProjection):
+    """
+    Per-user streaks, personal records and milestones, updated as workouts
+    are logged so achievement questions never scan the history.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._users: Dict[str, UserAchievements] = {}
+        self._lock = threading.Lock()
+
+    def _apply(self, event: Dict) -> List[Dict]:
+        if event.get('type') != 'workout':
+            return []
+        exercise = str(event.get('exercise') or '').strip().lower()
+        with self._lock:
+            user = self._users.get(event['user_id'])
+            if user is None:
+                user = self._users[event['user_id']] = UserAchievements()
+            return user.record_workout(exercise, int(event.get('duration') or 0),
+                                       int(event.get('calories') or 0), event['ts'])
+
+    def summary(self, user_id: str, today: Optional[date] = None) -> Dict:
+        """
+        Streaks, next milestone and milestone history for a user.
+
+        Args:
+            user_id: User to look up
+            today: Reference day for the current streak (defaults to the local date)
+
+        Returns:
+            Dictionary with streaks, next_milestone and milestones_achieved
+        """
+        today_ordinal = (today or date.today()).toordinal()
+        with self._lock:
+            user = self._users.get(user_id) or UserAchievements()
+            return {
+                'total_workouts': user.total_workouts,
+                'current_streak': user.current_streak(today_ordinal),
+                'longest_streak': user.longest_streak,
+                'next_milestone': user.next_milestone(),
+                'milestones_achieved': list(user.milestones)
+            }
+
+    def personal_records(self, user_id: str, exercise: Optional[str] = None) -> Dict[str, Dict]:
+        """Best duration and calories per exercise (optionally a single exercise)."""
+        with self._lock:
+            user = self._users.get(user_id)
+            if user is None:
+                return {}
+            if exercise is not None:
+                key = exercise.strip().lower()
+                record = user.records.get(key)
+                return {key: record.to_dict()} if record else {}
+            return {name: record.to_dict() for name, record in user.records.items()}
+
+
+_default_index: Optional[AchievementIndex] = None
+_default_index_lock = threading.Lock()
+
+
+def get_achievement_index() -> AchievementIndex:
+    """Return the process-wide achievement index, replaying the event store on first use."""
+    global _default_index
+    if _default_index is None:
+        with _default_index_lock:
+            if _default_index is None:
+                _default_index = AchievementIndex.from_store(get_event_store())
+    return _default_index
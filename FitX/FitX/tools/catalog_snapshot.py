@@ -0,0 +1,256 @@
+"""
+FitX Catalog Snapshot - Versioned binary product catalog opened with mmap
+
+A snapshot holds everything ProductCatalog.search needs as fixed-width
+columns (kind codes, ratings, per-kind posting doc ids and BM25 impacts,
+term and label offset tables) plus a heap of UTF-8 strings (sorted index
+terms and one compact JSON record per product). Opening one maps the file read-only
+and builds no per-product objects: terms are found by binary search over
+the mapped tables and product records are decoded only for the results a
+query returns. Every worker on a host therefore shares the same page-cache
+pages, and startup cost does not grow with the catalog.
+
+Build a snapshot from JSON Lines or CSV (from the FitX directory):
+    python -m FitX.tools.catalog_snapshot products.jsonl products.fxcat
+"""
+
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterable, Tuple
+
+
+MAGIC = b'FXCATSNP'
+FORMAT_VERSION = 2  # 2: postings keyed per product kind
+SNAPSHOT_SUFFIX = '.fxcat'
+
+_HEADER = struct.Struct('<8sII')    # magic, format version, section count
+_SECTION = struct.Struct('<16sQQ')  # name, offset, length
+_ALIGN = 8
+
+
+def _term_table(entries: Iterable[Tuple[str, Tuple[array, ...]]], typecodes: Tuple[str, ...]):
+    """Sorted key heap + offsets, and concatenated value columns + offsets."""
+    key_offsets, keys = array('I', [0]), bytearray()
+    value_offsets = array('I', [0])
+    values = tuple(array(typecode) for typecode in typecodes)
+    for key, columns in sorted(((key.encode('utf-8'), columns) for key, columns in entries),
+                               key=lambda entry: entry[0]):
+        keys += key
+        key_offsets.append(len(keys))
+        for target, column in zip(values, columns):
+            target.extend(column)
+        value_offsets.append(len(values[0]))
+    return key_offsets, bytes(keys), value_offsets, values
+
+
+def write_snapshot(catalog, path: str) -> Dict:
+    """
+    Write a ProductCatalog to ``path`` as a binary snapshot.
+
+    The file is written next to ``path`` and renamed into place, so
+    processes that already mapped the old snapshot keep a consistent view.
+
+    Returns:
+        Dictionary with the product, term and byte counts written
+    """
+    products = catalog.products
+    record_offsets, records = array('Q', [0]), bytearray()
+    for product in products:
+        records += json.dumps(product, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        record_offsets.append(len(records))
+
+    term_offsets, terms, posting_offsets, (posting_ids, posting_impacts) = _term_table(
+        catalog._postings.items(), ('I', 'f'))
+    label_offsets, labels, label_id_offsets, (label_ids,) = _term_table(
+        ((token, (array('I', sorted(docs)),)) for token, docs in catalog._label_docs.items()), ('I',))
+
+    meta = {
+        'format_version': FORMAT_VERSION,
+        'byteorder': sys.byteorder,
+        'products': len(products),
+        'terms': len(catalog._postings),
+        'kinds': sorted(catalog._kind_codes, key=catalog._kind_codes.get),
+        'avg_doc_length': catalog.avg_doc_length
+    }
+    sections = [
+        ('meta', json.dumps(meta).encode('utf-8')),
+        ('kind', catalog._kinds),
+        ('rating', catalog._ratings),
+        ('record_offsets', record_offsets),
+        ('records', bytes(records)),
+        ('term_offsets', term_offsets),
+        ('terms', terms),
+        ('posting_offsets', posting_offsets),
+        ('posting_ids', posting_ids),
+        ('posting_impacts', posting_impacts),
+        ('label_offsets', label_offsets),
+        ('labels', labels),
+        ('label_id_offsets', label_id_offsets),
+        ('label_ids', label_ids)
+    ]
+
+    offset = _HEADER.size + _SECTION.size * len(sections)
+    table = []
+    for name, data in sections:
+        offset += -offset % _ALIGN
+        size = len(memoryview(data).cast('B'))
+        table.append((name, offset, size))
+        offset += size
+
+    tmp_path = f'{path}.tmp{os.getpid()}'
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(sections)))
+            for name, start, size in table:
+                f.write(_SECTION.pack(name.encode('ascii'), start, size))
+            for (_, data), (_, start, _) in zip(sections, table):
+                f.write(b'\0' * (start - f.tell()))
+                f.write(memoryview(data).cast('B'))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return {'path': path, 'products': meta['products'], 'terms': meta['terms'], 'bytes': offset}
+
+
+class SortedIds:
+    """Read-only sorted doc-id column supporting ``in`` by binary search."""
+
+    __slots__ = ('ids',)
+
+    def __init__(self, ids: memoryview):
+        self.ids = ids
+
+    def __contains__(self, doc_id: int) -> bool:
+        i = bisect_left(self.ids, doc_id)
+        return i < len(self.ids) and self.ids[i] == doc_id
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __iter__(self):
+        return iter(self.ids)
+
+
+class TermTable:
+    """Mapping-like lookup from a term to its slice of one or more mapped columns."""
+
+    def __init__(self, key_offsets: memoryview, keys: memoryview, value_offsets: memoryview,
+                 values: Tuple[memoryview, ...], wrap=tuple):
+        self.key_offsets = key_offsets
+        self.keys = keys
+        self.value_offsets = value_offsets
+        self.values = values
+        self.wrap = wrap
+
+    def _find(self, term: str) -> int:
+        key = term.encode('utf-8')
+        offsets, keys = self.key_offsets, self.keys
+        lo, hi = 0, len(offsets) - 1
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if keys[offsets[mid]:offsets[mid + 1]].tobytes() < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(offsets) - 1 and keys[offsets[lo]:offsets[lo + 1]].tobytes() == key:
+            return lo
+        return -1
+
+    def get(self, term: str, default=None):
+        i = self._find(term)
+        if i < 0:
+            return default
+        start, end = self.value_offsets[i], self.value_offsets[i + 1]
+        return self.wrap(column[start:end] for column in self.values)
+
+    def __getitem__(self, term: str):
+        value = self.get(term)
+        if value is None:
+            raise KeyError(term)
+        return value
+
+    def __contains__(self, term: str) -> bool:
+        return self._find(term) >= 0
+
+    def __len__(self) -> int:
+        return len(self.key_offsets) - 1
+
+
+class ProductRecords:
+    """Sequence of product dicts decoded on access from the mapped record heap."""
+
+    def __init__(self, offsets: memoryview, records: memoryview):
+        self.offsets = offsets
+        self.records = records
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, doc_id: int) -> Dict:
+        if not 0 <= doc_id < len(self):
+            raise IndexError(doc_id)
+        return json.loads(self.records[self.offsets[doc_id]:self.offsets[doc_id + 1]].tobytes())
+
+
+def map_snapshot(path: str) -> Dict:
+    """
+    Map a snapshot read-only and return zero-copy views over its sections.
+
+    Raises:
+        ValueError: If the file is not a snapshot of a supported version
+                    or was built on a machine with different byte order
+    """
+    with open(path, 'rb') as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    buffer = memoryview(mapped)
+    if len(buffer) < _HEADER.size:
+        raise ValueError(f'{path} is not a FitX catalog snapshot')
+    magic, version, count = _HEADER.unpack_from(buffer)
+    if magic != MAGIC:
+        raise ValueError(f'{path} is not a FitX catalog snapshot')
+    if version != FORMAT_VERSION:
+        raise ValueError(f'{path} has snapshot format {version}, expected {FORMAT_VERSION}')
+
+    sections = {}
+    for i in range(count):
+        name, start, size = _SECTION.unpack_from(buffer, _HEADER.size + i * _SECTION.size)
+        sections[name.rstrip(b'\0').decode('ascii')] = buffer[start:start + size]
+    meta = json.loads(sections['meta'].tobytes())
+    if meta['byteorder'] != sys.byteorder:
+        raise ValueError(f'{path} was built on a {meta["byteorder"]}-endian machine')
+
+    return {
+        'mmap': mapped,
+        'meta': meta,
+        'products': ProductRecords(sections['record_offsets'].cast('Q'), sections['records']),
+        'kinds': sections['kind'],
+        'kind_codes': {kind: code for code, kind in enumerate(meta['kinds'])},
+        'ratings': sections['rating'].cast('f'),
+        'postings': TermTable(sections['term_offsets'].cast('I'), sections['terms'],
+                              sections['posting_offsets'].cast('I'),
+                              (sections['posting_ids'].cast('I'), sections['posting_impacts'].cast('f'))),
+        'label_docs': TermTable(sections['label_offsets'].cast('I'), sections['labels'],
+                                sections['label_id_offsets'].cast('I'), (sections['label_ids'].cast('I'),),
+                                wrap=lambda columns: SortedIds(next(columns)))
+    }
+
+
+if __name__ == "__main__":
+    from .product_catalog import ProductCatalog
+
+    parser = argparse.ArgumentParser(description='Build a FitX catalog snapshot from JSONL or CSV')
+    parser.add_argument('source', help='Product catalog (.jsonl, .jsonl.gz or .csv)')
+    parser.add_argument('output', help=f'Snapshot path (conventionally *{SNAPSHOT_SUFFIX})')
+    args = parser.parse_args()
+
+    print(json.dumps(write_snapshot(ProductCatalog.load(args.source), args.output), indent=2))
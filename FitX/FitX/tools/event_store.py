@@ -0,0 +1,380 @@
+"""
+FitX Event Store - Append-only, segmented log of workout and meal events
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+from typing import Dict, Iterator, List, Optional
+
+
+SEGMENT_PREFIX = 'segment-'
+SEGMENT_SUFFIX = '.log'
+DEFAULT_SEGMENT_MAX_BYTES = 64 * 1024 * 1024
+# Recovery reads segments backwards in blocks of this size
+TAIL_SCAN_BYTES = 64 * 1024
+DEFAULT_SYNC_TIMEOUT = 30.0
+
+
+def _frame(seq: int, body: bytes) -> bytes:
+    """Splice a sequence number in front of a pre-encoded JSON object."""
+    return b'{"seq":%d' % seq + (b',' + body[1:] if len(body) > 2 else b'}') + b'\n'
+
+
+class EventStore:
+    """
+    Append-only event log split into numbered segment files.
+
+    Appends are encoded into an in-memory write-ahead buffer and written by
+    a background flusher that fsyncs once per batch (group commit), so a
+    burst of logging calls from many sessions costs one write + fsync per
+    batch instead of one per event. Each line is a JSON record carrying a
+    monotonically increasing ``seq``.
+
+    If writing fails (disk full, EIO) the batch is kept and retried, and
+    callers waiting for durability get the write error instead of blocking.
+
+    Only one process should write to a given directory at a time.
+    """
+
+    def __init__(self, directory: str,
+                 segment_max_bytes: int = DEFAULT_SEGMENT_MAX_BYTES,
+                 flush_interval: float = 0.05,
+                 flush_batch_size: int = 1024,
+                 sync_timeout: float = DEFAULT_SYNC_TIMEOUT):
+        self.directory = directory
+        self.segment_max_bytes = segment_max_bytes
+        self.flush_interval = flush_interval
+        self.flush_batch_size = flush_batch_size
+        self.sync_timeout = sync_timeout
+        self.last_error: Optional[BaseException] = None
+        self._failures = 0
+
+        os.makedirs(directory, exist_ok=True)
+        self._cond = threading.Condition()
+        self._buffer: List[bytes] = []
+        self._sync_waiters = 0
+        self._closed = False
+
+        self._segment_index, last_seq = self._recover()
+        self._next_seq = last_seq + 1
+        self._durable_seq = last_seq
+        self._file = open(self._segment_path(self._segment_index), 'ab')
+        self._file_size = self._file.tell()
+
+        self._flusher = threading.Thread(target=self._run, name='fitx-event-flusher', daemon=True)
+        self._flusher.start()
+
+    # ---------------------------------------------------------------- writes
+
+    def append(self, event: Dict, sync: bool = False) -> int:
+        """
+        Append an event and return its sequence number.
+
+        Args:
+            event: JSON-serializable event payload
+            sync: Block until the event has been fsynced to disk
+
+        Returns:
+            Sequence number assigned to the event
+
+        Raises:
+            OSError: With ``sync``, the write failed (the event stays buffered and is retried)
+            TimeoutError: With ``sync``, the event was not durable within ``sync_timeout``
+        """
+        body = json.dumps(event, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+        with self._cond:
+            if self._closed:
+                raise RuntimeError('EventStore is closed')
+            seq = self._next_seq
+            self._next_seq += 1
+            self._buffer.append(_frame(seq, body))
+            if len(self._buffer) >= self.flush_batch_size:
+                self._cond.notify_all()
+            if sync:
+                self._wait_durable(seq)
+        return seq
+
+    def append_many(self, events: List[Dict], sync: bool = False) -> List[int]:
+        """
+        Append a batch of events under a single lock acquisition.
+
+        Args:
+            events: JSON-serializable event payloads, in order
+            sync: Block until the whole batch has been fsynced to disk
+
+        Returns:
+            Sequence numbers assigned to the events, in order
+
+        Raises:
+            OSError: With ``sync``, the write failed (the events stay buffered and are retried)
+            TimeoutError: With ``sync``, the batch was not durable within ``sync_timeout``
+        """
+        bodies = [json.dumps(event, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+                  for event in events]
+        with self._cond:
+            if self._closed:
+                raise RuntimeError('EventStore is closed')
+            first_seq = self._next_seq
+            self._next_seq += len(bodies)
+            self._buffer.extend(_frame(seq, body) for seq, body in enumerate(bodies, first_seq))
+            if len(self._buffer) >= self.flush_batch_size:
+                self._cond.notify_all()
+            if sync and bodies:
+                self._wait_durable(self._next_seq - 1)
+        return list(range(first_seq, first_seq + len(bodies)))
+
+    def flush(self) -> int:
+        """
+        Block until every event appended so far is durable on disk.
+
+        Returns:
+            Sequence number of the last durable event
+
+        Raises:
+            OSError: The write failed
+            TimeoutError: Not durable within ``sync_timeout``
+        """
+        with self._cond:
+            seq = self._next_seq - 1
+            self._wait_durable(seq)
+        return seq
+
+    def close(self) -> None:
+        """Flush outstanding events and stop the background flusher."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._flusher.join()
+        self._file.close()
+
+    def _wait_durable(self, seq: int) -> None:
+        # Caller holds self._cond
+        failures = self._failures
+        deadline = time.monotonic() + self.sync_timeout
+        self._sync_waiters += 1
+        try:
+            while self._durable_seq < seq:
+                if self._failures != failures or not self._flusher.is_alive():
+                    if self.last_error is not None:
+                        raise self.last_error
+                    if not self._flusher.is_alive():
+                        raise RuntimeError('EventStore flusher stopped before the events were written')
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f'events up to seq {seq} not durable after {self.sync_timeout}s')
+                self._cond.notify_all()
+                self._cond.wait(min(self.flush_interval, remaining))
+        finally:
+            self._sync_waiters -= 1
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                if (len(self._buffer) < self.flush_batch_size and not self._closed
+                        and not self._sync_waiters):
+                    self._cond.wait(self.flush_interval)
+                if not self._buffer:
+                    if self._closed:
+                        return
+                    continue
+                batch, self._buffer = self._buffer, []
+                batch_last_seq = self._next_seq - 1
+
+            try:
+                self._write_batch(batch)
+            except OSError as e:
+                # Keep the batch at the head of the buffer and retry next round
+                with self._cond:
+                    self.last_error = e
+                    self._failures += 1
+                    self._buffer[:0] = batch
+                    self._cond.notify_all()
+                    if self._closed:
+                        return
+                    self._cond.wait(self.flush_interval)
+                continue
+
+            with self._cond:
+                self._durable_seq = batch_last_seq
+                self.last_error = None
+                self._cond.notify_all()
+
+    def _write_batch(self, batch: List[bytes]) -> None:
+        data = b''.join(batch)
+        if self._file_size and self._file_size + len(data) > self.segment_max_bytes:
+            self._rotate()
+        self._file.write(data)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file_size += len(data)
+
+    def _rotate(self) -> None:
+        self._file.close()
+        self._segment_index += 1
+        self._file = open(self._segment_path(self._segment_index), 'ab')
+        self._file_size = 0
+
+    # ----------------------------------------------------------------- reads
+
+    def iter_events(self, after_seq: int = 0) -> Iterator[Dict]:
+        """
+        Iterate over stored events in append order.
+
+        Args:
+            after_seq: Only yield events with a sequence number above this
+
+        Returns:
+            Iterator of event dictionaries (including their ``seq``)
+        """
+        self.flush()
+        for index in self._segment_indexes():
+            with open(self._segment_path(index), 'rb') as f:
+                for line in f:
+                    try:
+                        event = json.loads(line)
+                    except ValueError:
+                        continue
+                    if event.get('seq', 0) > after_seq:
+                        yield event
+
+    # -------------------------------------------------------------- segments
+
+    def _segment_path(self, index: int) -> str:
+        return os.path.join(self.directory, f'{SEGMENT_PREFIX}{index:06d}{SEGMENT_SUFFIX}')
+
+    def _segment_indexes(self) -> List[int]:
+        indexes = []
+        for name in os.listdir(self.directory):
+            if name.startswith(SEGMENT_PREFIX) and name.endswith(SEGMENT_SUFFIX):
+                try:
+                    indexes.append(int(name[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)]))
+                except ValueError:
+                    continue
+        return sorted(indexes)
+
+    def _recover(self) -> tuple:
+        """Drop a torn trailing record and find the last written sequence number."""
+        indexes = self._segment_indexes()
+        if not indexes:
+            return 1, 0
+
+        for index in reversed(indexes):
+            path = self._segment_path(index)
+            with open(path, 'r+b') as f:
+                size = f.seek(0, os.SEEK_END)
+                if size == 0:
+                    continue
+                end = _complete_end(f, size)
+                if end < size:
+                    f.truncate(end)
+                for line in _lines_backwards(f, end):
+                    try:
+                        return indexes[-1], int(json.loads(line)['seq'])
+                    except (ValueError, KeyError, TypeError):
+                        continue
+        return indexes[-1], 0
+
+
+def _complete_end(f, size: int) -> int:
+    """Offset just past the last newline (0 if none): where a torn trailing record starts"""
+    end = size
+    while end > 0:
+        start = max(0, end - TAIL_SCAN_BYTES)
+        f.seek(start)
+        newline = f.read(end - start).rfind(b'\n')
+        if newline >= 0:
+            return start + newline + 1
+        end = start
+    return 0
+
+
+def _lines_backwards(f, end: int) -> Iterator[bytes]:
+    """Non-empty lines of the file before ``end``, last line first"""
+    pending = b''
+    while end > 0:
+        start = max(0, end - TAIL_SCAN_BYTES)
+        f.seek(start)
+        lines = (f.read(end - start) + pending).split(b'\n')
+        end = start
+        # The first piece may continue in the previous block
+        pending = lines[0]
+        for line in reversed(lines[1:]):
+            if line:
+                yield line
+    if pending:
+        yield pending
+
+
+# ==================== PROJECTIONS ====================
+
+class EventProjection:
+    """
+    In-memory view derived from the event log and kept current on write.
+
+    A projection is seeded by replaying the store up to a sequence watermark.
+    Events above the watermark are applied by whoever appended them, so
+    events logged concurrently with the replay are neither lost nor counted
+    twice. Subclasses implement ``_apply``.
+
+    An event the projection cannot fold (e.g. a timestamp outside the
+    calendar range) is skipped and counted in ``skipped``, both live and on
+    replay, so one bad stored event cannot make every later replay fail and
+    every projection skips the same events.
+    """
+
+    def __init__(self):
+        self.replayed_through = 0
+        self.skipped = 0
+
+    @classmethod
+    def from_store(cls, store: EventStore, *args, **kwargs) -> 'EventProjection':
+        watermark = store.flush()
+        projection = cls(*args, **kwargs)
+        for event in store.iter_events():
+            if event['seq'] <= watermark:
+                projection._apply_safely(event)
+        projection.replayed_through = watermark
+        return projection
+
+    def apply(self, event: Dict):
+        """Fold a stored event (carrying its ``seq``) into the projection."""
+        if event.get('seq', 0) <= self.replayed_through:
+            return None
+        return self._apply_safely(event)
+
+    def _apply_safely(self, event: Dict):
+        try:
+            return self._apply(event)
+        except (KeyError, TypeError, ValueError, OverflowError, OSError):
+            self.skipped += 1
+            return None
+
+    def _apply(self, event: Dict):
+        raise NotImplementedError
+
+
+# ==================== DEFAULT STORE ====================
+
+_default_store: Optional[EventStore] = None
+_default_store_lock = threading.Lock()
+
+
+def default_data_dir() -> str:
+    """Directory holding FitX tracking data (override with FITX_DATA_DIR)."""
+    return os.getenv('FITX_DATA_DIR') or os.path.join(os.path.expanduser('~'), '.fitx')
+
+
+def get_event_store() -> EventStore:
+    """Return the process-wide event store, opening it on first use."""
+    global _default_store
+    if _default_store is None:
+        with _default_store_lock:
+            if _default_store is None:
+                _default_store = EventStore(os.path.join(default_data_dir(), 'events'))
+                atexit.register(_default_store.close)
+    return _default_store
@@ -0,0 +1,126 @@
+"""
+FitX History Import - Stream workout and meal history from CSV or JSONL files
+"""
+
+import argparse
+import csv
+import json
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .tracking_tools import (
+    BULK_BATCH_SIZE,
+    DEFAULT_USER_ID,
+    MAX_REPORTED_ERRORS,
+    record_events,
+    validate_meal_rows,
+    validate_workout_rows
+)
+
+
+VALIDATORS = {
+    'workout': validate_workout_rows,
+    'meal': validate_meal_rows
+}
+
+
+def _iter_rows(path: str) -> Iterator[Tuple[int, Optional[Dict], Optional[str]]]:
+    """Yield (line number, row, parse error) from a CSV or JSONL file."""
+    with open(path, newline='', encoding='utf-8') as f:
+        if path.lower().endswith(('.jsonl', '.ndjson', '.json')):
+            for line_no, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                except ValueError as e:
+                    yield line_no, None, f'invalid JSON: {e}'
+                    continue
+                if isinstance(row, dict):
+                    yield line_no, row, None
+                else:
+                    yield line_no, None, 'expected a JSON object'
+        else:
+            reader = csv.DictReader(f)
+            for row in reader:
+                yield reader.line_num, row, None
+
+
+def import_history(path: str, user_id: str = DEFAULT_USER_ID, kind: Optional[str] = None,
+                   batch_size: int = BULK_BATCH_SIZE) -> Dict:
+    """
+    Import a workout/meal history file in constant memory.
+
+    Rows are buffered per type and validated and written in batches of
+    ``batch_size``; invalid rows are reported by line number and skipped.
+
+    Args:
+        path: CSV (with a header row) or JSONL file
+        user_id: User the history belongs to
+        kind: 'workout' or 'meal' for single-type files; otherwise each row
+              needs a 'type' column
+        batch_size: Rows per validation and store batch
+
+    Returns:
+        Dictionary with per-type import counts and per-line errors
+    """
+    pending: Dict[str, List[Tuple[int, Dict]]] = {'workout': [], 'meal': []}
+    logged = {'workout': 0, 'meal': 0}
+    errors: List[Dict] = []
+    error_count = 0
+    rows_read = 0
+
+    def report(line_no: int, message: str) -> None:
+        nonlocal error_count
+        error_count += 1
+        if len(errors) < MAX_REPORTED_ERRORS:
+            errors.append({'line': line_no, 'error': message})
+
+    def flush(row_type: str) -> None:
+        batch = pending[row_type]
+        if not batch:
+            return
+        events, batch_errors = VALIDATORS[row_type]([row for _, row in batch], user_id)
+        if events:
+            record_events(events)
+        logged[row_type] += len(events)
+        for error in batch_errors:
+            report(batch[error['row']][0], error['error'])
+        pending[row_type] = []
+
+    for line_no, row, parse_error in _iter_rows(path):
+        rows_read += 1
+        if parse_error:
+            report(line_no, parse_error)
+            continue
+        row_type = (kind or str(row.get('type') or '')).strip().lower()
+        if row_type not in pending:
+            report(line_no, f'unknown entry type: {row.get("type")!r}')
+            continue
+        pending[row_type].append((line_no, row))
+        if len(pending[row_type]) >= batch_size:
+            flush(row_type)
+
+    for row_type in pending:
+        flush(row_type)
+    errors.sort(key=lambda e: e['line'])
+
+    return {
+        'status': 'completed' if not error_count else 'completed_with_errors',
+        'source': path,
+        'rows_read': rows_read,
+        'workouts_logged': logged['workout'],
+        'meals_logged': logged['meal'],
+        'rows_rejected': error_count,
+        'errors': errors,
+        'errors_truncated': error_count > len(errors)
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Import workout/meal history into FitX')
+    parser.add_argument('path', help='CSV or JSONL history file')
+    parser.add_argument('--user', default=DEFAULT_USER_ID, help='User id to import for')
+    parser.add_argument('--type', dest='kind', choices=sorted(VALIDATORS), help='Entry type for single-type files')
+    args = parser.parse_args()
+
+    print(json.dumps(import_history(args.path, args.user, args.kind), indent=2))
@@ -0,0 +1,268 @@
+"""
+FitX Instrumentation - Call counts, latency percentiles, payload sizes and errors
+
+One process-wide registry records every instrumented call under a kind
+('tool', 'vendor', 'platform') and a name ('log_workout', 'amazon', ...).
+Latencies go into fixed log-scale histograms, so p50/p95/p99 cost O(1)
+memory per series. Metrics are off unless enabled; a disabled decorator
+adds one flag check per call.
+
+Environment:
+    FITX_METRICS=1             enable recording
+    FITX_METRICS_PORT=9464     serve JSON at http://127.0.0.1:<port>/metrics
+                               (a bad value or busy port only logs a warning)
+    FITX_METRICS_DUMP=path     write a JSON snapshot to path at exit
+"""
+
+import atexit
+import functools
+import inspect
+import json
+import logging
+import math
+import os
+import threading
+import time
+from array import array
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Optional
+
+
+# Log-scale latency buckets: 8 per doubling (~9% resolution) from 10us to ~170s
+_MIN_SECONDS = 1e-5
+_BUCKETS_PER_DOUBLING = 8
+_BUCKET_COUNT = 8 * 24
+
+
+def _bucket(seconds: float) -> int:
+    if seconds <= _MIN_SECONDS:
+        return 0
+    return min(int(math.log2(seconds / _MIN_SECONDS) * _BUCKETS_PER_DOUBLING) + 1, _BUCKET_COUNT - 1)
+
+
+def _bucket_upper(index: int) -> float:
+    return _MIN_SECONDS * 2 ** (index / _BUCKETS_PER_DOUBLING)
+
+
+class CallStats:
+    """Counters and latency histogram for one instrumented operation."""
+
+    __slots__ = ('calls', 'errors', 'total_seconds', 'max_seconds', 'buckets',
+                 'payload_calls', 'payload_bytes', 'max_payload_bytes')
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.buckets = array('Q', bytes(8 * _BUCKET_COUNT))
+        self.payload_calls = 0
+        self.payload_bytes = 0
+        self.max_payload_bytes = 0
+
+    def record(self, seconds: float, payload_bytes: Optional[int], error: bool) -> None:
+        self.calls += 1
+        self.errors += error
+        self.total_seconds += seconds
+        if seconds > self.max_seconds:
+            self.max_seconds = seconds
+        self.buckets[_bucket(seconds)] += 1
+        if payload_bytes is not None:
+            self.payload_calls += 1
+            self.payload_bytes += payload_bytes
+            if payload_bytes > self.max_payload_bytes:
+                self.max_payload_bytes = payload_bytes
+
+    def percentile(self, q: float) -> float:
+        """Approximate latency percentile in seconds (bucket upper bound, capped at the max)"""
+        if not self.calls:
+            return 0.0
+        rank = q * self.calls
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank:
+                return min(_bucket_upper(index), self.max_seconds)
+        return self.max_seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        summary = {
+            'calls': self.calls,
+            'errors': self.errors,
+            'error_rate': round(self.errors / self.calls, 4) if self.calls else 0.0,
+            'mean_ms': round(self.total_seconds / self.calls * 1000, 3) if self.calls else 0.0,
+            'p50_ms': round(self.percentile(0.50) * 1000, 3),
+            'p95_ms': round(self.percentile(0.95) * 1000, 3),
+            'p99_ms': round(self.percentile(0.99) * 1000, 3),
+            'max_ms': round(self.max_seconds * 1000, 3)
+        }
+        if self.payload_calls:
+            summary['payload_bytes'] = {
+                'mean': round(self.payload_bytes / self.payload_calls),
+                'max': self.max_payload_bytes,
+                'total': self.payload_bytes
+            }
+        return summary
+
+
+class MetricsRegistry:
+    """Thread-safe registry of CallStats keyed by (kind, name)."""
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.started = time.time()
+        self._stats: Dict[tuple, CallStats] = {}
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def record(self, kind: str, name: str, seconds: float,
+               payload_bytes: Optional[int] = None, error: bool = False) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            stats = self._stats.get((kind, name))
+            if stats is None:
+                stats = self._stats[(kind, name)] = CallStats()
+            stats.record(seconds, payload_bytes, error)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """All series grouped by kind, e.g. {'tool': {'log_workout': {...}}, 'vendor': {...}}"""
+        with self._lock:
+            grouped: Dict[str, Dict[str, Any]] = {}
+            for (kind, name), stats in sorted(self._stats.items()):
+                grouped.setdefault(kind, {})[name] = stats.to_dict()
+        return {'enabled': self.enabled, 'uptime_s': round(time.time() - self.started, 1), **grouped}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+            self.started = time.time()
+
+    def dump(self, path: str) -> None:
+        """Write a JSON snapshot atomically"""
+        tmp_path = f'{path}.tmp{os.getpid()}'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.snapshot(), f, indent=2)
+        os.replace(tmp_path, path)
+
+    def serve(self, port: int, host: str = '127.0.0.1') -> int:
+        """Serve the snapshot as JSON at /metrics from a daemon thread; returns the bound port"""
+        if self._server is not None:
+            return self._server.server_address[1]
+        registry = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] not in ('/metrics', '/'):
+                    self.send_error(404)
+                    return
+                body = json.dumps(registry.snapshot()).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), _Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name='fitx-metrics', daemon=True).start()
+        return self._server.server_address[1]
+
+
+def _json_default(value: Any) -> Any:
+    # Records such as product_record.Product serialize through to_dict()
+    to_dict = getattr(value, 'to_dict', None)
+    return to_dict() if callable(to_dict) else str(value)
+
+
+def payload_size(result: Any) -> Optional[int]:
+    """Size in bytes of a result serialized as JSON (None if it cannot be)"""
+    try:
+        return len(json.dumps(result, default=_json_default))
+    except (TypeError, ValueError):
+        return None
+
+
+def instrument(fn: Callable = None, *, kind: str = 'tool', name: Optional[str] = None):
+    """
+    Decorator recording latency, errors and result size of a function.
+
+    The wrapper keeps the wrapped signature and docstring (ADK reads both
+    to build the tool declaration). Works for sync and async functions.
+
+    Example:
+        >>> @instrument
+        ... def log_workout(exercise: str, duration: int, ...) -> Dict: ...
+    """
+    if fn is None:
+        return functools.partial(instrument, kind=kind, name=name)
+    series = name or fn.__name__
+
+    if inspect.iscoroutinefunction(fn):
+        @functools.wraps(fn)
+        async def async_wrapper(*args, **kwargs):
+            if not _registry.enabled:
+                return await fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                result = await fn(*args, **kwargs)
+            except BaseException:
+                _registry.record(kind, series, time.perf_counter() - start, error=True)
+                raise
+            _registry.record(kind, series, time.perf_counter() - start, payload_size(result),
+                             isinstance(result, dict) and 'error' in result)
+            return result
+        return async_wrapper
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if not _registry.enabled:
+            return fn(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException:
+            _registry.record(kind, series, time.perf_counter() - start, error=True)
+            raise
+        _registry.record(kind, series, time.perf_counter() - start, payload_size(result),
+                         isinstance(result, dict) and 'error' in result)
+        return result
+    return wrapper
+
+
+def _env_flag(name: str) -> bool:
+    return os.getenv(name, '').lower() in ('1', 'true', 'yes')
+
+
+_registry = MetricsRegistry(enabled=bool(_env_flag('FITX_METRICS') or os.getenv('FITX_METRICS_PORT')
+                                         or os.getenv('FITX_METRICS_DUMP')))
+
+
+def _serve_from_env() -> None:
+    # Observability must never stop the agent from importing: with several
+    # workers only the first one can bind the port
+    value = os.environ['FITX_METRICS_PORT']
+    try:
+        _registry.serve(int(value))
+    except (OSError, ValueError) as e:
+        logging.getLogger(__name__).warning('FitX metrics server not started on FITX_METRICS_PORT=%r: %s', value, e)
+
+
+if os.getenv('FITX_METRICS_PORT'):
+    _serve_from_env()
+if os.getenv('FITX_METRICS_DUMP'):
+    atexit.register(_registry.dump, os.environ['FITX_METRICS_DUMP'])
+
+
+def get_metrics() -> MetricsRegistry:
+    """Return the process-wide metrics registry"""
+    return _registry
+
+
+def enable_metrics(enabled: bool = True) -> MetricsRegistry:
+    """Turn recording on or off at runtime"""
+    _registry.enabled = enabled
+    return _registry
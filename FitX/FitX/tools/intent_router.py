@@ -0,0 +1,218 @@
+"""
+FitX Intent Router - Deterministic fast-path routing for obvious requests
+
+Keyword/regex rules plus a small linear model over hashed word n-grams
+classify a user message into one of the orchestrator's specialists. When
+the decision is confident the orchestrator transfers (or, for logging
+requests the log parser understands, calls log_workout/log_meal) without
+asking the LLM to route first.
+"""
+
+import json
+import math
+import os
+import random
+import re
+import threading
+import zlib
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .log_parser import DEFAULT_BODY_WEIGHT_KG, parse_log
+
+
+DEFAULT_EXAMPLES_PATH = os.path.join(os.path.dirname(__file__), 'data', 'intent_examples.jsonl')
+
+LABELS = ('fitness_coach', 'nutrition_expert', 'medical_advisor', 'progress_tracker', 'shopping_assistant')
+
+HASH_BUCKETS = 2 ** 16
+RULE_CONFIDENCE = 0.95
+MODEL_THRESHOLD = 0.8
+MAX_FAST_PATH_WORDS = 40
+
+_WORD_RE = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+
+# Unambiguous vocabulary per specialist; more than one matching label means
+# a multi-part request, which is left to the orchestrator LLM
+RULES = (
+    ('medical_advisor', re.compile(
+        r'\b(pain|hurts?|injur(y|ed|ies)|sprain(ed)?|strain(ed)?|dizz(y|iness)|doctor|physio(therapist)?|'
+        r'surgery|blood pressure|diabet(es|ic)|asthma|pregnan(t|cy)|numb(ness)?|swollen|tendonitis)\b')),
+    ('shopping_assistant', re.compile(
+        r'\b(buy|purchase|place an order|order (some|a|an|more|new) \w+|order \w+( \w+)? online|'
+        r'price[sd]?|cheapest|deals?|discount|shop(ping)?|amazon|flipkart|myntra|'
+        r'blinkit|instamart|where (can|do) i (get|find))\b')),
+    ('progress_tracker', re.compile(
+        r'\b(log(ged)?|track(ed)? (my |a |the |today\'s )?(workouts?|meals?|calories|progress|food|'
+        r'breakfast|lunch|dinner|snacks?|runs?)|record(ed)? (my |a |this |today\'s )?(workouts?|runs?|'
+        r'meals?|session)|record \d+|my progress|progress (summary|report)|streak|achievements?|'
+        r'milestones?|personal (records?|bests?)|workout history)\b')),
+    ('nutrition_expert', re.compile(
+        r'\b(macros?|meal plan|diet( plan)?|calorie (deficit|surplus)|tdee|keto|intermittent fasting|'
+        r'protein intake|supplements?|creatine)\b')),
+    ('fitness_coach', re.compile(
+        r'\b(workout (plan|routine|program)|training (plan|program|split)|(push[ /-]pull[ /-]legs?|ppl|'
+        r'upper[ /-]lower|full[ -]body|bro|body ?part) split|sets and reps|how many (sets|reps)|'
+        r'rep (range|scheme)|hypertrophy|progressive overload|(squat|deadlift|bench) form|'
+        r'warm[ -]?up routine)\b'))
+)
+
+def _words(text: str) -> List[str]:
+    return _WORD_RE.findall(text.lower())
+
+
+def hashed_features(text: str, buckets: int = HASH_BUCKETS) -> List[int]:
+    """Bucket ids of word unigrams and bigrams (crc32, stable across processes)"""
+    words = _words(text)
+    grams = words + [f'{a} {b}' for a, b in zip(words, words[1:])]
+    return [zlib.crc32(gram.encode('utf-8')) % buckets for gram in grams]
+
+
+class RouteDecision:
+    """Routing outcome: transfer to ``agent`` or call ``tool`` with ``args``."""
+
+    __slots__ = ('agent', 'confidence', 'source', 'tool', 'args')
+
+    def __init__(self, agent: str, confidence: float, source: str,
+                 tool: Optional[str] = None, args: Optional[Dict] = None):
+        self.agent = agent
+        self.confidence = confidence
+        self.source = source
+        self.tool = tool
+        self.args = args
+
+    def to_dict(self) -> Dict:
+        return {'agent': self.agent, 'confidence': round(self.confidence, 3), 'source': self.source,
+                'tool': self.tool, 'args': self.args}
+
+    def __repr__(self) -> str:
+        return f'RouteDecision({self.to_dict()!r})'
+
+
+class HashedLinearModel:
+    """
+    Multinomial logistic regression over hashed n-gram features.
+
+    Weights are one dense float array per label; scoring a message costs a
+    few dozen array lookups. Training is plain SGD with a fixed seed, so
+    the same examples always produce the same model.
+    """
+
+    def __init__(self, labels: Tuple[str, ...] = LABELS, buckets: int = HASH_BUCKETS):
+        self.labels = labels
+        self.buckets = buckets
+        self.weights = [array('f', bytes(4 * buckets)) for _ in labels]
+        self.bias = [0.0] * len(labels)
+
+    def probabilities(self, text: str) -> List[float]:
+        return self._probabilities_for(hashed_features(text, self.buckets))
+
+    def predict(self, text: str) -> Tuple[str, float]:
+        probs = self.probabilities(text)
+        best = max(range(len(probs)), key=probs.__getitem__)
+        return self.labels[best], probs[best]
+
+    def fit(self, examples: Iterable[Tuple[str, str]], epochs: int = 30,
+            learning_rate: float = 0.5, seed: int = 0) -> 'HashedLinearModel':
+        index = {label: i for i, label in enumerate(self.labels)}
+        data = [(hashed_features(text, self.buckets), index[label]) for text, label in examples]
+        rng = random.Random(seed)
+        for _ in range(epochs):
+            rng.shuffle(data)
+            for features, target in data:
+                probs = self._probabilities_for(features)
+                for i, (weights, prob) in enumerate(zip(self.weights, probs)):
+                    step = learning_rate * ((1.0 if i == target else 0.0) - prob)
+                    self.bias[i] += step
+                    for f in features:
+                        weights[f] += step
+        return self
+
+    def _probabilities_for(self, features: List[int]) -> List[float]:
+        scores = [bias + sum(weights[f] for f in features) for weights, bias in zip(self.weights, self.bias)]
+        top = max(scores)
+        exps = [math.exp(score - top) for score in scores]
+        total = sum(exps)
+        return [e / total for e in exps]
+
+
+class IntentRouter:
+    """
+    Decide whether a message can skip the orchestrator LLM.
+
+    Exactly one matching rule routes with RULE_CONFIDENCE unless the model
+    confidently prefers another specialist; with no rule, the model must
+    reach ``threshold``. Several matching rules, or long messages, return
+    None so the LLM can coordinate.
+    """
+
+    def __init__(self, model: HashedLinearModel, threshold: float = MODEL_THRESHOLD):
+        self.model = model
+        self.threshold = threshold
+
+    @classmethod
+    def from_examples(cls, path: str = DEFAULT_EXAMPLES_PATH, **kwargs) -> 'IntentRouter':
+        with open(path, encoding='utf-8') as f:
+            examples = [json.loads(line) for line in f if line.strip()]
+        model = HashedLinearModel().fit((example['text'], example['label']) for example in examples)
+        return cls(model, **kwargs)
+
+    def route(self, text: str, body_weight_kg: float = DEFAULT_BODY_WEIGHT_KG) -> Optional[RouteDecision]:
+        """
+        Route a user message.
+
+        Messages are first run through the log parser; a complete workout
+        or meal report yields the log_workout/log_meal call to make
+        instead of a transfer.
+
+        Args:
+            text: The user's message
+            body_weight_kg: Used to estimate workout calories when not given
+
+        Returns:
+            RouteDecision for confident cases, otherwise None
+
+        Example:
+            >>> router.route("log 30 min run moderate 250 cal")
+            RouteDecision({'agent': 'progress_tracker', 'tool': 'log_workout', ...})
+        """
+        if not text or len(_words(text)) > MAX_FAST_PATH_WORDS:
+            return None
+        lowered = text.lower()
+        matched = {label for label, pattern in RULES if pattern.search(lowered)}
+        if len(matched) > 1:
+            return None
+
+        # A complete workout/meal report is a log request whatever the model thinks
+        parsed = parse_log(text, body_weight_kg) if matched <= {'progress_tracker'} else None
+        if parsed is not None and parsed.confident:
+            return RouteDecision('progress_tracker', RULE_CONFIDENCE, 'parser', parsed.tool, parsed.args)
+
+        predicted, probability = self.model.predict(text)
+        if matched:
+            agent = matched.pop()
+            if predicted != agent and probability >= self.threshold:
+                return None
+            decision = RouteDecision(agent, max(RULE_CONFIDENCE, probability if predicted == agent else 0.0),
+                                     'rule')
+        elif probability >= self.threshold:
+            decision = RouteDecision(predicted, probability, 'model')
+        else:
+            return None
+
+        return decision
+
+
+_default_router: Optional[IntentRouter] = None
+_default_router_lock = threading.Lock()
+
+
+def get_intent_router() -> IntentRouter:
+    """Return the process-wide router, trained on the bundled examples on first use"""
+    global _default_router
+    if _default_router is None:
+        with _default_router_lock:
+            if _default_router is None:
+                _default_router = IntentRouter.from_examples()
+    return _default_router
+
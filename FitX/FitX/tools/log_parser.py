@@ -0,0 +1,373 @@
+"""
+FitX Log Parser - Structured arguments for log_workout/log_meal from plain text
+
+Turns common logging utterances ("I ran for 30 minutes at moderate pace",
+"Had eggs and toast for breakfast") into tool arguments. Missing workout
+calories are estimated from MET values, missing meal calories from typical
+serving sizes; anything the parser cannot pin down is reported as missing
+so the caller can fall back to the LLM.
+"""
+
+import re
+from typing import Dict, List, Optional
+
+
+DEFAULT_BODY_WEIGHT_KG = 70.0
+
+# Above these a parsed value is more likely a typo or an outlier than a log
+MAX_WORKOUT_MINUTES = 600
+MAX_WORKOUT_CALORIES = 4000
+MAX_MEAL_CALORIES = 5000
+
+INTENSITIES = ('low', 'moderate', 'high', 'very_high')
+
+# Compendium of Physical Activities METs by intensity (low, moderate, high, very_high)
+MET_VALUES = {
+    'running': (6.0, 8.3, 9.8, 11.8),
+    'walking': (2.8, 3.5, 4.3, 5.0),
+    'cycling': (4.0, 6.8, 8.0, 10.0),
+    'swimming': (5.8, 7.0, 9.8, 10.0),
+    'rowing': (4.8, 7.0, 8.5, 12.0),
+    'hiit': (5.0, 7.0, 8.0, 10.0),
+    'cardio': (4.0, 6.0, 8.0, 10.0),
+    'strength training': (3.5, 5.0, 6.0, 8.0),
+    'yoga': (2.5, 3.0, 4.0, 4.0),
+    'pilates': (2.8, 3.0, 3.8, 4.5),
+    'stretching': (2.3, 2.3, 2.8, 2.8),
+    'dancing': (4.5, 5.5, 7.3, 7.8),
+    'sports': (4.0, 6.0, 8.0, 10.0)
+}
+DEFAULT_INTENSITY = {'yoga': 'low', 'stretching': 'low', 'walking': 'low'}
+
+EXERCISE_WORDS = {
+    'run': 'running', 'ran': 'running', 'running': 'running', 'jog': 'running', 'jogged': 'running',
+    'jogging': 'running', 'sprints': 'running', 'treadmill': 'running',
+    'walk': 'walking', 'walked': 'walking', 'walking': 'walking', 'hike': 'walking', 'hiked': 'walking',
+    'cycle': 'cycling', 'cycled': 'cycling', 'cycling': 'cycling', 'bike': 'cycling', 'biked': 'cycling',
+    'biking': 'cycling', 'spin': 'cycling', 'spinning': 'cycling',
+    'swim': 'swimming', 'swam': 'swimming', 'swimming': 'swimming', 'laps': 'swimming',
+    'row': 'rowing', 'rowed': 'rowing', 'rowing': 'rowing',
+    'hiit': 'hiit', 'circuit': 'hiit', 'crossfit': 'hiit', 'tabata': 'hiit',
+    'cardio': 'cardio', 'elliptical': 'cardio', 'zumba': 'dancing', 'dance': 'dancing', 'dancing': 'dancing',
+    'strength': 'strength training', 'weights': 'strength training', 'lifting': 'strength training',
+    'lifted': 'strength training', 'gym': 'strength training', 'deadlifts': 'strength training',
+    'squats': 'strength training', 'calisthenics': 'strength training',
+    'yoga': 'yoga', 'pilates': 'pilates', 'stretching': 'stretching', 'stretched': 'stretching',
+    'football': 'sports', 'soccer': 'sports', 'basketball': 'sports', 'tennis': 'sports',
+    'badminton': 'sports', 'cricket': 'sports'
+}
+
+INTENSITY_PATTERNS = (
+    ('very_high', re.compile(r'\b(very (high|hard|intense)|all[ -]out|max(imum)? effort|brutal|exhausting)\b')),
+    ('high', re.compile(r'\b(high|hard|intense|intensely|vigorous|heavy|fast|tough)\b')),
+    ('low', re.compile(r'\b(low|light|easy|gentle|slow|relaxed|leisurely|recovery)\b')),
+    ('moderate', re.compile(r'\b(moderate|moderately|medium|steady|normal|average)\b'))
+)
+
+MEAL_WORDS = {'breakfast': 'breakfast', 'brunch': 'lunch', 'lunch': 'lunch', 'dinner': 'dinner',
+              'supper': 'dinner', 'snack': 'snack', 'snacks': 'snack'}
+
+# Typical single-serving calories, keyed by singular item name
+SERVING_KCAL = {
+    'egg': 78, 'boiled egg': 78, 'omelette': 190, 'toast': 80, 'bread': 80, 'avocado': 160,
+    'banana': 105, 'apple': 95, 'orange': 62, 'fruit': 80, 'berries': 60,
+    'oats': 150, 'oatmeal': 150, 'porridge': 150, 'cereal': 150, 'granola': 200, 'muesli': 200,
+    'milk': 120, 'coffee': 5, 'tea': 30, 'juice': 110, 'smoothie': 250, 'protein shake': 150,
+    'whey': 120, 'protein bar': 200, 'yogurt': 100, 'greek yogurt': 100, 'curd': 100,
+    'almond': 7, 'almonds': 170, 'nuts': 170, 'peanut butter': 190,
+    'rice': 200, 'brown rice': 215, 'quinoa': 220, 'roti': 120, 'chapati': 120, 'paratha': 260,
+    'dal': 180, 'rajma': 220, 'chana': 210, 'sambar': 130, 'idli': 60, 'dosa': 170, 'upma': 250,
+    'poha': 250, 'sprouts': 90, 'paneer': 260, 'tofu': 150, 'chicken': 250, 'chicken breast': 250,
+    'grilled chicken': 250, 'chicken curry': 300, 'chicken salad': 350, 'fish': 200, 'salmon': 280,
+    'tuna': 130, 'salad': 150, 'vegetables': 50, 'veggies': 50, 'soup': 120, 'sandwich': 300,
+    'wrap': 350, 'pasta': 350, 'noodles': 350, 'burger': 500, 'pizza': 285, 'sweet potato': 110,
+    'potato': 160, 'cheese': 110, 'biryani': 500, 'khichdi': 300
+}
+
+_NUMBER_WORDS = {
+    'a': 1, 'an': 1, 'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5, 'six': 6, 'seven': 7,
+    'eight': 8, 'nine': 9, 'ten': 10, 'twelve': 12, 'fifteen': 15, 'twenty': 20, 'thirty': 30,
+    'forty': 40, 'forty-five': 45, 'fifty': 50, 'sixty': 60, 'ninety': 90
+}
+_NUMBER = r'\b(\d+(?:\.\d+)?|' + '|'.join(sorted(map(re.escape, _NUMBER_WORDS), key=len, reverse=True)) + r')'
+
+_HALF_HOUR_RE = re.compile(r'\bhalf (an )?hour\b')
+_HOUR_AND_HALF_RE = re.compile(r'\b(an|one|1) (and a half hours?|hour and a half)\b')
+_HOURS_RE = re.compile(_NUMBER + r'\s*-?\s*(?:hours?|hrs?|h)\b(?:\s*(?:and\s*)?(\d+)\s*(?:minutes?|mins?|m)\b)?')
+_MINUTES_RE = re.compile(_NUMBER + r'\s*-?\s*(?:minutes?|mins?|m)\b')
+_CALORIES_RE = re.compile(r'(\d+)\s*(?:k?cals?|kcal|calories)\b')
+# Questions, requests and plans mention workouts and meals without reporting one
+_NOT_A_LOG_RE = re.compile(
+    r'\?|^\s*(how|what|should|can|could|is|are|why|when|which|do|does|give|suggest|recommend|'
+    r'create|make|design|plan|show|find|tell|help|teach|build)\b|'
+    r'\b(routine|program|plan|recipes?|ideas?|will|going to|gonna|want to|need to|planning|tomorrow|next)\b'
+)
+# Negated or skipped activities are not completed ones
+_NEGATED_RE = re.compile(
+    r"\b(not|never|no longer|didn'?t|don'?t|haven'?t|hasn'?t|wasn'?t|couldn'?t|wouldn'?t|"
+    r"skip(ped|ping)?|missed|cancell?ed)\b"
+)
+# Habits, abilities, goals and preferences describe activities, not one session
+_HABITUAL_RE = re.compile(
+    r"\b(usually|normally|typically|generally|always|often|sometimes|rarely|every (day|morning|evening|"
+    r"night|week)|used to|can(?! of)|could|would|goal|aim|target|love|like to|enjoy|hate|prefer)\b"
+)
+# A log reports something done: past tense, "just"/"did", or an explicit request to log it
+_COMPLETED_RE = re.compile(
+    r"\b(just|did|done|finished|completed|log|record|track|add|had|ate|drank|ran|walked|jogged|"
+    r"hiked|cycled|biked|rode|swam|rowed|lifted|stretched|danced|played|trained|worked out|went|"
+    r"spent|burned|burnt)\b"
+)
+# Someone else's activity must not be logged for the user
+_OTHER_SUBJECT_RE = re.compile(
+    r'\b(he|she|they|his|her|their|them|someone|somebody|friends?|wife|husband|partner|boyfriend|'
+    r'girlfriend|brother|sister|son|daughter|mom|mum|mother|dad|father|kids?|client)\b'
+)
+# log_workout/log_meal stamp the current time, so other days need the model
+_RELATIVE_DATE_RE = re.compile(
+    r'\b(yesterday|last (night|evening|week|weekend)|day before|\w+ days? ago|(this )?(past )?weekend|'
+    r'(on )?(mon|tues|wednes|thurs|fri|satur|sun)day)\b'
+)
+_MEAL_RE = re.compile(r'\b(' + '|'.join(MEAL_WORDS) + r')\b')
+
+_FILLER_RE = re.compile(
+    r'\b(log|logged|record|track|add|please|i|i\'ve|just|had|have|ate|eaten|eat|my|for|as|a|an|some|'
+    r'of|the|today|this morning|tonight|meal|about|around|approx|approximately|roughly)\b'
+)
+_ITEM_SPLIT_RE = re.compile(r',|\+|&|\band\b|\bwith\b|\bplus\b')
+_QUANTITY_RE = re.compile(r'^' + _NUMBER + r'\s+(.+)$')
+
+
+class ParsedLog:
+    """
+    Tool name and arguments parsed from an utterance, with what was estimated or missing.
+
+    Besides required arguments, ``missing`` can hold 'date' (the utterance
+    refers to another day), 'single_activity' (it reports more than one
+    workout or meal), 'completed' (nothing marks it as already done) and
+    'plausible' (duration or calories are beyond what one session or meal
+    reaches); any of them makes the parse not confident.
+    """
+
+    __slots__ = ('tool', 'args', 'estimated', 'missing')
+
+    def __init__(self, tool: str, args: Dict, estimated: List[str], missing: List[str]):
+        self.tool = tool
+        self.args = args
+        self.estimated = estimated
+        self.missing = missing
+
+    @property
+    def confident(self) -> bool:
+        return not self.missing
+
+    def to_dict(self) -> Dict:
+        return {'tool': self.tool, 'args': self.args, 'estimated': self.estimated, 'missing': self.missing}
+
+    def __repr__(self) -> str:
+        return f'ParsedLog({self.to_dict()!r})'
+
+
+def _number(token: str) -> float:
+    return _NUMBER_WORDS[token] if token in _NUMBER_WORDS else float(token)
+
+
+def parse_duration(text: str) -> Optional[int]:
+    """Minutes from '30 min', '1h 15m', '1.5 hours', 'an hour', 'half an hour', '45-minute'"""
+    if _HOUR_AND_HALF_RE.search(text):
+        return 90
+    if _HALF_HOUR_RE.search(text):
+        return 30
+    match = _HOURS_RE.search(text)
+    if match:
+        return int(round(_number(match.group(1)) * 60 + int(match.group(2) or 0)))
+    match = _MINUTES_RE.search(text)
+    if match:
+        return int(round(_number(match.group(1))))
+    return None
+
+
+def _duration_mentions(text: str) -> int:
+    # '1h 15m' is one mention: minutes are only counted outside hour phrases
+    return len(_HOURS_RE.findall(text)) + len(_MINUTES_RE.findall(_HOURS_RE.sub(' ', text)))
+
+
+def parse_calories(text: str) -> Optional[int]:
+    match = _CALORIES_RE.search(text)
+    return int(match.group(1)) if match else None
+
+
+def parse_intensity(text: str) -> Optional[str]:
+    return next((level for level, pattern in INTENSITY_PATTERNS if pattern.search(text)), None)
+
+
+def parse_exercise(text: str) -> Optional[str]:
+    for word in re.findall(r"[a-z]+", text):
+        if word in EXERCISE_WORDS:
+            return EXERCISE_WORDS[word]
+    return None
+
+
+def parse_exercises(text: str) -> List[str]:
+    """Distinct exercises mentioned, in order"""
+    exercises = []
+    for word in re.findall(r"[a-z]+", text):
+        exercise = EXERCISE_WORDS.get(word)
+        if exercise is not None and exercise not in exercises:
+            exercises.append(exercise)
+    return exercises
+
+
+def estimate_workout_calories(exercise: str, duration: int, intensity: str,
+                              body_weight_kg: float = DEFAULT_BODY_WEIGHT_KG) -> int:
+    """
+    Calories burned as MET x body weight (kg) x hours.
+
+    Example:
+        >>> estimate_workout_calories('running', 30, 'moderate')
+        290
+    """
+    mets = MET_VALUES.get(exercise, MET_VALUES['cardio'])
+    met = mets[INTENSITIES.index(intensity) if intensity in INTENSITIES else 1]
+    return int(round(met * body_weight_kg * duration / 60))
+
+
+def _singular(item: str) -> str:
+    if item in SERVING_KCAL or not item.endswith('s'):
+        return item
+    return item[:-2] if item.endswith('es') and item[:-2] in SERVING_KCAL else item[:-1]
+
+
+def parse_food_items(text: str) -> List[str]:
+    """Food list with meal words, verbs, calories and filler removed"""
+    body = _CALORIES_RE.sub(' ', text)
+    body = _MEAL_RE.sub(' ', body)
+    body = body.replace(':', ' ').replace('~', ' ')
+    items = []
+    for part in _ITEM_SPLIT_RE.split(body):
+        item = ' '.join(_FILLER_RE.sub(' ', part).split())
+        if item:
+            items.append(item)
+    return items
+
+
+def estimate_meal_calories(items: List[str]) -> Optional[int]:
+    """Sum of typical serving calories, or None if any item is unknown"""
+    total = 0
+    for item in items:
+        count, name = 1.0, item
+        match = _QUANTITY_RE.match(item)
+        if match:
+            count, name = _number(match.group(1)), match.group(2)
+        name = _singular(name)
+        if name not in SERVING_KCAL:
+            # 'black coffee', 'masala dosa': fall back to the head noun
+            name = _singular(name.rsplit(' ', 1)[-1])
+        if name not in SERVING_KCAL:
+            return None
+        total += count * SERVING_KCAL[name]
+    return int(round(total))
+
+
+def parse_workout(text: str, body_weight_kg: float = DEFAULT_BODY_WEIGHT_KG) -> ParsedLog:
+    """
+    log_workout arguments from a workout utterance.
+
+    Exercise and duration are required; intensity defaults per exercise
+    and calories are estimated from METs when not stated.
+
+    Example:
+        >>> parse_workout("I ran for 30 minutes at moderate pace").args
+        {'exercise': 'running', 'duration': 30, 'intensity': 'moderate', 'calories': 290}
+    """
+    lowered = text.lower()
+    exercise = parse_exercise(lowered)
+    duration = parse_duration(lowered)
+    missing = [name for name, value in (('exercise', exercise), ('duration', duration)) if value is None]
+    estimated = []
+
+    intensity = parse_intensity(lowered)
+    if intensity is None:
+        intensity = DEFAULT_INTENSITY.get(exercise, 'moderate')
+        estimated.append('intensity')
+    calories = parse_calories(lowered)
+    if calories is None and not missing:
+        calories = estimate_workout_calories(exercise, duration, intensity, body_weight_kg)
+        estimated.append('calories')
+    elif calories is None:
+        missing.append('calories')
+
+    args = {'exercise': exercise, 'duration': duration, 'intensity': intensity, 'calories': calories}
+    return ParsedLog('log_workout', args, estimated, missing)
+
+
+def parse_meal(text: str) -> ParsedLog:
+    """
+    log_meal arguments from a meal utterance.
+
+    Meal type and at least one food item are required; calories are
+    estimated from typical servings when every item is recognized.
+
+    Example:
+        >>> parse_meal("Had 2 eggs and toast for breakfast").args
+        {'meal_type': 'breakfast', 'food_items': ['2 eggs', 'toast'], 'calories': 236}
+    """
+    lowered = text.lower()
+    meal = _MEAL_RE.search(lowered)
+    meal_type = MEAL_WORDS[meal.group(1)] if meal else None
+    items = parse_food_items(lowered)
+    missing = [name for name, value in (('meal_type', meal_type), ('food_items', items)) if not value]
+    estimated = []
+
+    calories = parse_calories(lowered)
+    if calories is None and items:
+        calories = estimate_meal_calories(items)
+        if calories is not None:
+            estimated.append('calories')
+    if calories is None:
+        missing.append('calories')
+
+    args = {'meal_type': meal_type, 'food_items': items, 'calories': calories}
+    return ParsedLog('log_meal', args, estimated, missing)
+
+
+def _plausible(parsed: ParsedLog) -> bool:
+    calories = parsed.args.get('calories') or 0
+    if parsed.tool == 'log_meal':
+        return calories <= MAX_MEAL_CALORIES
+    return (parsed.args.get('duration') or 0) <= MAX_WORKOUT_MINUTES and calories <= MAX_WORKOUT_CALORIES
+
+
+def parse_log(text: str, body_weight_kg: float = DEFAULT_BODY_WEIGHT_KG) -> Optional[ParsedLog]:
+    """
+    Parse a logging utterance into log_workout or log_meal arguments.
+
+    Returns None for questions, requests and plans, habits, goals and
+    preferences, negated or skipped activities, someone else's activity,
+    and text that names neither a meal nor an exercise; otherwise a
+    ParsedLog whose ``confident`` flag says whether the tool can be called
+    without asking the model. Reports about another day or of several
+    activities, text without a completed-report cue and implausible
+    values are never confident.
+    """
+    lowered = text.lower()
+    if (_NOT_A_LOG_RE.search(lowered) or _HABITUAL_RE.search(lowered) or _NEGATED_RE.search(lowered)
+            or _OTHER_SUBJECT_RE.search(lowered)):
+        return None
+    meals = {MEAL_WORDS[word] for word in _MEAL_RE.findall(lowered)}
+    exercises = parse_exercises(lowered)
+    if meals:
+        parsed = parse_meal(lowered)
+    elif exercises:
+        parsed = parse_workout(lowered, body_weight_kg)
+    else:
+        return None
+    if _RELATIVE_DATE_RE.search(lowered):
+        parsed.missing.append('date')
+    if len(meals) + len(exercises) > 1 or (exercises and _duration_mentions(lowered) > 1):
+        parsed.missing.append('single_activity')
+    if not _COMPLETED_RE.search(lowered):
+        parsed.missing.append('completed')
+    if not _plausible(parsed):
+        parsed.missing.append('plausible')
+    return parsed
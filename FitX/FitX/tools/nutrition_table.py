@@ -0,0 +1,194 @@
+"""
+FitX Nutrition Table - Numeric per-100g nutrition facts with diet and meal-type indexes
+"""
+
+import json
+import os
+import threading
+from array import array
+from typing import Dict, List, Optional, Set, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; queries fall back to pure Python
+    np = None
+
+
+DEFAULT_NUTRITION_PATH = os.path.join(os.path.dirname(__file__), 'data', 'nutrition_table.jsonl')
+
+NUTRIENTS = ('protein_g', 'fat_g', 'carbs_g', 'fiber_g', 'kcal')
+DIETS = ('high-protein', 'low-carb', 'keto', 'vegan', 'vegetarian')
+MEAL_TYPES = ('breakfast', 'lunch', 'dinner', 'snack')
+
+DIET_ALIASES = {
+    'high protein': 'high-protein',
+    'protein': 'high-protein',
+    'low carb': 'low-carb',
+    'ketogenic': 'keto',
+    'plant-based': 'vegan',
+    'plant based': 'vegan',
+    'veg': 'vegetarian'
+}
+
+# Sort key -> (column, descending)
+SORT_KEYS = {
+    'protein': ('protein_g', True),
+    'protein_per_rupee': ('protein_per_rupee', True),
+    'protein_density': ('protein_per_100kcal', True),
+    'fiber': ('fiber_g', True),
+    'net_carbs': ('net_carbs_g', False),
+    'calories': ('kcal', False),
+    'price': ('price_rupees', False)
+}
+DEFAULT_SORT = {
+    'high-protein': 'protein',
+    'vegan': 'protein',
+    'vegetarian': 'protein',
+    'keto': 'net_carbs',
+    'low-carb': 'net_carbs',
+    None: 'fiber'
+}
+
+# Derived diet thresholds (per 100g)
+HIGH_PROTEIN_GRAMS = 15
+HIGH_PROTEIN_ENERGY_SHARE = 0.3
+LOW_CARB_GRAMS = 10
+KETO_NET_CARB_GRAMS = 5
+KETO_FAT_ENERGY_SHARE = 0.5
+
+
+def normalize_diet(dietary_type: Optional[str]) -> Optional[str]:
+    """Map a free-text diet name to one of DIETS, or None for a general diet"""
+    diet = ' '.join(str(dietary_type or '').lower().split())
+    diet = DIET_ALIASES.get(diet, diet)
+    return diet if diet in DIETS else None
+
+
+def diet_tags(food: Dict) -> Set[str]:
+    """Declared tags (vegan/vegetarian) plus tags derived from the nutrient values"""
+    tags = {diet for diet in food.get('diets', ()) if diet in DIETS}
+    kcal = float(food.get('kcal') or 0)
+    protein = float(food.get('protein_g') or 0)
+    carbs = float(food.get('carbs_g') or 0)
+    net_carbs = carbs - float(food.get('fiber_g') or 0)
+    fat_share = 9 * float(food.get('fat_g') or 0) / kcal if kcal else 0.0
+    if protein >= HIGH_PROTEIN_GRAMS or (kcal and 4 * protein / kcal >= HIGH_PROTEIN_ENERGY_SHARE):
+        tags.add('high-protein')
+    if carbs <= LOW_CARB_GRAMS:
+        tags.add('low-carb')
+    if net_carbs <= KETO_NET_CARB_GRAMS and fat_share >= KETO_FAT_ENERGY_SHARE:
+        tags.add('keto')
+    if 'vegan' in tags:
+        tags.add('vegetarian')
+    return tags
+
+
+def _view(column: array):
+    """Zero-copy NumPy view over an ``array`` column (or the column itself)."""
+    return np.asarray(memoryview(column)) if np is not None else column
+
+
+class NutritionTable:
+    """
+    Columnar per-100g nutrition facts for quick-commerce food items.
+
+    Nutrients and derived metrics (protein per rupee, protein per 100 kcal,
+    net carbs) are stored as typed-array columns, and row ids are indexed
+    by diet tag and meal type when the table is built. A query intersects
+    the relevant index entries and sorts one metric column; with NumPy both
+    steps are vectorized.
+    """
+
+    def __init__(self, foods: List[Dict]):
+        self.foods = foods
+        self.columns: Dict[str, array] = {
+            name: array('f', (float(food.get(name) or 0) for food in foods)) for name in NUTRIENTS
+        }
+        price_rupees = array('f', ((food.get('price_paise') or 0) / 100 for food in foods))
+        pack_grams = array('f', (float(food.get('pack_grams') or 0) for food in foods))
+        columns = self.columns
+        columns['price_rupees'] = price_rupees
+        columns['protein_per_rupee'] = array('f', (
+            protein * grams / 100 / price if price else 0.0
+            for protein, grams, price in zip(columns['protein_g'], pack_grams, price_rupees)
+        ))
+        columns['protein_per_100kcal'] = array('f', (
+            protein * 100 / kcal if kcal else 0.0
+            for protein, kcal in zip(columns['protein_g'], columns['kcal'])
+        ))
+        columns['net_carbs_g'] = array('f', (
+            max(carbs - fiber, 0.0) for carbs, fiber in zip(columns['carbs_g'], columns['fiber_g'])
+        ))
+
+        self.tags: List[Set[str]] = [diet_tags(food) for food in foods]
+        self.diet_index: Dict[str, array] = {
+            diet: array('I', (row for row, tags in enumerate(self.tags) if diet in tags)) for diet in DIETS
+        }
+        self.meal_index: Dict[str, array] = {
+            meal: array('I', (row for row, food in enumerate(foods) if meal in food.get('meal_types', ())))
+            for meal in MEAL_TYPES
+        }
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_NUTRITION_PATH) -> 'NutritionTable':
+        """Load a table from a JSON Lines file"""
+        with open(path, encoding='utf-8') as f:
+            return cls([json.loads(line) for line in f if line.strip()])
+
+    def __len__(self) -> int:
+        return len(self.foods)
+
+    def query(self, diet: Optional[str] = None, meal_type: Optional[str] = None,
+              sort_by: Optional[str] = None, limit: int = 5) -> List[Tuple[float, Dict]]:
+        """
+        Top foods for a diet and meal type, ranked by one metric.
+
+        Args:
+            diet: Diet name or alias (e.g. 'vegan', 'high protein'); None or
+                  an unknown diet means no diet filter
+            meal_type: One of MEAL_TYPES; None or 'any' means no meal filter
+            sort_by: Key of SORT_KEYS; defaults to the diet's usual metric
+            limit: Maximum number of results
+
+        Returns:
+            List of (metric value, food) pairs, best first
+
+        Example:
+            >>> table.query('vegan', 'breakfast', sort_by='protein_per_rupee', limit=3)
+        """
+        diet = normalize_diet(diet)
+        column, descending = SORT_KEYS[sort_by or DEFAULT_SORT[diet]]
+        filters = []
+        if diet is not None:
+            filters.append(self.diet_index[diet])
+        if meal_type and meal_type.lower() in self.meal_index:
+            filters.append(self.meal_index[meal_type.lower()])
+
+        if np is not None:
+            rows = np.arange(len(self.foods), dtype=np.uint32)
+            for index in filters:
+                rows = np.intersect1d(rows, _view(index), assume_unique=True)
+            values = _view(self.columns[column])[rows]
+            order = np.argsort(-values if descending else values, kind='stable')[:limit]
+            return [(float(values[i]), self.foods[int(rows[i])]) for i in order]
+
+        rows = range(len(self.foods))
+        for index in filters:
+            rows = sorted(set(rows).intersection(index))
+        values = self.columns[column]
+        ranked = sorted(rows, key=lambda row: -values[row] if descending else values[row])[:limit]
+        return [(values[row], self.foods[row]) for row in ranked]
+
+
+_default_table: Optional[NutritionTable] = None
+_default_table_lock = threading.Lock()
+
+
+def get_nutrition_table() -> NutritionTable:
+    """Return the process-wide nutrition table (FITX_NUTRITION_PATH or the bundled file)"""
+    global _default_table
+    if _default_table is None:
+        with _default_table_lock:
+            if _default_table is None:
+                _default_table = NutritionTable.load(os.getenv('FITX_NUTRITION_PATH') or DEFAULT_NUTRITION_PATH)
+    return _default_table
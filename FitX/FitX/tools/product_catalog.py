@@ -0,0 +1,223 @@
+"""
+FitX Product Catalog - Local product catalog with an inverted index and BM25 ranking
+"""
+
+import csv
+import gzip
+import heapq
+import json
+import math
+import os
+import re
+import threading
+from array import array
+from itertools import islice
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .catalog_snapshot import SNAPSHOT_SUFFIX, map_snapshot, write_snapshot
+
+
+DEFAULT_CATALOG_PATH = os.path.join(os.path.dirname(__file__), 'data', 'product_catalog.jsonl')
+
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+TITLE_WEIGHT = 2
+FILTER_BOOST = 1.5
+MAX_POSTINGS_PER_TERM = 1000
+
+# CSV catalogs: list columns are '|'-separated, numeric columns are coerced
+CSV_LIST_FIELDS = ('tags', 'features', 'colors')
+CSV_NUMERIC_FIELDS = {'price_paise': int, 'rating': float, 'reviews': int}
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase alphanumeric tokens with naive plural folding ('dumbbells' -> 'dumbbell')"""
+    tokens = []
+    for token in _TOKEN_RE.findall(text.lower()):
+        if len(token) > 3 and token.endswith('s') and not token.endswith('ss'):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
+
+
+def posting_key(kind_code: int, token: str) -> str:
+    """Postings are stored per product kind, keyed '<kind code>:<token>'"""
+    return f'{kind_code}:{token}'
+
+
+def _document_tokens(product: Dict) -> List[str]:
+    tokens = tokenize(product.get('title', '')) * TITLE_WEIGHT
+    tokens += tokenize(product.get('brand', ''))
+    tokens += tokenize(product.get('category', ''))
+    for tag in product.get('tags', ()):
+        tokens += tokenize(tag)
+    return tokens
+
+
+def read_products(path: str) -> List[Dict]:
+    """Read product dicts from JSON Lines (optionally gzip-compressed) or CSV"""
+    opener = gzip.open if path.endswith('.gz') else open
+    with opener(path, 'rt', encoding='utf-8', newline='') as f:
+        if not path.lower().endswith(('.csv', '.csv.gz')):
+            return [json.loads(line) for line in f if line.strip()]
+        products = []
+        for row in csv.DictReader(f):
+            product = {key: value for key, value in row.items() if value not in (None, '')}
+            for field in CSV_LIST_FIELDS:
+                if field in product:
+                    product[field] = [item.strip() for item in product[field].split('|') if item.strip()]
+            for field, convert in CSV_NUMERIC_FIELDS.items():
+                if field in product:
+                    product[field] = convert(product[field])
+            products.append(product)
+        return products
+
+
+class ProductCatalog:
+    """
+    In-memory product catalog searchable by free text.
+
+    Titles, brands, categories and activity tags are tokenized into an
+    inverted index whose postings are typed arrays of (doc id, BM25 impact)
+    ordered by impact, one list per token and product kind. Queries only
+    touch the postings of their own tokens and read at most
+    ``max_postings`` highest-impact entries per token, so lookups stay
+    around a millisecond even for catalogs with hundreds of thousands of
+    SKUs, however few of them are of the requested kind.
+
+    Kinds and ratings are kept as columns so ranking never touches the
+    product dicts; the same layout is what catalog snapshots map from disk.
+    """
+
+    def __init__(self, products: List[Dict]):
+        self.products = products
+        self._kind_codes = {kind: code for code, kind in enumerate(sorted({p.get('kind', '') for p in products}))}
+        self._kinds = array('B', (self._kind_codes[p.get('kind', '')] for p in products))
+        self._ratings = array('f', (float(p.get('rating') or 0) for p in products))
+        self.doc_lengths = array('H')
+        postings: Dict[str, Dict[int, int]] = {}
+        self._label_docs: Dict[str, set] = {}
+        for doc_id, product in enumerate(products):
+            for label in [product.get('category', ''), *product.get('tags', ())]:
+                for token in tokenize(label):
+                    self._label_docs.setdefault(token, set()).add(doc_id)
+            tokens = _document_tokens(product)
+            self.doc_lengths.append(min(len(tokens), 2 ** 16 - 1))
+            for token in tokens:
+                doc_tfs = postings.setdefault(token, {})
+                doc_tfs[doc_id] = doc_tfs.get(doc_id, 0) + 1
+
+        total = len(products)
+        self.avg_doc_length = (sum(self.doc_lengths) / total) if total else 0.0
+        avg_len = self.avg_doc_length or 1.0
+
+        # Postings hold precomputed BM25 impacts (idf * saturated tf) over the
+        # whole catalog, split by kind and sorted best-first so very common
+        # terms can be cut off after the top entries of the requested kind
+        self._postings: Dict[str, Tuple[array, array]] = {}
+        for token, doc_tfs in postings.items():
+            idf = math.log(1 + (total - len(doc_tfs) + 0.5) / (len(doc_tfs) + 0.5))
+            by_kind: Dict[int, List[Tuple[float, int]]] = {}
+            for doc_id, tf in doc_tfs.items():
+                impact = idf * tf * (K1 + 1) / (tf + K1 * (1 - B + B * self.doc_lengths[doc_id] / avg_len))
+                by_kind.setdefault(self._kinds[doc_id], []).append((impact, doc_id))
+            for kind_code, impacts in by_kind.items():
+                impacts.sort(reverse=True)
+                self._postings[posting_key(kind_code, token)] = (
+                    array('I', (doc_id for _, doc_id in impacts)),
+                    array('f', (impact for impact, _ in impacts)))
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_CATALOG_PATH) -> 'ProductCatalog':
+        """Load a catalog from JSON Lines, CSV or a binary snapshot (*.fxcat)"""
+        if path.endswith(SNAPSHOT_SUFFIX):
+            return cls.open_snapshot(path)
+        return cls(read_products(path))
+
+    @classmethod
+    def open_snapshot(cls, path: str) -> 'ProductCatalog':
+        """Open a binary snapshot via mmap without building the index in memory"""
+        views = map_snapshot(path)
+        catalog = cls.__new__(cls)
+        catalog._mmap = views['mmap']
+        catalog.products = views['products']
+        catalog.avg_doc_length = views['meta']['avg_doc_length']
+        catalog._kind_codes = views['kind_codes']
+        catalog._kinds = views['kinds']
+        catalog._ratings = views['ratings']
+        catalog._postings = views['postings']
+        catalog._label_docs = views['label_docs']
+        return catalog
+
+    def save_snapshot(self, path: str) -> Dict:
+        """Write this catalog as a binary snapshot (see catalog_snapshot)"""
+        return write_snapshot(self, path)
+
+    def __len__(self) -> int:
+        return len(self.products)
+
+    def search(self, query: str, kind: Optional[str] = None, boost_terms: Iterable[str] = (),
+               limit: int = 10, max_postings: int = MAX_POSTINGS_PER_TERM) -> List[Tuple[float, Dict]]:
+        """
+        Rank products for a free-text query.
+
+        Args:
+            query: Search text (e.g. 'adjustable dumbbells')
+            kind: Restrict to 'equipment' or 'apparel'
+            boost_terms: Category/activity words; products whose category or
+                         tags contain them score higher
+            limit: Maximum number of results
+            max_postings: Highest-impact postings read per query term
+
+        Returns:
+            List of (score, product) pairs, best first
+        """
+        if kind is None:
+            kind_codes = list(self._kind_codes.values())
+        elif kind in self._kind_codes:
+            kind_codes = [self._kind_codes[kind]]
+        else:
+            return []
+
+        ratings = self._ratings
+        scores: Dict[int, float] = {}
+        for token in set(tokenize(query)):
+            entries = [self._postings.get(posting_key(code, token)) for code in kind_codes]
+            entries = [entry for entry in entries if entry is not None]
+            if not entries:
+                continue
+            if len(entries) == 1:
+                doc_ids, impacts = entries[0]
+                postings = zip(impacts[:max_postings], doc_ids[:max_postings])
+            else:
+                # Unrestricted query: best entries across the per-kind lists
+                postings = islice(heapq.merge(*(zip(impacts, doc_ids) for doc_ids, impacts in entries),
+                                              reverse=True), max_postings)
+            for impact, doc_id in postings:
+                scores[doc_id] = scores.get(doc_id, 0.0) + impact
+
+        boosted = [self._label_docs[token] for term in boost_terms
+                   for token in tokenize(term) if token in self._label_docs]
+        ranked = []
+        for doc_id, score in scores.items():
+            if any(doc_id in docs for docs in boosted):
+                score *= FILTER_BOOST
+            ranked.append((score, ratings[doc_id], doc_id))
+        return [(score, self.products[doc_id]) for score, _, doc_id in heapq.nlargest(limit, ranked)]
+
+
+_default_catalog: Optional[ProductCatalog] = None
+_default_catalog_lock = threading.Lock()
+
+
+def get_product_catalog() -> ProductCatalog:
+    """Return the process-wide catalog (FITX_CATALOG_PATH, e.g. a shared *.fxcat snapshot, or the bundled file)"""
+    global _default_catalog
+    if _default_catalog is None:
+        with _default_catalog_lock:
+            if _default_catalog is None:
+                _default_catalog = ProductCatalog.load(os.getenv('FITX_CATALOG_PATH') or DEFAULT_CATALOG_PATH)
+    return _default_catalog
@@ -0,0 +1,211 @@
+"""
+FitX Product Record - The one product type shared by every shopping path
+
+Vendor parsers (Amazon, Flipkart), the quick-commerce mocks (Blinkit,
+Instamart) and the catalog-backed shopping tools all emit Product
+records: prices as integer paise, ratings as floats, review counts as
+ints and platforms as interned ids ('amazon', 'flipkart', ...). Records
+stay numeric all the way through ranking and sorting; display strings
+("₹2,499") are produced once, when ``serialize`` turns a tool result into
+JSON-safe data at the tool boundary.
+"""
+
+import re
+import sys
+from typing import Any, Dict, Optional, Tuple
+
+
+# Display names and aliases -> canonical platform id
+_PLATFORM_ALIASES = {
+    'amazon': 'amazon',
+    'amazon.in': 'amazon',
+    'flipkart': 'flipkart',
+    'myntra': 'myntra',
+    'blinkit': 'blinkit',
+    'instamart': 'instamart',
+    'swiggy instamart': 'instamart'
+}
+
+_NUMBER_RE = re.compile(r'\d[\d,]*(?:\.\d+)?')
+
+
+def platform_id(name: Optional[str]) -> str:
+    """Canonical, interned platform id ('Swiggy Instamart' -> 'instamart')"""
+    key = (name or '').strip().lower()
+    return sys.intern(_PLATFORM_ALIASES.get(key, key))
+
+
+def _to_float(value: Any) -> Optional[float]:
+    """4.5, '4.5', '4.5/5' or '4.5 out of 5' -> 4.5"""
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    match = _NUMBER_RE.search(str(value))
+    return float(match.group().replace(',', '')) if match else None
+
+
+def _to_int(value: Any) -> Optional[int]:
+    """1234, '1,234' or '1,234 ratings' -> 1234"""
+    number = _to_float(value)
+    return int(number) if number is not None else None
+
+
+def format_price(paise: Optional[int], currency: str = 'INR') -> str:
+    """Display price: 249900 -> '₹2,499', 19950 -> '₹199.50'"""
+    if paise is None:
+        return 'Price not available'
+    rupees, fraction = divmod(int(paise), 100)
+    symbol = '₹' if currency == 'INR' else f'{currency} '
+    return f'{symbol}{rupees:,}' + (f'.{fraction:02d}' if fraction else '')
+
+
+class Product:
+    """
+    Compact product record (prices in paise).
+
+    Args:
+        platform: Platform name or id (interned as a canonical id)
+        product_id: Vendor id (ASIN, Flipkart product id, catalog SKU)
+        title: Product name
+        brand: Brand name
+        price_paise: Selling price in minor units
+        currency: ISO currency code
+        mrp_paise: List price in minor units
+        discount: Discount percent
+        rating: Average rating out of 5
+        reviews: Number of ratings/reviews
+        url: Product or search link
+        in_stock: Availability, when the source reports it
+        delivery_mins: Quick-commerce delivery time
+        features: Short feature list
+        extra: Source-specific fields serialized as-is (sizes, nutrition, ...)
+
+    Example:
+        >>> product = Product('Amazon', 'B08D0A9764', 'Kore PVC Dumbbells 10kg', price_paise=99900, rating=4.2)
+        >>> product.platform, product.price
+        ('amazon', '₹999')
+    """
+
+    __slots__ = ('platform', 'product_id', 'title', 'brand', 'price_paise', 'currency', 'mrp_paise',
+                 'discount', 'rating', 'reviews', 'url', 'in_stock', 'delivery_mins', 'features', 'extra')
+
+    def __init__(self, platform: str, product_id: Optional[str] = None, title: Optional[str] = None,
+                 brand: Optional[str] = None, price_paise: Optional[int] = None, currency: str = 'INR',
+                 mrp_paise: Optional[int] = None, discount: Optional[float] = None,
+                 rating: Optional[float] = None, reviews: Optional[int] = None, url: Optional[str] = None,
+                 in_stock: Optional[bool] = None, delivery_mins: Optional[int] = None,
+                 features: Tuple[str, ...] = (), extra: Optional[Dict[str, Any]] = None):
+        self.platform = platform_id(platform)
+        self.product_id = product_id
+        self.title = title
+        self.brand = brand
+        self.price_paise = price_paise
+        self.currency = sys.intern(currency)
+        self.mrp_paise = mrp_paise
+        self.discount = discount
+        self.rating = rating
+        self.reviews = reviews
+        self.url = url
+        self.in_stock = in_stock
+        self.delivery_mins = delivery_mins
+        self.features = features
+        self.extra = extra
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], **overrides) -> 'Product':
+        """
+        Build from a loosely shaped product dict (catalog rows, legacy results).
+
+        Accepts the field names above plus common aliases (sku/asin/id, name,
+        link) and display strings for rating and reviews ('4.5/5', '1,234').
+        """
+        fields = {
+            'platform': data.get('platform', ''),
+            'product_id': data.get('product_id') or data.get('sku') or data.get('asin') or data.get('id'),
+            'title': data.get('title') or data.get('name'),
+            'brand': data.get('brand'),
+            'price_paise': _to_int(data.get('price_paise')),
+            'currency': data.get('currency') or 'INR',
+            'mrp_paise': _to_int(data.get('mrp_paise')),
+            'discount': _to_float(data.get('discount')),
+            'rating': _to_float(data.get('rating')),
+            'reviews': _to_int(data.get('reviews')),
+            'url': data.get('url') or data.get('link'),
+            'in_stock': data.get('in_stock'),
+            'delivery_mins': _to_int(data.get('delivery_mins')),
+            'features': tuple(data.get('features') or ())
+        }
+        fields.update(overrides)
+        return cls(**fields)
+
+    @property
+    def price(self) -> Optional[str]:
+        """Display price ("₹2,499"), or None when unpriced"""
+        return format_price(self.price_paise, self.currency) if self.price_paise is not None else None
+
+    def get(self, field: str, default: Any = None) -> Any:
+        """Dict-style read access, so code written for product dicts accepts records too"""
+        if field in self.__slots__ or field == 'price':
+            value = getattr(self, field)
+        else:
+            value = (self.extra or {}).get(field)
+        return default if value is None else value
+
+    def to_dict(self, fields: Optional[Tuple[str, ...]] = None) -> Dict[str, Any]:
+        """
+        JSON-safe dict of the set fields, with the display price next to price_paise.
+
+        Args:
+            fields: Only these keys, in this order (record fields, 'price' or
+                    ``extra`` keys); all set fields by default
+        """
+        if fields is not None:
+            data = {}
+            for field in fields:
+                value = self.get(field)
+                if value is not None and value != ():
+                    data[field] = list(value) if field == 'features' else value
+            return data
+        data = {}
+        for field in self.__slots__[:-2]:
+            value = getattr(self, field)
+            if value is not None:
+                if field == 'price_paise':
+                    data['price'] = self.price
+                data[field] = value
+        if self.features:
+            data['features'] = list(self.features)
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def __eq__(self, other) -> bool:
+        return (isinstance(other, Product)
+                and all(getattr(self, field) == getattr(other, field) for field in self.__slots__))
+
+    def __repr__(self) -> str:
+        return f'Product({self.platform!r}, {self.product_id!r}, {self.title!r}, {self.price!r})'
+
+
+def to_jsonable(value: Any) -> Any:
+    """``default=`` hook for json.dumps: serializes Product records"""
+    if isinstance(value, Product):
+        return value.to_dict()
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+
+def serialize(value: Any) -> Any:
+    """
+    Turn a tool result containing Product records into JSON-safe data.
+
+    This is the single serialization step at the tool boundary: tools build
+    their results from records and return ``serialize(results)``.
+    """
+    if isinstance(value, Product):
+        return value.to_dict()
+    if isinstance(value, dict):
+        return {key: serialize(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [serialize(item) for item in value]
+    return value
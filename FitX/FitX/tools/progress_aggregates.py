@@ -0,0 +1,139 @@
+"""
+FitX Progress Aggregates - Per-user daily buckets with prefix sums for rolling windows
+"""
+
+import threading
+from datetime import date, datetime
+from typing import Dict, List, Optional
+
+from .event_store import EventProjection, get_event_store
+
+
+# Bucket columns
+WORKOUTS = 0
+ACTIVE_MINUTES = 1
+CALORIES_BURNED = 2
+MEALS = 3
+MEAL_CALORIES = 4
+BUCKET_FIELDS = ('workouts', 'active_minutes', 'calories_burned', 'meals', 'meal_calories')
+
+
+def day_ordinal(ts: float) -> int:
+    """Local calendar day of an epoch timestamp, as a proleptic ordinal."""
+    return datetime.fromtimestamp(ts).date().toordinal()
+
+
+class DailyTotals:
+    """
+    Contiguous per-day buckets for one user plus lazily rebuilt prefix sums.
+
+    Buckets are indexed by day offset from the first day seen. Updating the
+    newest day only invalidates the last prefix entry, so the common "log
+    today, summarize this week" pattern stays O(1) per call; a backfilled
+    day invalidates the prefix from that day on and is rebuilt on next read.
+    """
+
+    def __init__(self):
+        self.first_day: Optional[int] = None
+        self.buckets: List[List[int]] = []
+        self._prefix: List[List[int]] = [[0] * len(BUCKET_FIELDS)]
+        self._dirty_from = 0
+
+    def add(self, day: int, column_values: Dict[int, int]) -> None:
+        if self.first_day is None:
+            self.first_day = day
+        if day < self.first_day:
+            shift = self.first_day - day
+            self.buckets[:0] = [[0] * len(BUCKET_FIELDS) for _ in range(shift)]
+            self.first_day = day
+            self._dirty_from = 0
+        offset = day - self.first_day
+        while len(self.buckets) <= offset:
+            self.buckets.append([0] * len(BUCKET_FIELDS))
+        bucket = self.buckets[offset]
+        for column, value in column_values.items():
+            bucket[column] += value
+        self._dirty_from = min(self._dirty_from, offset)
+
+    def _prefix_sums(self) -> List[List[int]]:
+        prefix = self._prefix
+        del prefix[self._dirty_from + 1:]
+        for offset in range(self._dirty_from, len(self.buckets)):
+            prev = prefix[offset]
+            prefix.append([a + b for a, b in zip(prev, self.buckets[offset])])
+        self._dirty_from = len(self.buckets)
+        return prefix
+
+    def window(self, start_day: int, end_day: int) -> List[int]:
+        """Column totals over the inclusive day range [start_day, end_day]."""
+        if self.first_day is None or end_day < start_day:
+            return [0] * len(BUCKET_FIELDS)
+        prefix = self._prefix_sums()
+        lo = min(max(start_day - self.first_day, 0), len(self.buckets))
+        hi = min(max(end_day - self.first_day + 1, 0), len(self.buckets))
+        return [b - a for a, b in zip(prefix[lo], prefix[hi])]
+
+
+class ProgressAggregates(EventProjection):
+    """
+    Per-user daily workout and meal totals, kept current on every log call.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._users: Dict[str, DailyTotals] = {}
+        self._lock = threading.Lock()
+
+    def _apply(self, event: Dict) -> None:
+        kind = event.get('type')
+        if kind == 'workout':
+            values = {
+                WORKOUTS: 1,
+                ACTIVE_MINUTES: int(event.get('duration') or 0),
+                CALORIES_BURNED: int(event.get('calories') or 0)
+            }
+        elif kind == 'meal':
+            values = {
+                MEALS: 1,
+                MEAL_CALORIES: int(event.get('calories') or 0)
+            }
+        else:
+            return
+        with self._lock:
+            totals = self._users.get(event['user_id'])
+            if totals is None:
+                totals = self._users[event['user_id']] = DailyTotals()
+            totals.add(day_ordinal(event['ts']), values)
+
+    def window(self, user_id: str, days: int, today: Optional[date] = None) -> Dict[str, int]:
+        """
+        Totals over the last ``days`` calendar days, including today.
+
+        Args:
+            user_id: User whose totals to read
+            days: Window length in days
+            today: Last day of the window (defaults to the local date)
+
+        Returns:
+            Dictionary with workouts, active_minutes, calories_burned,
+            meals and meal_calories
+        """
+        end_day = (today or date.today()).toordinal()
+        with self._lock:
+            totals = self._users.get(user_id)
+            values = totals.window(end_day - days + 1, end_day) if totals else [0] * len(BUCKET_FIELDS)
+        return dict(zip(BUCKET_FIELDS, values))
+
+
+_default_aggregates: Optional[ProgressAggregates] = None
+_default_aggregates_lock = threading.Lock()
+
+
+def get_progress_aggregates() -> ProgressAggregates:
+    """Return the process-wide aggregates, replaying the event store on first use."""
+    global _default_aggregates
+    if _default_aggregates is None:
+        with _default_aggregates_lock:
+            if _default_aggregates is None:
+                _default_aggregates = ProgressAggregates.from_store(get_event_store())
+    return _default_aggregates
@@ -0,0 +1,148 @@
+"""
+FitX Response Shaping - Compact tool results for the model context
+
+Every tool result goes into the model context on every turn. Shaping
+turns a tool's Product records into small dicts holding only the fields
+that tool's answers need (per-tool projections), keeps the top-k items
+of each result list, drops static boilerplate keys, and finally caps the
+result at a token budget by dropping the lowest-ranked items. ``dumps``
+is the compact encoder for tools that return JSON text (orjson when
+installed, else json without whitespace).
+
+Environment:
+    FITX_RESPONSE_SHAPING=0     return full results (debugging)
+    FITX_TOOL_TOKEN_BUDGET=500  default token budget per tool result
+"""
+
+import json
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # faster encoding is optional
+    orjson = None
+
+from .product_record import Product, serialize, to_jsonable
+
+
+# Rough tokens-per-character ratio of JSON for the model's tokenizer
+CHARS_PER_TOKEN = 4
+DEFAULT_TOKEN_BUDGET = 500
+
+
+class Projection:
+    """
+    How one tool's result is shaped.
+
+    Args:
+        fields: Keys kept for each product, in output order
+        top_k: Items kept per product list
+        drop: Top-level result keys removed (static guides, blurbs)
+        max_features: Feature bullets kept per product
+        budget_tokens: Token cap (defaults to FITX_TOOL_TOKEN_BUDGET)
+    """
+
+    __slots__ = ('fields', 'top_k', 'drop', 'max_features', 'budget_tokens')
+
+    def __init__(self, fields: Tuple[str, ...], top_k: int = 5, drop: Tuple[str, ...] = (),
+                 max_features: int = 3, budget_tokens: Optional[int] = None):
+        self.fields = fields
+        self.top_k = top_k
+        self.drop = drop
+        self.max_features = max_features
+        self.budget_tokens = budget_tokens
+
+
+PROJECTIONS: Dict[str, Projection] = {
+    # Features stay (the shopping assistant quotes them); product URLs do not, the
+    # per-platform search links cover follow-up
+    'search_fitness_equipment': Projection(
+        ('title', 'brand', 'price', 'rating', 'features'), top_k=2, max_features=2),
+    'search_athletic_wear': Projection(
+        ('title', 'brand', 'price', 'rating', 'features', 'sizes'), top_k=2, max_features=2,
+        drop=('buying_guide',)),
+    'search_healthy_food': Projection(
+        ('title', 'platform', 'price', 'pack', 'nutrition', 'protein_per_rupee'),
+        top_k=20, drop=('platforms', 'recommendation')),  # the tool's own ``limit`` applies
+    'search_all_platforms': Projection(
+        ('title', 'price', 'rating', 'in_stock', 'delivery_mins'), top_k=3,
+        drop=('note', 'blinkit_note', 'instamart_note'))
+}
+
+
+def _enabled() -> bool:
+    return os.getenv('FITX_RESPONSE_SHAPING', '1').lower() not in ('0', 'false', 'no')
+
+
+def _default_budget() -> int:
+    return int(os.getenv('FITX_TOOL_TOKEN_BUDGET') or DEFAULT_TOKEN_BUDGET)
+
+
+def dumps(value: Any) -> str:
+    """Compact JSON text (no whitespace, UTF-8 kept as is); serializes Product records"""
+    if orjson is not None:
+        return orjson.dumps(value, default=to_jsonable).decode('utf-8')
+    return json.dumps(value, separators=(',', ':'), ensure_ascii=False, default=to_jsonable)
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count of text sent to the model"""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def _project(value: Any, projection: Projection, item_lists: List[list]) -> Any:
+    if isinstance(value, Product):
+        item = value.to_dict(projection.fields)
+        if 'features' in item:
+            item['features'] = item['features'][:projection.max_features]
+        return item
+    if isinstance(value, dict):
+        return {key: _project(item, projection, item_lists) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        if value and isinstance(value[0], Product):
+            items = [_project(item, projection, item_lists) for item in value[:projection.top_k]]
+            item_lists.append(items)
+            return items
+        return [_project(item, projection, item_lists) for item in value]
+    return value
+
+
+def shape_response(tool: str, result: Dict[str, Any], budget_tokens: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Shape a tool result for the model context.
+
+    Args:
+        tool: Tool name (key of PROJECTIONS; unknown tools are only serialized)
+        result: Tool result containing Product records
+        budget_tokens: Token cap overriding the tool's and the default budget
+
+    Returns:
+        JSON-safe result. When items had to be dropped to fit the budget,
+        ``truncated`` holds how many and the budget used.
+
+    Example:
+        >>> shape_response('search_fitness_equipment', results)
+        {'query': 'dumbbells', 'platforms': {'amazon': [{'title': ..., 'price': '₹999', ...}]}, ...}
+    """
+    projection = PROJECTIONS.get(tool)
+    if projection is None or not _enabled():
+        return serialize(result)
+
+    item_lists: List[list] = []
+    shaped = {key: _project(value, projection, item_lists)
+              for key, value in result.items() if key not in projection.drop}
+
+    budget = budget_tokens or projection.budget_tokens or _default_budget()
+    tokens = estimate_tokens(dumps(shaped))
+    omitted = 0
+    while tokens > budget:
+        # Drop the lowest-ranked item of the longest list until the result fits
+        longest = max(item_lists, key=len, default=None)
+        if not longest or len(longest) <= 1:
+            break
+        tokens -= estimate_tokens(dumps(longest.pop())) + 1
+        omitted += 1
+    if omitted:
+        shaped['truncated'] = {'omitted_items': omitted, 'budget_tokens': budget}
+    return shaped
@@ -1,10 +1,62 @@
 """
 FitX Shopping Tools - Search products across e-commerce platforms
+
+Results are built from Product records and shaped once, on return
+(per-tool projections and a token budget, see response_shaping).
 """
 
-from typing import Dict
+from typing import Dict, List
+
+from .instrumentation import instrument
+from .nutrition_table import (DEFAULT_SORT, NUTRIENTS, SORT_KEYS, diet_tags, get_nutrition_table,
+                              normalize_diet)
+from .product_catalog import get_product_catalog
+from .product_record import Product, format_price
+from .response_shaping import shape_response
+
+
+EQUIPMENT_RESULT_LIMIT = 6
+APPAREL_RESULT_LIMIT = 6
+FOOD_RESULT_LIMIT = 5
+
+PLATFORM_SEARCH_URLS = {
+    'amazon': 'amazon.in/search?q={}',
+    'flipkart': 'flipkart.com/search?q={}',
+    'myntra': 'myntra.com/search?q={}'
+}
+
+
+def _format_rating(rating) -> str:
+    return f'{rating}/5' if rating is not None else 'Not rated'
+
+
+def _catalog_product(product: Dict, *extra_fields: str) -> Product:
+    extra = {field: product[field] for field in extra_fields if product.get(field)}
+    return Product.from_dict(product, extra=extra or None)
+
 
+def _search_links(query: str, products: List[Product]) -> Dict[str, str]:
+    """One search link per platform for the query, instead of one per product"""
+    return {product.platform: PLATFORM_SEARCH_URLS[product.platform].format(query.replace(' ', '+'))
+            for product in products if product.platform in PLATFORM_SEARCH_URLS}
 
+
+def _recommendation(subject: str, products: List[Product]) -> str:
+    if not products:
+        return (f'No catalog matches for {subject}. Try a broader term '
+                f'(e.g. "dumbbells", "yoga mat", "running shoes").')
+    best = products[0]
+    cheapest = min((product for product in products if product.price_paise is not None),
+                   key=lambda product: product.price_paise, default=best)
+    text = (f'For {subject}, the {best.brand or ""} {best.title} is the closest match '
+            f'({format_price(best.price_paise)}, {_format_rating(best.rating)}).')
+    if cheapest is not best:
+        text += (f' If budget is a concern, the {cheapest.brand or ""} {cheapest.title} '
+                 f'at {format_price(cheapest.price_paise)} is a great starting point.')
+    return text
+
+
+@instrument
 def search_fitness_equipment(query: str, category: str = "fitness") -> Dict:
     """
     Search for fitness equipment across multiple platforms (Amazon, Flipkart).
@@ -24,210 +76,73 @@ def search_fitness_equipment(query: str, category: str = "fitness") -> Dict:
             "platforms": {...}
         }
     """
+    hits = get_product_catalog().search(
+        query,
+        kind='equipment',
+        boost_terms=() if category.lower() in ('fitness', 'any', 'all') else (category,),
+        limit=EQUIPMENT_RESULT_LIMIT
+    )
+    
+    products = [_catalog_product(product) for _, product in hits]
+    platforms: Dict[str, List[Product]] = {}
+    for product in products:
+        platforms.setdefault(product.platform, []).append(product)
+    
     results = {
         'query': query,
         'category': category,
-        'platforms': {
-            'amazon': [
-                {
-                    'name': f'{query} - Premium Quality',
-                    'price': '₹2,499',
-                    'rating': '4.5/5',
-                    'reviews': '1,234',
-                    'features': [
-                        'Durable construction',
-                        'High-quality materials',
-                        'Best seller',
-                        'Fast delivery available'
-                    ],
-                    'link': f'amazon.in/search?q={query.replace(" ", "+")}'
-                },
-                {
-                    'name': f'{query} - Budget Friendly',
-                    'price': '₹999',
-                    'rating': '4.2/5',
-                    'reviews': '856',
-                    'features': [
-                        'Value for money',
-                        'Good quality',
-                        'Suitable for beginners',
-                        'Prime delivery'
-                    ],
-                    'link': f'amazon.in/search?q={query.replace(" ", "+")}'
-                }
-            ],
-            'flipkart': [
-                {
-                    'name': f'{query} - Top Rated',
-                    'price': '₹1,899',
-                    'rating': '4.4/5',
-                    'reviews': '678',
-                    'features': [
-                        'Bestseller',
-                        'Fast delivery',
-                        'Great reviews',
-                        'FlipkartAssured'
-                    ],
-                    'link': f'flipkart.com/search?q={query.replace(" ", "+")}'
-                }
-            ]
-        },
-        'recommendation': f'For {query}, the Premium Quality option offers the best value for long-term use. '
-                          f'If budget is a concern, the Budget Friendly option is a great starting point.'
+        'platforms': platforms,
+        'links': _search_links(query, products),
+        'recommendation': _recommendation(query, products)
     }
-    return results
+    return shape_response('search_fitness_equipment', results)
 
 
-def search_healthy_food(dietary_type: str, meal_type: str = "any") -> Dict:
+@instrument
+def search_healthy_food(dietary_type: str, meal_type: str = "any", sort_by: str = "auto",
+                        limit: int = FOOD_RESULT_LIMIT) -> Dict:
     """
     Search for healthy food items on quick delivery platforms (Blinkit, Instamart).
     
     Args:
         dietary_type: Type of diet (e.g., 'high-protein', 'low-carb', 'vegan', 'keto')
         meal_type: Meal category (breakfast, lunch, dinner, snack, any)
+        sort_by: Ranking (auto, protein, protein_per_rupee, protein_density,
+                 fiber, net_carbs, calories, price)
+        limit: Maximum number of items
     
     Returns:
-        Dictionary containing food recommendations with nutritional info
+        Dictionary containing food recommendations with per-100g nutrition
     
     Example:
-        >>> search_healthy_food("high-protein", "breakfast")
+        >>> search_healthy_food("vegan", "breakfast", sort_by="protein_per_rupee")
         {
-            "dietary_type": "high-protein",
+            "dietary_type": "vegan",
             "meal_type": "breakfast",
-            "items": {...}
+            "ranked_by": "protein_per_rupee",
+            "items": [...]
         }
     """
+    diet = normalize_diet(dietary_type)
+    ranked_by = sort_by if sort_by in SORT_KEYS else DEFAULT_SORT[diet]
+    hits = get_nutrition_table().query(diet, meal_type, sort_by=ranked_by, limit=limit)
     
-    # Customize recommendations based on dietary type
-    if dietary_type.lower() in ['high-protein', 'high protein', 'protein']:
-        items = [
-            {
-                'name': 'Organic Chicken Breast',
-                'price': '₹350/kg',
-                'delivery': '10 mins',
-                'platform': 'Blinkit',
-                'nutrition': {
-                    'protein': '31g per 100g',
-                    'fat': '3.6g per 100g',
-                    'carbs': '0g',
-                    'calories': '165 kcal per 100g'
-                },
-                'benefits': 'Lean protein source, great for muscle building'
-            },
-            {
-                'name': 'Greek Yogurt (Plain)',
-                'price': '₹180/500g',
-                'delivery': '10 mins',
-                'platform': 'Blinkit',
-                'nutrition': {
-                    'protein': '10g per 100g',
-                    'fat': '5g per 100g',
-                    'carbs': '4g per 100g',
-                    'calories': '97 kcal per 100g'
-                },
-                'benefits': 'High protein, probiotics, versatile'
-            },
-            {
-                'name': 'Eggs (Pack of 12)',
-                'price': '₹84',
-                'delivery': '10 mins',
-                'platform': 'Blinkit',
-                'nutrition': {
-                    'protein': '6g per egg',
-                    'fat': '5g per egg',
-                    'carbs': '0.6g per egg',
-                    'calories': '78 kcal per egg'
-                },
-                'benefits': 'Complete protein, affordable, versatile'
-            }
-        ]
-    elif dietary_type.lower() in ['vegan', 'vegetarian']:
-        items = [
-            {
-                'name': 'Tofu (Firm)',
-                'price': '₹120/200g',
-                'delivery': '10 mins',
-                'platform': 'Blinkit',
-                'nutrition': {
-                    'protein': '8g per 100g',
-                    'fat': '4g per 100g',
-                    'carbs': '2g per 100g',
-                    'calories': '76 kcal per 100g'
-                },
-                'benefits': 'Plant protein, iron, calcium'
-            },
-            {
-                'name': 'Quinoa',
-                'price': '₹280/500g',
-                'delivery': '15 mins',
-                'platform': 'Swiggy Instamart',
-                'nutrition': {
-                    'protein': '4.4g per 100g cooked',
-                    'fat': '1.9g per 100g cooked',
-                    'carbs': '21g per 100g cooked',
-                    'calories': '120 kcal per 100g cooked'
-                },
-                'benefits': 'Complete protein, high fiber, gluten-free'
-            },
-            {
-                'name': 'Mixed Beans',
-                'price': '₹95/500g',
-                'delivery': '10 mins',
-                'platform': 'Blinkit',
-                'nutrition': {
-                    'protein': '7-9g per 100g',
-                    'fiber': '6-8g per 100g',
-                    'carbs': '20g per 100g',
-                    'calories': '127 kcal per 100g'
-                },
-                'benefits': 'High protein, fiber, various minerals'
-            }
-        ]
-    else:  # General healthy foods
-        items = [
-            {
-                'name': 'Fresh Vegetables Mix',
-                'price': '₹120/pack',
-                'delivery': '10 mins',
-                'platform': 'Blinkit',
-                'nutrition': {
-                    'fiber': 'High',
-                    'vitamins': 'A, C, K',
-                    'calories': 'Low (20-50 kcal per 100g)'
-                },
-                'benefits': 'Rich in vitamins, minerals, fiber'
-            },
-            {
-                'name': 'Brown Rice',
-                'price': '₹165/kg',
-                'delivery': '15 mins',
-                'platform': 'Swiggy Instamart',
-                'nutrition': {
-                    'protein': '2.6g per 100g cooked',
-                    'fiber': '1.8g per 100g cooked',
-                    'carbs': '23g per 100g cooked',
-                    'calories': '111 kcal per 100g cooked'
-                },
-                'benefits': 'Complex carbs, fiber, minerals'
-            },
-            {
-                'name': 'Mixed Nuts (Unsalted)',
-                'price': '₹299/250g',
-                'delivery': '10 mins',
-                'platform': 'Blinkit',
-                'nutrition': {
-                    'protein': '6-7g per 30g',
-                    'healthy fats': '14-16g per 30g',
-                    'fiber': '2-3g per 30g',
-                    'calories': '170-180 kcal per 30g'
-                },
-                'benefits': 'Healthy fats, protein, vitamin E'
-            }
-        ]
+    items = []
+    for _, food in hits:
+        items.append(Product.from_dict(food, extra={
+            'pack': food['pack'],
+            'nutrition': {nutrient: food.get(nutrient, 0) for nutrient in NUTRIENTS},
+            'protein_per_rupee': round(food['protein_g'] * food['pack_grams'] / food['price_paise'], 2)
+            if food.get('price_paise') else None,
+            'diet_tags': sorted(diet_tags(food)),
+            'benefits': food.get('benefits', '')
+        }))
     
     results = {
         'dietary_type': dietary_type,
         'meal_type': meal_type,
+        'ranked_by': ranked_by,
+        'nutrition_per': '100g',
         'items': items,
         'platforms': {
             'blinkit': 'Ultra-fast delivery (10 minutes) - Available in most major cities',
@@ -237,9 +152,10 @@ def search_healthy_food(dietary_type: str, meal_type: str = "any") -> Dict:
                           f'These items can be delivered quickly and support your fitness goals.'
     }
     
-    return results
+    return shape_response('search_healthy_food', results)
 
 
+@instrument
 def search_athletic_wear(item_type: str, activity: str = "general") -> Dict:
     """
     Search for athletic wear and footwear on e-commerce platforms (Myntra, Amazon, Flipkart).
@@ -259,95 +175,23 @@ def search_athletic_wear(item_type: str, activity: str = "general") -> Dict:
             "recommendations": {...}
         }
     """
+    hits = get_product_catalog().search(
+        item_type,
+        kind='apparel',
+        boost_terms=() if activity.lower() in ('general', 'any', 'all') else (activity,),
+        limit=APPAREL_RESULT_LIMIT
+    )
+    
+    products = [_catalog_product(product, 'sizes', 'colors') for _, product in hits]
+    recommendations: Dict[str, List[Product]] = {}
+    for product in products:
+        recommendations.setdefault(product.platform, []).append(product)
+    
     results = {
         'item_type': item_type,
         'activity': activity,
-        'recommendations': {
-            'myntra': [
-                {
-                    'brand': 'Nike',
-                    'name': f'{item_type} - Pro Series',
-                    'price': '₹2,999',
-                    'features': [
-                        'Breathable mesh fabric',
-                        'Moisture-wicking technology',
-                        'Comfortable fit',
-                        'Durable construction',
-                        'Stylish design'
-                    ],
-                    'rating': '4.6/5',
-                    'reviews': '2,145',
-                    'sizes': 'S, M, L, XL, XXL',
-                    'colors': '5 colors available',
-                    'link': f'myntra.com/search?q={item_type.replace(" ", "+")}'
-                },
-                {
-                    'brand': 'Puma',
-                    'name': f'{item_type} - Active Fit',
-                    'price': '₹1,999',
-                    'features': [
-                        'Flexible and stretchable',
-                        'Durable fabric',
-                        'Stylish athletic design',
-                        'Good value for money',
-                        'dryCELL technology'
-                    ],
-                    'rating': '4.4/5',
-                    'reviews': '1,567',
-                    'sizes': 'XS, S, M, L, XL',
-                    'colors': '3 colors available',
-                    'link': f'myntra.com/search?q={item_type.replace(" ", "+")}'
-                },
-                {
-                    'brand': 'Adidas',
-                    'name': f'{item_type} - Essential',
-                    'price': '₹1,599',
-                    'features': [
-                        'Comfortable daily wear',
-                        'Classic design',
-                        'Good quality',
-                        'Budget-friendly'
-                    ],
-                    'rating': '4.3/5',
-                    'reviews': '987',
-                    'sizes': 'S, M, L, XL',
-                    'colors': '4 colors available',
-                    'link': f'myntra.com/search?q={item_type.replace(" ", "+")}'
-                }
-            ],
-            'amazon': [
-                {
-                    'brand': 'Adidas',
-                    'name': f'{item_type} - Performance',
-                    'price': '₹2,499',
-                    'features': [
-                        'Premium quality',
-                        'Long-lasting',
-                        'Professional grade',
-                        'Amazon Prime delivery'
-                    ],
-                    'rating': '4.5/5',
-                    'reviews': '3,421',
-                    'link': f'amazon.in/search?q={item_type.replace(" ", "+")}'
-                }
-            ],
-            'flipkart': [
-                {
-                    'brand': 'Reebok',
-                    'name': f'{item_type} - Workout Ready',
-                    'price': '₹1,799',
-                    'features': [
-                        'Great value',
-                        'Comfortable',
-                        'Good for workouts',
-                        'Fast delivery'
-                    ],
-                    'rating': '4.2/5',
-                    'reviews': '734',
-                    'link': f'flipkart.com/search?q={item_type.replace(" ", "+")}'
-                }
-            ]
-        },
+        'recommendations': recommendations,
+        'links': _search_links(item_type, products),
         'buying_guide': {
             'fit': 'Choose true to size, consider trying before buying if possible',
             'material': 'Look for breathable, moisture-wicking fabrics',
@@ -355,9 +199,7 @@ def search_athletic_wear(item_type: str, activity: str = "general") -> Dict:
             'quality': 'Invest in good quality for frequently used items',
             'price': 'Balance budget with quality - mid-range often offers best value'
         },
-        'recommendation': f'For {item_type} for {activity}, the Nike Pro Series offers premium quality, '
-                          f'while Puma Active Fit provides excellent value. Choose based on your budget '
-                          f'and how frequently you\'ll use them.'
+        'recommendation': _recommendation(f'{item_type} for {activity}', products)
     }
     
-    return results
+    return shape_response('search_athletic_wear', results)
@@ -0,0 +1,251 @@
+"""
+FitX Tracking History - Compact columnar per-user workout and meal history
+"""
+
+import threading
+from array import array
+from datetime import date
+from typing import Dict, List, Optional
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; metrics fall back to pure Python
+    np = None
+
+from .event_store import EventProjection, get_event_store
+from .progress_aggregates import day_ordinal
+
+
+INTENSITIES = ('low', 'moderate', 'high', 'very_high')
+MEAL_TYPES = ('breakfast', 'lunch', 'dinner', 'snack')
+INTENSITY_CODES = {name: code for code, name in enumerate(INTENSITIES)}
+MEAL_TYPE_CODES = {name: code for code, name in enumerate(MEAL_TYPES)}
+
+INT16_MAX = 2 ** 15 - 1
+INT32_MAX = 2 ** 31 - 1
+
+
+def _clamp(value, upper: int) -> int:
+    return min(max(int(value or 0), 0), upper)
+
+
+def _view(column: array):
+    """
+    Zero-copy NumPy view over an ``array`` column (or the column itself).
+
+    While a view is alive the column cannot grow (``BufferError``), so views
+    must only exist under ``TrackingHistory._lock`` and never be returned.
+    """
+    return np.asarray(memoryview(column)) if np is not None else column
+
+
+class WorkoutColumns:
+    """Parallel typed arrays, one row per logged workout."""
+
+    __slots__ = ('ts', 'day', 'exercise', 'intensity', 'duration', 'calories')
+
+    def __init__(self):
+        self.ts = array('q')         # epoch seconds
+        self.day = array('i')        # local calendar day ordinal
+        self.exercise = array('I')   # index into TrackingHistory.exercises
+        self.intensity = array('B')  # index into INTENSITIES
+        self.duration = array('h')   # minutes
+        self.calories = array('i')
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+
+class MealColumns:
+    """Parallel typed arrays, one row per logged meal."""
+
+    __slots__ = ('ts', 'day', 'meal_type', 'item_count', 'calories')
+
+    def __init__(self):
+        self.ts = array('q')
+        self.day = array('i')
+        self.meal_type = array('B')  # index into MEAL_TYPES
+        self.item_count = array('H')
+        self.calories = array('i')
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+
+class UserHistory:
+    """
+    Columnar workout and meal history for a single user.
+
+    Methods read the live columns; call them under ``TrackingHistory._lock``
+    (or on a history no longer being appended to).
+    """
+
+    __slots__ = ('workouts', 'meals')
+
+    def __init__(self):
+        self.workouts = WorkoutColumns()
+        self.meals = MealColumns()
+
+    def workout_window(self, start_day: int, end_day: int) -> Dict[str, int]:
+        """Workout count, minutes and calories over [start_day, end_day]."""
+        w = self.workouts
+        if np is not None:
+            days = _view(w.day)
+            mask = (days >= start_day) & (days <= end_day)
+            return {
+                'workouts': int(mask.sum()),
+                'active_minutes': int(_view(w.duration)[mask].sum(dtype=np.int64)),
+                'calories_burned': int(_view(w.calories)[mask].sum(dtype=np.int64))
+            }
+        rows = [i for i, day in enumerate(w.day) if start_day <= day <= end_day]
+        return {
+            'workouts': len(rows),
+            'active_minutes': sum(w.duration[i] for i in rows),
+            'calories_burned': sum(w.calories[i] for i in rows)
+        }
+
+    def active_days(self) -> List[int]:
+        """Sorted distinct day ordinals with at least one workout."""
+        if np is not None:
+            return np.unique(_view(self.workouts.day)).tolist()
+        return sorted(set(self.workouts.day))
+
+    def active_day_count(self, start_day: int, end_day: int) -> int:
+        """Distinct workout days in [start_day, end_day]."""
+        if np is not None:
+            days = _view(self.workouts.day)
+            return len(np.unique(days[(days >= start_day) & (days <= end_day)]))
+        return len({day for day in self.workouts.day if start_day <= day <= end_day})
+
+    def streaks(self, today: int) -> Dict[str, int]:
+        """
+        Current and longest runs of consecutive workout days.
+
+        The current streak stays alive through today if the last workout was
+        yesterday, so it does not reset before the user has had a chance to
+        train today.
+        """
+        if not len(self.workouts):
+            return {'current_streak': 0, 'longest_streak': 0}
+        if np is not None:
+            days = np.unique(_view(self.workouts.day))
+            breaks = np.flatnonzero(np.diff(days) != 1)
+            run_starts = np.concatenate(([0], breaks + 1))
+            run_ends = np.concatenate((breaks + 1, [len(days)]))
+            lengths = run_ends - run_starts
+            longest = int(lengths.max())
+            last_run = int(lengths[-1])
+            last_day = int(days[-1])
+        else:
+            days = self.active_days()
+            longest = last_run = 1
+            for prev, day in zip(days, days[1:]):
+                last_run = last_run + 1 if day == prev + 1 else 1
+                longest = max(longest, last_run)
+            last_day = days[-1]
+        current = last_run if last_day >= today - 1 else 0
+        return {'current_streak': current, 'longest_streak': longest}
+
+
+class TrackingHistory(EventProjection):
+    """
+    Per-user columnar history built from the event store.
+
+    Rows hold epoch ints, interned exercise names, enum-coded intensity and
+    meal type, int16 durations and int32 calories instead of the nested
+    dicts returned by the logging tools, so analytics run as vectorized
+    passes over typed buffers.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.exercises: List[str] = []
+        self._exercise_codes: Dict[str, int] = {}
+        self._users: Dict[str, UserHistory] = {}
+        self._lock = threading.Lock()
+
+    def _intern_exercise(self, name: str) -> int:
+        key = name.strip().lower()
+        code = self._exercise_codes.get(key)
+        if code is None:
+            code = self._exercise_codes[key] = len(self.exercises)
+            self.exercises.append(key)
+        return code
+
+    def _apply(self, event: Dict) -> None:
+        kind = event.get('type')
+        if kind not in ('workout', 'meal'):
+            return
+        ts = event['ts']
+        with self._lock:
+            history = self._users.get(event['user_id'])
+            if history is None:
+                history = self._users[event['user_id']] = UserHistory()
+            if kind == 'workout':
+                w = history.workouts
+                w.ts.append(int(ts))
+                w.day.append(day_ordinal(ts))
+                w.exercise.append(self._intern_exercise(event.get('exercise') or ''))
+                w.intensity.append(INTENSITY_CODES.get(event.get('intensity'), INTENSITY_CODES['moderate']))
+                w.duration.append(_clamp(event.get('duration'), INT16_MAX))
+                w.calories.append(_clamp(event.get('calories'), INT32_MAX))
+            else:
+                m = history.meals
+                m.ts.append(int(ts))
+                m.day.append(day_ordinal(ts))
+                m.meal_type.append(MEAL_TYPE_CODES.get(event.get('meal_type'), MEAL_TYPE_CODES['snack']))
+                m.item_count.append(min(len(event.get('items') or ()), 2 ** 16 - 1))
+                m.calories.append(_clamp(event.get('calories'), INT32_MAX))
+
+    def get(self, user_id: str) -> UserHistory:
+        """History for ``user_id`` (empty if the user has logged nothing)."""
+        return self._users.get(user_id) or UserHistory()
+
+    def trends(self, user_id: str, days: int = 7, today: Optional[date] = None) -> Dict:
+        """
+        Compare the last ``days`` days with the ``days`` days before them.
+
+        Args:
+            user_id: User whose history to analyze
+            days: Period length in days (default: 7 for week-over-week)
+            today: Last day of the current period (defaults to the local date)
+
+        Returns:
+            Dictionary with current/previous totals, percentage changes,
+            active-day consistency and current/longest workout streaks
+        """
+        end_day = (today or date.today()).toordinal()
+        with self._lock:
+            # Column views are created and dropped inside these calls, under the lock
+            history = self.get(user_id)
+            current = history.workout_window(end_day - days + 1, end_day)
+            previous = history.workout_window(end_day - 2 * days + 1, end_day - days)
+            active = history.active_day_count(end_day - days + 1, end_day)
+            streaks = history.streaks(end_day)
+
+        change = {
+            key: (round((current[key] - previous[key]) / previous[key] * 100) if previous[key] else None)
+            for key in current
+        }
+        return {
+            'current_period': current,
+            'previous_period': previous,
+            'change_percent': change,
+            'active_days': active,
+            'active_day_ratio': round(active / days, 2) if days else 0,
+            'streaks': streaks
+        }
+
+
+_default_history: Optional[TrackingHistory] = None
+_default_history_lock = threading.Lock()
+
+
+def get_tracking_history() -> TrackingHistory:
+    """Return the process-wide columnar history, replaying the event store on first use."""
+    global _default_history
+    if _default_history is None:
+        with _default_history_lock:
+            if _default_history is None:
+                _default_history = TrackingHistory.from_store(get_event_store())
+    return _default_history
@@ -2,11 +2,99 @@
 FitX Tracking Tools - Log workouts, meals, and retrieve progress summaries
 """
 
-from typing import Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
 
+from .achievements import get_achievement_index
+from .event_store import get_event_store
+from .instrumentation import instrument
+from .progress_aggregates import day_ordinal, get_progress_aggregates
+from .tracking_history import INTENSITIES, MEAL_TYPES, get_tracking_history
 
-def log_workout(exercise: str, duration: int, intensity: str, calories: int) -> Dict:
+
+DEFAULT_USER_ID = 'default'
+BULK_BATCH_SIZE = 5000
+MAX_REPORTED_ERRORS = 100
+
+
+def _resolve_user_id(tool_context) -> str:
+    """Return the session user id injected by ADK, or the local default user."""
+    return getattr(tool_context, 'user_id', None) or DEFAULT_USER_ID
+
+
+def _amount(value: Any, name: str) -> int:
+    """
+    Whole, non-negative minutes or calories from a number or numeric string.
+
+    Raises:
+        ValueError: The value is missing, not numeric, not finite or negative
+    """
+    try:
+        number = int(float(value))  # inf raises OverflowError, nan ValueError
+    except (TypeError, ValueError, OverflowError):
+        raise ValueError(f'invalid {name}: {value!r}') from None
+    if number < 0:
+        raise ValueError(f'invalid {name}: {value!r}')
+    return number
+
+
+def _check_event(event: Dict) -> None:
+    """
+    Reject an event the projections could not fold, before it is persisted.
+
+    Raises:
+        ValueError: Timestamp outside the calendar range, or a duration or
+                    calorie count that is not a non-negative finite number
+    """
+    try:
+        day_ordinal(event['ts'])
+    except (TypeError, ValueError, OverflowError, OSError):
+        raise ValueError(f"invalid timestamp: {event.get('ts')!r}") from None
+    for field in ('duration', 'calories'):
+        if field in event:
+            _amount(event[field], field)
+
+
+def _record_event(event: Dict) -> List[Dict]:
+    """
+    Persist a tracking event and fold it into the in-memory projections.
+    
+    Returns:
+        Achievements (personal records, milestones) earned by this event
+
+    Raises:
+        ValueError: The event is invalid (nothing is stored)
+    """
+    _check_event(event)
+    event['seq'] = get_event_store().append(event)
+    get_progress_aggregates().apply(event)
+    get_tracking_history().apply(event)
+    return get_achievement_index().apply(event) or []
+
+
+def record_events(events: List[Dict]) -> None:
+    """
+    Persist a batch of tracking events with a single store append.
+
+    Raises:
+        ValueError: An event is invalid (nothing from the batch is stored)
+    """
+    for event in events:
+        _check_event(event)
+    seqs = get_event_store().append_many(events)
+    aggregates = get_progress_aggregates()
+    history = get_tracking_history()
+    achievements = get_achievement_index()
+    for event, seq in zip(events, seqs):
+        event['seq'] = seq
+        aggregates.apply(event)
+        history.apply(event)
+        achievements.apply(event)
+
+
+@instrument
+def log_workout(exercise: str, duration: int, intensity: str, calories: int,
+                tool_context=None) -> Dict:
     """
     Log a completed workout session with details.
     
@@ -15,9 +103,11 @@ def log_workout(exercise: str, duration: int, intensity: str, calories: int) ->
         duration: Duration in minutes
         intensity: Workout intensity ('low', 'moderate', 'high', 'very_high')
         calories: Estimated calories burned
+        tool_context: ADK tool context (injected; identifies the user)
     
     Returns:
-        Dictionary with workout log entry and confirmation message
+        Dictionary with workout log entry and confirmation message, or
+        with 'error' if duration or calories is negative or not a number
     
     Example:
         >>> log_workout("strength training", 45, "high", 350)
@@ -28,10 +118,17 @@ def log_workout(exercise: str, duration: int, intensity: str, calories: int) ->
             "intensity": "high",
             "estimated_calories": 350,
             "status": "completed",
-            "message": "Great job! You completed strength training for 45 minutes..."
+            "message": "Great job! You completed strength training for 45 minutes...",
+            "achievements": [{"type": "milestone", "milestone": "10 workouts logged"}]
         }
     """
     
+    try:
+        duration = _amount(duration, 'duration')
+        calories = _amount(calories, 'calories')
+    except ValueError as e:
+        return {'status': 'rejected', 'error': str(e), 'message': f'Workout not logged: {e}'}
+
     # Validate intensity
     valid_intensities = ['low', 'moderate', 'high', 'very_high']
     if intensity.lower() not in valid_intensities:
@@ -45,8 +142,9 @@ def log_workout(exercise: str, duration: int, intensity: str, calories: int) ->
         'very_high': f'🔥 Incredible! {duration} minutes of very high intensity {exercise} - you crushed it!'
     }
     
+    now = datetime.now()
     workout_log = {
-        'timestamp': datetime.now().isoformat(),
+        'timestamp': now.isoformat(),
         'exercise': exercise,
         'duration_minutes': duration,
         'intensity': intensity,
@@ -60,10 +158,22 @@ def log_workout(exercise: str, duration: int, intensity: str, calories: int) ->
         }
     }
     
+    workout_log['achievements'] = _record_event({
+        'type': 'workout',
+        'user_id': _resolve_user_id(tool_context),
+        'ts': now.timestamp(),
+        'exercise': exercise,
+        'duration': duration,
+        'intensity': intensity.lower(),
+        'calories': calories
+    })
+    
     return workout_log
 
 
-def log_meal(meal_type: str, food_items: List[str], calories: int) -> Dict:
+@instrument
+def log_meal(meal_type: str, food_items: List[str], calories: int,
+             tool_context=None) -> Dict:
     """
     Log a meal intake with nutritional information.
     
@@ -71,9 +181,11 @@ def log_meal(meal_type: str, food_items: List[str], calories: int) -> Dict:
         meal_type: Type of meal ('breakfast', 'lunch', 'dinner', 'snack')
         food_items: List of food items consumed
         calories: Total estimated calories for the meal
+        tool_context: ADK tool context (injected; identifies the user)
     
     Returns:
-        Dictionary with meal log entry and confirmation message
+        Dictionary with meal log entry and confirmation message, or with
+        'error' if calories is negative or not a number
     
     Example:
         >>> log_meal("breakfast", ["eggs", "toast", "avocado"], 450)
@@ -87,6 +199,11 @@ def log_meal(meal_type: str, food_items: List[str], calories: int) -> Dict:
         }
     """
     
+    try:
+        calories = _amount(calories, 'calories')
+    except ValueError as e:
+        return {'status': 'rejected', 'error': str(e), 'message': f'Meal not logged: {e}'}
+
     # Validate meal type
     valid_meal_types = ['breakfast', 'lunch', 'dinner', 'snack']
     if meal_type.lower() not in valid_meal_types:
@@ -110,8 +227,9 @@ def log_meal(meal_type: str, food_items: List[str], calories: int) -> Dict:
     else:
         size = 'large'
     
+    now = datetime.now()
     meal_log = {
-        'timestamp': datetime.now().isoformat(),
+        'timestamp': now.isoformat(),
         'meal_type': meal_type.lower(),
         'items': food_items,
         'item_count': len(food_items),
@@ -123,15 +241,26 @@ def log_meal(meal_type: str, food_items: List[str], calories: int) -> Dict:
         'tracking_note': f'Great job tracking! Consistency is key to reaching your goals.'
     }
     
+    _record_event({
+        'type': 'meal',
+        'user_id': _resolve_user_id(tool_context),
+        'ts': now.timestamp(),
+        'meal_type': meal_type.lower(),
+        'items': food_items,
+        'calories': calories
+    })
+    
     return meal_log
 
 
-def get_progress_summary(days: int = 7) -> Dict:
+@instrument
+def get_progress_summary(days: int = 7, tool_context=None) -> Dict:
     """
     Get a comprehensive fitness progress summary over a specified period.
     
     Args:
         days: Number of days to look back (default: 7 for weekly summary)
+        tool_context: ADK tool context (injected; identifies the user)
     
     Returns:
         Dictionary containing progress statistics and insights
@@ -146,8 +275,7 @@ def get_progress_summary(days: int = 7) -> Dict:
         }
     """
     
-    # In a real implementation, this would query a database
-    # For now, returning mock data structure with realistic values
+    days = max(int(days), 1)
     
     # Calculate period description
     if days == 1:
@@ -159,10 +287,16 @@ def get_progress_summary(days: int = 7) -> Dict:
     else:
         period_desc = f"Last {days} days"
     
-    # Mock data - in production, this would be actual user data
-    workouts = 5 if days >= 7 else min(days, 2)
-    total_calories = workouts * 350  # Average ~350 per workout
-    avg_duration = 45
+    # Rolling-window totals from the per-day aggregates (O(1) per call)
+    totals = get_progress_aggregates().window(_resolve_user_id(tool_context), days)
+    workouts = totals['workouts']
+    total_calories = totals['calories_burned']
+    active_minutes = totals['active_minutes']
+    avg_duration = round(active_minutes / workouts) if workouts > 0 else 0
+    # Week-over-week trends, active days and streaks from the columnar history
+    trends = get_tracking_history().trends(_resolve_user_id(tool_context), days)
+    streaks = trends['streaks']
+    next_milestone = get_achievement_index().summary(_resolve_user_id(tool_context))['next_milestone']
     
     # Calculate consistency percentage
     target_workouts = days if days <= 7 else 5  # Target 5 workouts per week
@@ -180,9 +314,18 @@ def get_progress_summary(days: int = 7) -> Dict:
     else:
         insights.append('📈 Room for improvement! Consistency is key - let\'s get back on track.')
     
+    if streaks['current_streak'] >= 3:
+        insights.append(f'🔥 {streaks["current_streak"]}-day workout streak - keep it alive!')
+    
     if workouts > 0:
         insights.append(f'You burned an estimated {total_calories} calories through exercise.')
     
+    workout_change = trends['change_percent']['workouts']
+    if workout_change is not None and workout_change > 0:
+        insights.append(f'📊 {workout_change}% more workouts than the previous {days} days.')
+    elif workout_change is not None and workout_change < 0:
+        insights.append(f'📉 {abs(workout_change)}% fewer workouts than the previous {days} days.')
+    
     if days >= 7:
         insights.append('Focus on progressive overload to continue seeing results.')
         insights.append('Don\'t forget recovery - rest days are when muscles grow!')
@@ -197,17 +340,27 @@ def get_progress_summary(days: int = 7) -> Dict:
         'workout_stats': {
             'workouts_completed': workouts,
             'target_workouts': target_workouts,
-            'total_active_minutes': workouts * avg_duration,
+            'total_active_minutes': active_minutes,
             'average_workout_duration': avg_duration,
             'total_calories_burned': total_calories,
             'average_calories_per_workout': round(total_calories / workouts) if workouts > 0 else 0
         },
+        'nutrition_stats': {
+            'meals_logged': totals['meals'],
+            'total_meal_calories': totals['meal_calories'],
+            'average_daily_intake': round(totals['meal_calories'] / days)
+        },
         'consistency': {
             'percentage': f'{consistency}%',
             'rating': 'Excellent' if consistency >= 80 else 
                      'Good' if consistency >= 60 else
                      'Fair' if consistency >= 40 else 'Needs Improvement',
-            'workout_frequency': f'{workouts} workouts in {days} days'
+            'workout_frequency': f'{workouts} workouts in {days} days',
+            'active_days': trends['active_days']
+        },
+        'trends': {
+            'previous_period': trends['previous_period'],
+            'change_percent': trends['change_percent']
         },
         'goal_progress': {
             'percentage': f'{round(goal_progress)}%',
@@ -223,12 +376,252 @@ def get_progress_summary(days: int = 7) -> Dict:
             'Increase intensity gradually for continued progress',
             'Celebrate small wins - consistency compounds!'
         ],
+        'streaks': {
+            'current': streaks['current_streak'],
+            'longest': streaks['longest_streak']
+        },
         'next_milestone': {
-            'target': '10 consecutive workouts',
-            'current': workouts,
-            'remaining': max(0, 10 - workouts),
-            'message': f'Only {max(0, 10 - workouts)} more workouts to hit your next milestone!'
+            **next_milestone,
+            'message': f'Only {next_milestone["remaining"]} more workouts to hit your next milestone!'
         }
     }
     
     return summary
+
+
+@instrument
+def get_achievements(exercise: str = None, tool_context=None) -> Dict:
+    """
+    Get workout streaks, personal records and milestones.
+    
+    Args:
+        exercise: Limit personal records to one exercise (default: all exercises)
+        tool_context: ADK tool context (injected; identifies the user)
+    
+    Returns:
+        Dictionary with current/longest streak, personal records per
+        exercise, milestones achieved and the next milestone
+    
+    Example:
+        >>> get_achievements("cardio")
+        {
+            "current_streak": 4,
+            "longest_streak": 12,
+            "personal_records": {"cardio": {"best_duration_minutes": 60, ...}},
+            ...
+        }
+    """
+    user_id = _resolve_user_id(tool_context)
+    index = get_achievement_index()
+    summary = index.summary(user_id)
+    summary['personal_records'] = index.personal_records(user_id, exercise)
+    return summary
+
+
+# ==================== BULK INGEST ====================
+
+def _first(row: Dict, *keys: str) -> Any:
+    if not isinstance(row, dict):
+        return None
+    for key in keys:
+        value = row.get(key)
+        if value not in (None, ''):
+            return value
+    return None
+
+
+def _row_errors(rows: List[Any]) -> List[Optional[str]]:
+    # Rows that are not objects are reported, not fatal to the batch
+    return [None if isinstance(row, dict) else f'expected an object, got {type(row).__name__}'
+            for row in rows]
+
+
+def _int_column(values: List[Any], name: str, errors: List[Optional[str]]) -> List[int]:
+    column = []
+    for i, value in enumerate(values):
+        try:
+            number = _amount(value, name)
+        except ValueError as e:
+            errors[i] = errors[i] or str(e)
+            number = 0
+        column.append(number)
+    return column
+
+
+def _timestamp_column(values: List[Any], errors: List[Optional[str]]) -> List[float]:
+    now = datetime.now().timestamp()
+    column = []
+    for i, value in enumerate(values):
+        ts = now
+        if value is not None:
+            try:
+                try:
+                    ts = float(value)
+                except (TypeError, ValueError):
+                    ts = datetime.fromisoformat(str(value)).timestamp()
+                # Rejects nan/inf and epochs outside the calendar (e.g. milliseconds)
+                datetime.fromtimestamp(ts)
+            except (ValueError, OverflowError, OSError):
+                errors[i] = errors[i] or f'invalid timestamp: {value!r}'
+                ts = now
+        column.append(ts)
+    return column
+
+
+def _enum_column(values: List[Any], allowed: Tuple[str, ...], default: str, name: str,
+                 errors: List[Optional[str]]) -> List[str]:
+    column = [str(value).strip().lower() if value is not None else default for value in values]
+    allowed_set = set(allowed)
+    for i, value in enumerate(column):
+        if value not in allowed_set:
+            errors[i] = errors[i] or f'invalid {name}: {values[i]!r}'
+    return column
+
+
+def _items_column(values: List[Any], errors: List[Optional[str]]) -> List[List[str]]:
+    column = []
+    for i, value in enumerate(values):
+        if isinstance(value, str):
+            items = [item.strip() for item in value.replace(';', ',').split(',') if item.strip()]
+        elif isinstance(value, (list, tuple)):
+            items = [str(item) for item in value]
+        else:
+            items = []
+        if not items:
+            errors[i] = errors[i] or 'missing food items'
+        column.append(items)
+    return column
+
+
+def validate_workout_rows(rows: List[Dict], user_id: str) -> Tuple[List[Dict], List[Dict]]:
+    """
+    Validate workout rows column by column and build store events.
+
+    Returns:
+        Tuple of (events for valid rows, per-row error dicts)
+    """
+    errors = _row_errors(rows)
+    exercises = [_first(row, 'exercise') for row in rows]
+    for i, exercise in enumerate(exercises):
+        if not exercise:
+            errors[i] = errors[i] or 'missing exercise'
+    intensities = _enum_column([_first(row, 'intensity') for row in rows],
+                               INTENSITIES, 'moderate', 'intensity', errors)
+    durations = _int_column([_first(row, 'duration', 'duration_minutes') for row in rows],
+                            'duration', errors)
+    calories = _int_column([_first(row, 'calories', 'estimated_calories') for row in rows],
+                           'calories', errors)
+    timestamps = _timestamp_column([_first(row, 'timestamp', 'ts') for row in rows], errors)
+
+    events = [
+        {'type': 'workout', 'user_id': user_id, 'ts': timestamps[i], 'exercise': str(exercises[i]),
+         'duration': durations[i], 'intensity': intensities[i], 'calories': calories[i]}
+        for i in range(len(rows)) if errors[i] is None
+    ]
+    return events, [{'row': i, 'error': error} for i, error in enumerate(errors) if error]
+
+
+def validate_meal_rows(rows: List[Dict], user_id: str) -> Tuple[List[Dict], List[Dict]]:
+    """
+    Validate meal rows column by column and build store events.
+
+    Returns:
+        Tuple of (events for valid rows, per-row error dicts)
+    """
+    errors = _row_errors(rows)
+    meal_types = _enum_column([_first(row, 'meal_type') for row in rows],
+                              MEAL_TYPES, 'snack', 'meal_type', errors)
+    items = _items_column([_first(row, 'items', 'food_items') for row in rows], errors)
+    calories = _int_column([_first(row, 'calories', 'estimated_calories') for row in rows],
+                           'calories', errors)
+    timestamps = _timestamp_column([_first(row, 'timestamp', 'ts') for row in rows], errors)
+
+    events = [
+        {'type': 'meal', 'user_id': user_id, 'ts': timestamps[i], 'meal_type': meal_types[i],
+         'items': items[i], 'calories': calories[i]}
+        for i in range(len(rows)) if errors[i] is None
+    ]
+    return events, [{'row': i, 'error': error} for i, error in enumerate(errors) if error]
+
+
+def _bulk_log(rows: List[Dict], validate, user_id: str, kind: str) -> Dict:
+    # Validate every row before anything is appended
+    batches = []
+    errors = []
+    for start in range(0, len(rows), BULK_BATCH_SIZE):
+        events, batch_errors = validate(rows[start:start + BULK_BATCH_SIZE], user_id)
+        batches.append(events)
+        for error in batch_errors:
+            error['row'] += start
+        errors.extend(batch_errors)
+
+    accepted = 0
+    for events in batches:
+        if events:
+            record_events(events)
+        accepted += len(events)
+
+    return {
+        'status': 'completed' if not errors else 'completed_with_errors',
+        'type': kind,
+        'rows_received': len(rows),
+        'rows_logged': accepted,
+        'rows_rejected': len(errors),
+        'errors': errors[:MAX_REPORTED_ERRORS],
+        'errors_truncated': len(errors) > MAX_REPORTED_ERRORS,
+        'message': f'Imported {accepted} of {len(rows)} {kind} entries.'
+    }
+
+
+@instrument
+def bulk_log_workouts(workouts: List[Dict], tool_context=None) -> Dict:
+    """
+    Log many past workouts in one call (e.g. history from another tracker).
+    
+    Args:
+        workouts: Workout entries with 'exercise', 'duration', 'intensity',
+                  'calories' and optional 'timestamp' (ISO string or epoch)
+        tool_context: ADK tool context (injected; identifies the user)
+    
+    Returns:
+        Dictionary with import counts and per-row validation errors
+    
+    Example:
+        >>> bulk_log_workouts([{"exercise": "cardio", "duration": 30,
+        ...                     "intensity": "moderate", "calories": 250,
+        ...                     "timestamp": "2025-11-20T07:00:00"}])
+        {
+            "status": "completed",
+            "rows_logged": 1,
+            "rows_rejected": 0,
+            ...
+        }
+    """
+    return _bulk_log(workouts, validate_workout_rows, _resolve_user_id(tool_context), 'workout')
+
+
+@instrument
+def bulk_log_meals(meals: List[Dict], tool_context=None) -> Dict:
+    """
+    Log many past meals in one call (e.g. history from another tracker).
+    
+    Args:
+        meals: Meal entries with 'meal_type', 'items', 'calories' and
+               optional 'timestamp' (ISO string or epoch)
+        tool_context: ADK tool context (injected; identifies the user)
+    
+    Returns:
+        Dictionary with import counts and per-row validation errors
+    
+    Example:
+        >>> bulk_log_meals([{"meal_type": "breakfast", "items": ["eggs", "toast"],
+        ...                  "calories": 350, "timestamp": "2025-11-20T08:30:00"}])
+        {
+            "status": "completed",
+            "rows_logged": 1,
+            "rows_rejected": 0,
+            ...
+        }
+    """
+    return _bulk_log(meals, validate_meal_rows, _resolve_user_id(tool_context), 'meal')
+
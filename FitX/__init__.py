@@ -3,6 +3,15 @@ FitX AI - Multi-Agent Fitness Assistant
 Built with Google Agent Development Kit (ADK)
 """
 
-from .agent import root_agent
+import importlib
 
 
+def __getattr__(name):
+    # Importing the package stays cheap; the agent tree is built on first access.
+    # import_module, not "from . import agent": the latter probes this hook
+    # for "agent" again before importing the submodule and recurses.
+    if name in ('agent', 'root_agent'):
+        agent = importlib.import_module(f'{__name__}.agent')
+        globals()['agent'] = agent
+        return agent if name == 'agent' else agent.root_agent
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -9,14 +9,10 @@ and nutrition advice to progress tracking and shopping recommendations.
 from google.adk.agents import Agent
 from google.adk.tools import google_search
 
-# Import specialized agents (absolute imports)
-from FitX.sub_agent import (
-    create_fitness_coach_agent,
-    create_nutrition_expert_agent,
-    create_medical_advisor_agent,
-    create_progress_tracker_agent,
-    create_shopping_assistant_agent
-)
+# Import specialized agents (absolute imports). Specialists are built on
+# first transfer, not at import time.
+from FitX.sub_agent import lazy_sub_agents
+from FitX.sub_agent.fast_path import route_before_model
 
 # Import custom tools (absolute imports)
 from FitX.tools.shopping_tools import (
@@ -102,13 +98,15 @@ root_agent = Agent(
     Always start by understanding what the user needs, then delegate to the 
     appropriate expert agents to provide the best possible guidance.
     """,
-    sub_agents=[
-        create_fitness_coach_agent(),
-        create_nutrition_expert_agent(),
-        create_medical_advisor_agent(),
-        create_progress_tracker_agent(),
-        create_shopping_assistant_agent()
-    ],
+    sub_agents=lazy_sub_agents([
+        'fitness_coach',
+        'nutrition_expert',
+        'medical_advisor',
+        'progress_tracker',
+        'shopping_assistant'
+    ]),
+    # Obvious intents are routed locally, skipping the routing LLM call
+    before_model_callback=route_before_model,
     tools=[
         google_search,
         # Tools can also be used directly by orchestrator if needed
@@ -0,0 +1 @@
+# Init file for FitX benchmarks (run from the FitX directory: python -m benchmarks.<name>)
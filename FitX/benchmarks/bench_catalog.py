@@ -0,0 +1,85 @@
+"""
+Benchmark: kind-restricted catalog search on a skewed catalog
+
+Builds a synthetic catalog in which apparel is a small minority of the
+SKUs and every product shares the query terms, so each term's postings
+are dominated by equipment. Times search for the rare kind, the common
+kind and no kind, in memory and from a mapped snapshot, and checks the
+rare-kind results against an exhaustive search (every posting read).
+
+Usage (from the FitX directory):
+    python -m benchmarks.bench_catalog --sizes 10000,100000 --repeat 200
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from benchmarks.harness import measure
+from FitX.tools.product_catalog import ProductCatalog
+
+
+DEFAULT_SIZES = (10_000, 100_000)
+APPAREL_SHARE = 0.005
+QUERY = 'pro training'
+
+
+def skewed_products(count: int, apparel_share: float = APPAREL_SHARE) -> list:
+    """``count`` products sharing 'pro training', one apparel SKU per 1/apparel_share"""
+    every = max(int(1 / apparel_share), 1)
+    products = []
+    for i in range(count):
+        apparel = i % every == 0
+        products.append({
+            'id': f'sku-{i}',
+            'kind': 'apparel' if apparel else 'equipment',
+            'title': f"Pro Training {'Tee' if apparel else 'Bench'} {i}",
+            'brand': f'Brand{i % 97}',
+            'category': 'training',
+            'tags': ['gym', 'strength'] if i % 3 else ['gym'],
+            'rating': 3.5 + (i % 15) / 10,
+            'price_paise': 49900 + i % 100000
+        })
+    return products
+
+
+def _ids(hits) -> list:
+    return [product['id'] for _, product in hits]
+
+
+def measure_catalog(catalog: ProductCatalog, repeat: int) -> dict:
+    exhaustive = _ids(catalog.search(QUERY, kind='apparel', max_postings=len(catalog)))
+    return {
+        'rare_kind': measure(lambda: catalog.search(QUERY, kind='apparel'), repeat),
+        'common_kind': measure(lambda: catalog.search(QUERY, kind='equipment'), repeat),
+        'any_kind': measure(lambda: catalog.search(QUERY), repeat),
+        'rare_kind_matches_exhaustive': _ids(catalog.search(QUERY, kind='apparel')) == exhaustive
+    }
+
+
+def run(sizes=DEFAULT_SIZES, repeat: int = 200) -> dict:
+    results = {}
+    for count in sizes:
+        start = time.perf_counter()
+        catalog = ProductCatalog(skewed_products(count))
+        result = {'build_s': round(time.perf_counter() - start, 3), 'memory': measure_catalog(catalog, repeat)}
+        with tempfile.TemporaryDirectory(prefix='fitx-bench-') as tmp:
+            path = os.path.join(tmp, 'catalog.fxcat')
+            catalog.save_snapshot(path)
+            snapshot = ProductCatalog.open_snapshot(path)
+            result['snapshot'] = measure_catalog(snapshot, repeat)
+        if not (result['memory']['rare_kind_matches_exhaustive']
+                and result['snapshot']['rare_kind_matches_exhaustive']):
+            raise ValueError(f'{count} products: rare-kind results differ from an exhaustive search')
+        results[f'{count}_products'] = result
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)))
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+    print(json.dumps(run(tuple(int(size) for size in args.sizes.split(',')), args.repeat), indent=2))
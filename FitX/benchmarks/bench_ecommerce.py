@@ -0,0 +1,52 @@
+"""
+Benchmark: UnifiedEcommerceAPI fan-out against the local mock vendor server
+
+Starts the local mock vendor server (PA-API SearchItems and Flipkart
+affiliate shapes) with a fixed injected delay, points the Amazon and
+Flipkart clients at it and measures ``search_all_platforms``:
+uncached concurrent and sequential fan-out, and warm cache hits.
+
+Usage (from the FitX directory):
+    python -m benchmarks.bench_ecommerce --latency-ms 50 --repeat 40
+"""
+
+import argparse
+import itertools
+import json
+
+from benchmarks.harness import measure
+from ecommerce_api_integration import UnifiedEcommerceAPI
+from mock_vendor import LatencyModel, MockVendorServer, VendorBehavior
+from product_cache import SearchCache, SingleFlight
+
+
+def run(latency_ms: float = 50.0, repeat: int = 40) -> dict:
+    server = MockVendorServer(default=VendorBehavior(LatencyModel('fixed', latency_ms))).start()
+    api = UnifiedEcommerceAPI(cache=SearchCache(), inflight=SingleFlight(),
+                              base_urls={'amazon': server.url, 'flipkart': f'{server.url}/affiliate'})
+    platforms = ['amazon', 'flipkart', 'blinkit', 'instamart']
+    queries = (f'dumbbells {i}' for i in itertools.count())
+    try:
+        results = {
+            'latency_ms': latency_ms,
+            'uncached_concurrent': measure(
+                lambda: api.search_all_platforms(next(queries), platforms, use_cache=False), repeat),
+            'uncached_sequential': measure(
+                lambda: api.search_all_platforms(next(queries), platforms, concurrent=False, use_cache=False),
+                repeat),
+            'cache_hit': measure(lambda: api.search_all_platforms('dumbbells', platforms), repeat * 10)
+        }
+    finally:
+        api.close()
+        server.stop()
+    results['concurrency_speedup_p50'] = round(results['uncached_sequential']['p50_ms']
+                                               / results['uncached_concurrent']['p50_ms'], 2)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--latency-ms', type=float, default=50.0, help='Injected vendor response delay')
+    parser.add_argument('--repeat', type=int, default=40)
+    args = parser.parse_args()
+    print(json.dumps(run(args.latency_ms, args.repeat), indent=2))
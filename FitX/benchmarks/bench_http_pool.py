@@ -0,0 +1,83 @@
+"""
+Benchmark: pooled keep-alive vendor client vs. bare requests calls
+
+Starts a local HTTP/1.1 stub server and measures per-query latency of
+``requests.get`` (new connection per call, as the vendor clients used to
+do) against ``vendor_http.VendorHTTPClient`` (pooled, keep-alive).
+
+Usage (from the FitX directory):
+    python -m benchmarks.bench_http_pool --requests 500
+"""
+
+import argparse
+import json
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from vendor_http import HTTPConfig, VendorHTTPClient
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    body = json.dumps({'products': [{'productId': 'STUB1'}]}).encode()
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_stub_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _StubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _measure(fn, url: str, count: int) -> dict:
+    latencies = []
+    for _ in range(count):
+        start = time.perf_counter()
+        fn(url).json()
+        latencies.append((time.perf_counter() - start) * 1000)
+    latencies.sort()
+    return {
+        'requests': count,
+        'mean_ms': round(statistics.mean(latencies), 3),
+        'p50_ms': round(latencies[len(latencies) // 2], 3),
+        'p99_ms': round(latencies[int(len(latencies) * 0.99) - 1], 3)
+    }
+
+
+def run(count: int = 500) -> dict:
+    server = start_stub_server()
+    url = f'http://127.0.0.1:{server.server_address[1]}/affiliate/search/json'
+    try:
+        pooled = VendorHTTPClient(HTTPConfig())
+        _measure(pooled.get, url, 10)  # warm the pool
+        results = {
+            'bare_requests': _measure(lambda u: requests.get(u, timeout=5), url, count),
+            'pooled_client': _measure(pooled.get, url, count)
+        }
+        pooled.close()
+    finally:
+        server.shutdown()
+    results['speedup_p50'] = round(results['bare_requests']['p50_ms'] / results['pooled_client']['p50_ms'], 2)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--requests', type=int, default=500)
+    args = parser.parse_args()
+    print(json.dumps(run(args.requests), indent=2))
@@ -0,0 +1,71 @@
+"""
+Benchmark: orchestrator import time and lazy specialist construction
+
+Imports ``agent`` in a fresh interpreter and reports how long the import
+took and which specialist modules it loaded (none should be, since
+specialists are built on first transfer), then the cost of building each
+specialist on first use and whether a follow-up turn then stays with
+it (the built specialist must replace its placeholder). Exits non-zero
+when the import exceeds the budget, builds a specialist eagerly or a
+specialist would not be resumed, so it can gate CI.
+
+Usage (from the FitX directory):
+    python -m benchmarks.bench_import_time --budget-ms 1500
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+_PROBE = r'''
+import json, sys, time
+start = time.perf_counter()
+import agent
+import_ms = (time.perf_counter() - start) * 1000
+eager = sorted(name for name in sys.modules
+               if name.startswith('FitX.sub_agent.') and not name.endswith('.lazy_agent'))
+from FitX.sub_agent import resumes_at_specialist
+built = {}
+for sub_agent in list(agent.root_agent.sub_agents):
+    start = time.perf_counter()
+    sub_agent.resolve()
+    built[sub_agent.name] = round((time.perf_counter() - start) * 1000, 3)
+not_resumed = [name for name in built if not resumes_at_specialist(agent.root_agent, name)]
+print(json.dumps({'import_ms': round(import_ms, 3), 'eager_specialist_modules': eager,
+                  'first_build_ms': built, 'not_resumed': not_resumed}))
+'''
+
+
+def run(repeat: int = 5) -> dict:
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    samples = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-c', _PROBE], cwd=root, check=True,
+                                capture_output=True, text=True).stdout
+        samples.append(json.loads(output.strip().splitlines()[-1]))
+    import_ms = sorted(sample['import_ms'] for sample in samples)
+    return {
+        'runs': repeat,
+        'import_ms_p50': import_ms[len(import_ms) // 2],
+        'import_ms_max': import_ms[-1],
+        'eager_specialist_modules': samples[-1]['eager_specialist_modules'],
+        'first_build_ms': samples[-1]['first_build_ms'],
+        'specialists_not_resumed': samples[-1]['not_resumed']
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--budget-ms', type=float, default=1500.0, help='Maximum p50 import time')
+    args = parser.parse_args()
+
+    results = run(args.repeat)
+    results['budget_ms'] = args.budget_ms
+    results['within_budget'] = (results['import_ms_p50'] <= args.budget_ms
+                                and not results['eager_specialist_modules']
+                                and not results['specialists_not_resumed'])
+    print(json.dumps(results, indent=2))
+    sys.exit(0 if results['within_budget'] else 1)
@@ -0,0 +1,123 @@
+"""
+Benchmark: search_all_platforms throughput and tail latency under load
+
+Drives ``UnifiedEcommerceAPI.search_all_platforms`` (uncached) from many
+concurrent callers for a fixed duration against the mock vendor server
+with realistic latency, errors and throttling, and reports searches per
+second, latency percentiles and per-platform outcomes. The clients are
+pointed at the mock through FITX_MOCK_VENDOR_URL, exactly as a deployment
+would be; with ``--url`` an already running ``python -m mock_vendor`` is
+used instead of an in-process one (keeps the server off this process's GIL).
+
+Usage (from the FitX directory):
+    python -m benchmarks.bench_load --callers 32 --duration 10 --latency lognormal:60:0.5@0.01:2000
+"""
+
+import argparse
+import itertools
+import json
+import os
+import threading
+import time
+from collections import Counter
+
+import requests
+
+from benchmarks.harness import summarize
+from mock_vendor import STATS_PATH, LatencyModel, MockVendorServer, VendorBehavior
+
+
+def _outcome(result) -> str:
+    if isinstance(result, list):
+        return 'ok'
+    message = str(result.get('error', '')) if isinstance(result, dict) else ''
+    if message.startswith('timeout'):
+        return 'timeout'
+    if 'client-side limit' in message:
+        return 'rejected_locally'
+    if 'circuit open' in message:
+        return 'circuit_open'
+    if '429' in message:
+        return 'throttled'
+    return 'error'
+
+
+def run(callers: int = 16, duration: float = 10.0, latency: str = 'lognormal:60:0.5@0.01:2000',
+        error_rate: float = 0.01, rate_limit: float = 0.0, throttle_rate: float = 0.0,
+        url: str = None) -> dict:
+    server = None
+    if url is None:
+        behavior = VendorBehavior(LatencyModel.parse(latency), error_rate, rate_limit, throttle_rate=throttle_rate)
+        server = MockVendorServer(default=behavior).start()
+        url = server.url
+    previous = os.environ.get('FITX_MOCK_VENDOR_URL')
+    os.environ['FITX_MOCK_VENDOR_URL'] = url
+    try:
+        from ecommerce_api_integration import UnifiedEcommerceAPI
+        from product_cache import SearchCache, SingleFlight
+
+        api = UnifiedEcommerceAPI(max_workers=max(16, callers * 2), cache=SearchCache(), inflight=SingleFlight())
+        platforms = ['amazon', 'flipkart']
+        queries = itertools.count()
+        latencies, outcomes = [], Counter()
+        lock = threading.Lock()
+        stop_at = time.perf_counter() + duration
+
+        def caller():
+            while time.perf_counter() < stop_at:
+                query = f'resistance bands {next(queries)}'
+                start = time.perf_counter()
+                results = api.search_all_platforms(query, platforms, use_cache=False)
+                elapsed = (time.perf_counter() - start) * 1000
+                with lock:
+                    latencies.append(elapsed)
+                    outcomes.update(f'{platform}.{_outcome(results[platform])}' for platform in platforms)
+
+        started = time.perf_counter()
+        threads = [threading.Thread(target=caller) for _ in range(callers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        wall = time.perf_counter() - started
+        vendor_stats = requests.get(f'{url}{STATS_PATH}', timeout=5).json()
+        clients = {}
+        for platform in platforms:
+            http = getattr(api, platform).http
+            clients[platform] = {'limiter': http.limiter.snapshot(), 'breaker': http.breaker.snapshot(),
+                                 'hedged': http.hedged, 'hedge_wins': http.hedge_wins}
+        api.close()
+    finally:
+        if previous is None:
+            os.environ.pop('FITX_MOCK_VENDOR_URL', None)
+        else:
+            os.environ['FITX_MOCK_VENDOR_URL'] = previous
+        if server is not None:
+            server.stop()
+
+    return {
+        'callers': callers,
+        'duration_s': round(wall, 2),
+        'searches': len(latencies),
+        'searches_per_s': round(len(latencies) / wall, 1),
+        'search': summarize(latencies) if latencies else {},
+        'p99_ms': round(sorted(latencies)[min(int(0.99 * len(latencies)), len(latencies) - 1)], 3)
+        if latencies else None,
+        'outcomes': dict(sorted(outcomes.items())),
+        'vendor_stats': vendor_stats,
+        'clients': clients
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--callers', type=int, default=16, help='Concurrent search callers')
+    parser.add_argument('--duration', type=float, default=10.0, help='Seconds to run')
+    parser.add_argument('--latency', default='lognormal:60:0.5@0.01:2000', help='Mock latency spec')
+    parser.add_argument('--error-rate', type=float, default=0.01)
+    parser.add_argument('--rate-limit', type=float, default=0.0, help='Mock requests/second per vendor')
+    parser.add_argument('--throttle-rate', type=float, default=0.0)
+    parser.add_argument('--url', help='Use a running mock_vendor server instead of starting one')
+    args = parser.parse_args()
+    print(json.dumps(run(args.callers, args.duration, args.latency, args.error_rate, args.rate_limit,
+                         args.throttle_rate, args.url), indent=2))
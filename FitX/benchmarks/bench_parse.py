@@ -0,0 +1,113 @@
+"""
+Benchmark: whole-body vs streaming parsing of vendor search responses
+
+For PA-API and Flipkart search pages of increasing size, compares
+``json.loads`` + the dict parsers (what ``response.json()`` does) with
+``vendor_stream.stream_products`` keeping the first 10 products: parse
+time, peak traced memory and bytes read before stopping. A final
+end-to-end pass fetches a large page from the mock vendor server both ways.
+
+Usage (from the FitX directory):
+    python -m benchmarks.bench_parse --repeat 50
+"""
+
+import argparse
+import json
+import tracemalloc
+
+from benchmarks.harness import measure
+from mock_vendor import MockVendorServer, VendorBehavior, amazon_search_response, flipkart_search_response
+from vendor_stream import (
+    AMAZON_ITEMS_PATH,
+    DEFAULT_CHUNK_SIZE,
+    FLIPKART_PRODUCTS_PATH,
+    amazon_product,
+    flipkart_product,
+    stream_products
+)
+
+DEFAULT_SIZES = (10, 100, 1000)
+LIMIT = 10
+
+
+class _BodyResponse:
+    """Just enough of a streamed response to feed stream_products from memory"""
+
+    def __init__(self, body: bytes):
+        self.body = body
+        self.bytes_read = 0
+
+    def raise_for_status(self) -> None:
+        pass
+
+    def iter_content(self, chunk_size: int):
+        for start in range(0, len(self.body), chunk_size):
+            self.bytes_read += min(chunk_size, len(self.body) - start)
+            yield self.body[start:start + chunk_size]
+
+    def close(self) -> None:
+        pass
+
+
+def _peak_kib(fn) -> float:
+    tracemalloc.start()
+    try:
+        fn()
+        return round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+    finally:
+        tracemalloc.stop()
+
+
+def run(sizes=DEFAULT_SIZES, repeat: int = 50) -> dict:
+    from ecommerce_api_integration import AmazonProductAPI, FlipkartAPI
+
+    vendors = {
+        'amazon': (amazon_search_response, AMAZON_ITEMS_PATH, amazon_product,
+                   AmazonProductAPI()._parse_amazon_response),
+        'flipkart': (flipkart_search_response, FLIPKART_PRODUCTS_PATH, flipkart_product,
+                     FlipkartAPI()._parse_flipkart_response)
+    }
+    results = {'limit': LIMIT}
+    for vendor, (build, path, project, parse) in vendors.items():
+        for size in sizes:
+            body = json.dumps(build('adjustable dumbbells', size)).encode('utf-8')
+
+            def whole():
+                return parse(json.loads(body))[:LIMIT]
+
+            def streamed():
+                return stream_products(_BodyResponse(body), path, project, LIMIT)
+
+            probe = _BodyResponse(body)
+            stream_products(probe, path, project, LIMIT)
+            entry = {
+                'body_kib': round(len(body) / 1024, 1),
+                'whole': measure(whole, repeat),
+                'stream': measure(streamed, repeat),
+                'whole_peak_kib': _peak_kib(whole),
+                'stream_peak_kib': _peak_kib(streamed),
+                'stream_bytes_read_kib': round(probe.bytes_read / 1024, 1)
+            }
+            entry['stream_speedup_p50'] = round(entry['whole']['p50_ms'] / entry['stream']['p50_ms'], 2)
+            results[f'{vendor}_{size}'] = entry
+
+    page = max(sizes)
+    server = MockVendorServer(default=VendorBehavior(result_count=page)).start()
+    try:
+        whole_api, stream_api = AmazonProductAPI(server.url), AmazonProductAPI(server.url, stream=True)
+        results[f'amazon_http_{page}'] = {
+            'whole': measure(lambda: whole_api.search_items('adjustable dumbbells', limit=LIMIT), repeat),
+            'stream': measure(lambda: stream_api.search_items('adjustable dumbbells', limit=LIMIT), repeat)
+        }
+    finally:
+        server.stop()
+    results['chunk_size'] = DEFAULT_CHUNK_SIZE
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)), help='Products per response page')
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+    print(json.dumps(run(tuple(int(size) for size in args.sizes.split(',')), args.repeat), indent=2))
@@ -0,0 +1,92 @@
+"""
+Benchmark: get_progress_summary over synthetic histories of 1k to 1M events
+
+For each history size a fresh interpreter writes that many workout and
+meal events for one user (spread over the past two years) into a
+throwaway event store, then measures the first summary (which replays
+the store into the projections) and the steady-state summary latency for
+7- and 30-day windows.
+
+Usage (from the FitX directory):
+    python -m benchmarks.bench_progress_summary --sizes 1000,10000,100000,1000000
+"""
+
+import argparse
+import json
+import tempfile
+import time
+
+from benchmarks.harness import measure, run_probe
+
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+HISTORY_DAYS = 730
+WRITE_BATCH = 10_000
+
+
+def synthetic_events(count: int, user_id: str = 'default', now: float = None):
+    """Yield ``count`` workout/meal store events (3 meals per workout) ending at ``now``"""
+    now = now or time.time()
+    step = HISTORY_DAYS * 86400 / max(count, 1)
+    exercises = ('running', 'cycling', 'squat', 'bench press', 'yoga', 'swimming')
+    intensities = ('low', 'moderate', 'high', 'very_high')
+    meal_types = ('breakfast', 'lunch', 'dinner', 'snack')
+    for i in range(count):
+        ts = now - (count - i) * step
+        if i % 4 == 0:
+            yield {'type': 'workout', 'user_id': user_id, 'ts': ts, 'exercise': exercises[i % 6],
+                   'duration': 20 + i % 50, 'intensity': intensities[i % 4], 'calories': 150 + i % 400}
+        else:
+            yield {'type': 'meal', 'user_id': user_id, 'ts': ts, 'meal_type': meal_types[i % 4],
+                   'items': ['oats', 'banana'], 'calories': 250 + i % 500}
+
+
+def measure_history(count: int, repeat: int = 200) -> dict:
+    """Populate the store (FITX_DATA_DIR must be scratch space) and time summaries"""
+    from FitX.tools.event_store import get_event_store
+    from FitX.tools.tracking_tools import get_progress_summary
+
+    store = get_event_store()
+    start = time.perf_counter()
+    batch = []
+    for event in synthetic_events(count):
+        batch.append(event)
+        if len(batch) == WRITE_BATCH:
+            store.append_many(batch)
+            batch = []
+    if batch:
+        store.append_many(batch)
+    store.flush()
+    populate_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    first = get_progress_summary(7)
+    first_call_ms = (time.perf_counter() - start) * 1000
+    return {
+        'events': count,
+        'populate_s': round(populate_s, 3),
+        'first_call_ms': round(first_call_ms, 3),
+        'workouts_in_week': first['workout_stats']['workouts_completed'],
+        'summary_7d': measure(lambda: get_progress_summary(7), repeat),
+        'summary_30d': measure(lambda: get_progress_summary(30), repeat)
+    }
+
+
+def run(sizes=DEFAULT_SIZES, repeat: int = 200) -> dict:
+    results = {}
+    for count in sizes:
+        with tempfile.TemporaryDirectory(prefix='fitx-bench-') as data_dir:
+            results[f'events_{count}'] = run_probe(
+                f'import json\nfrom benchmarks.bench_progress_summary import measure_history\n'
+                f'print(json.dumps(measure_history({int(count)}, {int(repeat)})))',
+                env={'FITX_DATA_DIR': data_dir, 'FITX_METRICS': '0'})
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', default=','.join(str(size) for size in DEFAULT_SIZES),
+                        help='Comma-separated history sizes (events)')
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+    print(json.dumps(run([int(size) for size in args.sizes.split(',')], args.repeat), indent=2))
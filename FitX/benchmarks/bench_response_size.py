@@ -0,0 +1,87 @@
+"""
+Benchmark: size of tool results sent to the model context
+
+For each shopping tool, compares the full result (every field of every
+product, indent=2 JSON, what the tools returned before shaping) with the
+shaped compact result: characters, estimated tokens and the shrink
+factor, plus how long shaping itself takes. The vendor-backed
+``search_all_platforms`` result is fetched from the mock vendor server.
+Fails if a shaped result still carries a key its projection drops.
+
+Usage (from the FitX directory):
+    python -m benchmarks.bench_response_size --repeat 200
+"""
+
+import argparse
+import json
+import os
+
+from benchmarks.harness import measure
+from FitX.tools.product_record import serialize
+from FitX.tools.response_shaping import PROJECTIONS, dumps, estimate_tokens, shape_response
+
+
+CASES = (
+    # label, tool, function name, args, kwargs
+    ('equipment', 'search_fitness_equipment', 'search_fitness_equipment', ('dumbbells',), {}),
+    ('wear', 'search_athletic_wear', 'search_athletic_wear', ('running shoes', 'running'), {}),
+    ('food', 'search_healthy_food', 'search_healthy_food', ('vegan', 'breakfast'), {}),
+    ('food_limit_10', 'search_healthy_food', 'search_healthy_food', ('high_protein',), {'limit': 10}),
+)
+
+
+def _sizes(tool: str, raw: dict, repeat: int) -> dict:
+    full = json.dumps(serialize(raw), indent=2, ensure_ascii=False)
+    result = shape_response(tool, raw)
+    kept = [key for key in PROJECTIONS[tool].drop if key in result]
+    if kept:
+        raise ValueError(f'{tool}: shaped result still has {kept}')
+    shaped = dumps(result)
+    return {
+        'full_chars': len(full),
+        'full_tokens': estimate_tokens(full),
+        'shaped_chars': len(shaped),
+        'shaped_tokens': estimate_tokens(shaped),
+        'shrink': round(len(full) / len(shaped), 2),
+        'shape': measure(lambda: dumps(shape_response(tool, raw)), repeat)
+    }
+
+
+def run(repeat: int = 200) -> dict:
+    from FitX.tools import shopping_tools
+
+    results, raw = {}, {}
+    shape = shopping_tools.shape_response
+    try:
+        # Capture the records each tool hands to shape_response
+        for label, tool, name, args, kwargs in CASES:
+            shopping_tools.shape_response = lambda tool, result, label=label: raw.setdefault(label, (tool, result))
+            getattr(shopping_tools, name)(*args, **kwargs)
+    finally:
+        shopping_tools.shape_response = shape
+    for label, (tool, result) in raw.items():
+        results[label] = _sizes(tool, result, repeat)
+
+    from mock_vendor import MockVendorServer
+    server = MockVendorServer().start()
+    previous = os.environ.get('FITX_MOCK_VENDOR_URL')
+    os.environ['FITX_MOCK_VENDOR_URL'] = server.url
+    try:
+        from ecommerce_api_integration import UnifiedEcommerceAPI
+        with UnifiedEcommerceAPI() as api:
+            vendor = api.search_all_platforms('yoga mat', platforms=['amazon', 'flipkart', 'blinkit', 'instamart'])
+    finally:
+        if previous is None:
+            os.environ.pop('FITX_MOCK_VENDOR_URL', None)
+        else:
+            os.environ['FITX_MOCK_VENDOR_URL'] = previous
+        server.stop()
+    results['all_platforms'] = _sizes('search_all_platforms', vendor, repeat)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+    print(json.dumps(run(args.repeat), indent=2))
@@ -0,0 +1,80 @@
+"""
+Benchmark: per-call latency of every tool in FitX/tools
+
+Times each shopping and tracking tool with representative arguments, plus
+the fast-path intent router and log parser, in a fresh interpreter whose
+tracking data lives in a throwaway directory (the user's ~/.fitx is never
+touched).
+
+Usage (from the FitX directory):
+    python -m benchmarks.bench_tools --repeat 200
+"""
+
+import argparse
+import json
+import tempfile
+
+from benchmarks.harness import measure, run_probe
+
+
+BULK_ROWS = 1000
+
+
+def _bulk_workouts(count: int) -> list:
+    exercises = ('running', 'cycling', 'squat', 'yoga', 'swimming')
+    intensities = ('low', 'moderate', 'high', 'very_high')
+    return [{'exercise': exercises[i % 5], 'duration': 20 + i % 40, 'intensity': intensities[i % 4],
+             'calories': 150 + i % 300, 'timestamp': 1_700_000_000 + i * 3600} for i in range(count)]
+
+
+def _bulk_meals(count: int) -> list:
+    meal_types = ('breakfast', 'lunch', 'dinner', 'snack')
+    return [{'meal_type': meal_types[i % 4], 'items': ['oats', 'banana'], 'calories': 300 + i % 400,
+             'timestamp': 1_700_000_000 + i * 3600} for i in range(count)]
+
+
+def measure_tools(repeat: int = 200) -> dict:
+    """Time every tool in the current process (expects FITX_DATA_DIR to point at scratch space)"""
+    from FitX.tools.intent_router import get_intent_router
+    from FitX.tools.log_parser import parse_log
+    from FitX.tools.shopping_tools import search_athletic_wear, search_fitness_equipment, search_healthy_food
+    from FitX.tools.tracking_tools import (
+        bulk_log_meals,
+        bulk_log_workouts,
+        get_achievements,
+        get_progress_summary,
+        log_meal,
+        log_workout
+    )
+
+    router = get_intent_router()
+    workouts = _bulk_workouts(BULK_ROWS)
+    meals = _bulk_meals(BULK_ROWS)
+    bulk_repeat = max(repeat // 20, 3)
+    return {
+        'search_fitness_equipment': measure(lambda: search_fitness_equipment('adjustable dumbbells'), repeat),
+        'search_healthy_food': measure(lambda: search_healthy_food('high protein vegetarian', 'snack'), repeat),
+        'search_athletic_wear': measure(lambda: search_athletic_wear('running shoes', 'running'), repeat),
+        'log_workout': measure(lambda: log_workout('running', 30, 'moderate', 300), repeat),
+        'log_meal': measure(lambda: log_meal('lunch', ['rice', 'dal', 'salad'], 550), repeat),
+        'get_progress_summary': measure(lambda: get_progress_summary(7), repeat),
+        'get_achievements': measure(lambda: get_achievements(), repeat),
+        f'bulk_log_workouts_{BULK_ROWS}': measure(lambda: bulk_log_workouts(workouts), bulk_repeat, warmup=1),
+        f'bulk_log_meals_{BULK_ROWS}': measure(lambda: bulk_log_meals(meals), bulk_repeat, warmup=1),
+        'intent_router_route': measure(lambda: router.route('I want to buy a yoga mat'), repeat),
+        'log_parser_parse_log': measure(lambda: parse_log('ran 5k in 30 minutes, moderate pace'), repeat)
+    }
+
+
+def run(repeat: int = 200) -> dict:
+    with tempfile.TemporaryDirectory(prefix='fitx-bench-') as data_dir:
+        return run_probe(f'import json\nfrom benchmarks.bench_tools import measure_tools\n'
+                         f'print(json.dumps(measure_tools({int(repeat)})))',
+                         env={'FITX_DATA_DIR': data_dir, 'FITX_METRICS': '0'})
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+    print(json.dumps(run(args.repeat), indent=2))
@@ -0,0 +1,154 @@
+"""
+Shared helpers for the FitX benchmark suite
+
+Timing with warm-up and percentile summaries, run metadata (commit,
+interpreter, machine) and comparison of two result files, so every
+benchmark reports the same machine-readable shape.
+"""
+
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Leaf keys treated as "lower is better" timings when comparing runs; extremes
+# and configured budgets are reported but never compared
+TIMING_UNITS = ('ms', 's')
+UNCOMPARED_WORDS = ('min', 'max', 'budget')
+
+
+def summarize(latencies_ms: List[float]) -> Dict[str, float]:
+    """Percentile summary of a list of latencies in milliseconds"""
+    ordered = sorted(latencies_ms)
+    count = len(ordered)
+
+    def pick(q: float) -> float:
+        return round(ordered[min(int(q * count), count - 1)], 4)
+
+    return {
+        'runs': count,
+        'mean_ms': round(sum(ordered) / count, 4),
+        'min_ms': round(ordered[0], 4),
+        'p50_ms': pick(0.50),
+        'p95_ms': pick(0.95),
+        'max_ms': round(ordered[-1], 4)
+    }
+
+
+def measure(fn: Callable[[], Any], repeat: int = 200, warmup: int = 5,
+            max_seconds: Optional[float] = None) -> Dict[str, float]:
+    """
+    Time ``fn()`` ``repeat`` times after ``warmup`` untimed calls.
+
+    Args:
+        fn: Zero-argument callable to time
+        repeat: Number of timed calls
+        warmup: Untimed calls first (caches, lazy singletons, pools)
+        max_seconds: Stop early once this much time was spent timing
+
+    Returns:
+        Summary from ``summarize`` (runs, mean/min/p50/p95/max in ms)
+
+    Example:
+        >>> measure(lambda: search_healthy_food('vegan'), repeat=100)
+        {'runs': 100, 'mean_ms': 0.041, 'p50_ms': 0.038, ...}
+    """
+    for _ in range(warmup):
+        fn()
+    latencies = []
+    deadline = time.perf_counter() + max_seconds if max_seconds else None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        end = time.perf_counter()
+        latencies.append((end - start) * 1000)
+        if deadline is not None and end >= deadline:
+            break
+    return summarize(latencies)
+
+
+def run_probe(code: str, env: Optional[Dict[str, str]] = None, timeout: float = 1800) -> Dict:
+    """Run ``code`` in a fresh interpreter from the FitX directory and parse its last stdout line as JSON"""
+    output = subprocess.run([sys.executable, '-c', code], cwd=ROOT, check=True, capture_output=True,
+                            text=True, timeout=timeout, env=dict(os.environ, **(env or {}))).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def git_commit() -> Optional[str]:
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                                text=True, timeout=10).stdout.strip()
+        dirty = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=ROOT,
+                               capture_output=True, text=True, timeout=30).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return f'{commit}-dirty' if commit and dirty else commit or None
+
+
+def environment() -> Dict[str, Any]:
+    """Metadata identifying where and on what code a result file was produced"""
+    return {
+        'commit': git_commit(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count()
+    }
+
+
+def write_results(results: Dict, path: str) -> None:
+    """Write a result file atomically"""
+    tmp_path = f'{path}.tmp{os.getpid()}'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+        f.write('\n')
+    os.replace(tmp_path, path)
+
+
+def flatten(results: Dict, prefix: str = '') -> Dict[str, float]:
+    """Numeric leaves keyed by dotted path, e.g. 'tools.log_workout.p50_ms'"""
+    flat = {}
+    for key, value in results.items():
+        path = f'{prefix}{key}'
+        if isinstance(value, dict):
+            flat.update(flatten(value, f'{path}.'))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[path] = value
+    return flat
+
+
+def compare(baseline: Dict, current: Dict, threshold: float = 0.2,
+            metric: str = 'p50_ms', min_delta_ms: float = 0.05) -> List[Dict]:
+    """
+    Timings in ``current`` that are slower than ``baseline`` by more than ``threshold``.
+
+    Where a percentile summary exists only its ``metric`` leaf is compared
+    (single-shot timings are compared as they are); differences below
+    ``min_delta_ms`` are ignored so sub-microsecond noise never fails a run.
+
+    Returns:
+        One dict per regression: path, baseline, current and ratio
+    """
+    before = flatten(baseline.get('benchmarks', baseline))
+    after = flatten(current.get('benchmarks', current))
+    regressions = []
+    for path, old in sorted(before.items()):
+        new = after.get(path)
+        leaf = path.rsplit('.', 1)[-1]
+        words = leaf.split('_')
+        if new is None or old <= 0 or not set(words) & set(TIMING_UNITS) or set(words) & set(UNCOMPARED_WORDS):
+            continue
+        if leaf != metric and path.rsplit('.', 1)[0] + f'.{metric}' in before:
+            continue
+        delta_ms = (new - old) * (1 if 'ms' in words else 1000)
+        if new > old * (1 + threshold) and delta_ms >= min_delta_ms:
+            regressions.append({'path': path, 'baseline': old, 'current': new, 'ratio': round(new / old, 3)})
+    return regressions
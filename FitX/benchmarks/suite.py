@@ -0,0 +1,124 @@
+"""
+FitX benchmark suite: run every benchmark and write one JSON result file
+
+Runs the tool, catalog-search, vendor fan-out, mock-vendor load,
+response-parsing, progress-summary, HTTP-pool, SigV4 signing,
+response-size and import-time benchmarks and writes their results together with the
+commit and machine they ran on. Given a baseline file from an earlier commit, timings that
+regressed beyond the threshold are listed and the exit status is non-zero.
+
+Usage (from the FitX directory):
+    python -m benchmarks.suite --output bench-base.json
+    python -m benchmarks.suite --output bench-head.json --compare bench-base.json
+    python -m benchmarks.suite --quick --only tools,ecommerce
+"""
+
+import argparse
+import json
+import sys
+import time
+
+from benchmarks import (
+    bench_catalog,
+    bench_ecommerce,
+    bench_http_pool,
+    bench_import_time,
+    bench_load,
+    bench_parse,
+    bench_progress_summary,
+    bench_response_size,
+    bench_sigv4,
+    bench_tools
+)
+from benchmarks.harness import compare, environment, write_results
+
+
+RESULT_FORMAT_VERSION = 1
+
+# name -> (full run, quick run)
+BENCHMARKS = {
+    'tools': (lambda: bench_tools.run(repeat=200),
+              lambda: bench_tools.run(repeat=30)),
+    'catalog': (lambda: bench_catalog.run(bench_catalog.DEFAULT_SIZES, repeat=200),
+                lambda: bench_catalog.run((10_000,), repeat=30)),
+    'ecommerce': (lambda: bench_ecommerce.run(latency_ms=50.0, repeat=40),
+                  lambda: bench_ecommerce.run(latency_ms=20.0, repeat=10)),
+    'load': (lambda: bench_load.run(callers=16, duration=10.0),
+             lambda: bench_load.run(callers=8, duration=2.0)),
+    'parse': (lambda: bench_parse.run(bench_parse.DEFAULT_SIZES, repeat=50),
+              lambda: bench_parse.run((10, 100), repeat=10)),
+    'progress_summary': (lambda: bench_progress_summary.run(bench_progress_summary.DEFAULT_SIZES, repeat=200),
+                         lambda: bench_progress_summary.run((1_000, 10_000), repeat=30)),
+    'http_pool': (lambda: bench_http_pool.run(500),
+                  lambda: bench_http_pool.run(100)),
+    'sigv4': (lambda: bench_sigv4.run(repeat=20000),
+              lambda: bench_sigv4.run(repeat=2000)),
+    'response_size': (lambda: bench_response_size.run(repeat=200),
+                      lambda: bench_response_size.run(repeat=30)),
+    'import_time': (lambda: bench_import_time.run(repeat=5),
+                    lambda: bench_import_time.run(repeat=2))
+}
+
+
+def run_suite(names=None, quick: bool = False) -> dict:
+    """
+    Run the selected benchmarks (all by default).
+
+    Returns:
+        {'format_version', 'environment', 'quick', 'benchmarks': {name: results},
+         'errors': {name: message}, 'elapsed_s'}
+    """
+    started = time.perf_counter()
+    results, errors = {}, {}
+    for name in names or BENCHMARKS:
+        full, short = BENCHMARKS[name]
+        print(f'running {name}...', file=sys.stderr, flush=True)
+        try:
+            results[name] = (short if quick else full)()
+        except Exception as e:  # one broken benchmark should not lose the others' results
+            detail = (getattr(e, 'stderr', None) or '').strip().splitlines()
+            errors[name] = detail[-1] if detail else f'{type(e).__name__}: {e}'
+    return {
+        'format_version': RESULT_FORMAT_VERSION,
+        'environment': environment(),
+        'quick': quick,
+        'benchmarks': results,
+        'errors': errors,
+        'elapsed_s': round(time.perf_counter() - started, 1)
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--output', help='Write the JSON results here (default: stdout)')
+    parser.add_argument('--only', help=f'Comma-separated subset of: {",".join(BENCHMARKS)}')
+    parser.add_argument('--quick', action='store_true', help='Smaller sizes and fewer repetitions')
+    parser.add_argument('--compare', metavar='BASELINE', help='Result file from an earlier run')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='Allowed slowdown of each p50 timing versus the baseline (0.2 = 20%%)')
+    args = parser.parse_args()
+
+    names = args.only.split(',') if args.only else None
+    unknown = set(names or ()) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f'unknown benchmark(s): {", ".join(sorted(unknown))}')
+
+    report = run_suite(names, args.quick)
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        report['comparison'] = {
+            'baseline_commit': baseline.get('environment', {}).get('commit'),
+            'threshold': args.threshold,
+            'regressions': compare(baseline, report, args.threshold)
+        }
+    if args.output:
+        write_results(report, args.output)
+    else:
+        print(json.dumps(report, indent=2, sort_keys=True))
+
+    regressions = report.get('comparison', {}).get('regressions', [])
+    for regression in regressions:
+        print(f"regression: {regression['path']} {regression['baseline']} -> {regression['current']} "
+              f"({regression['ratio']}x)", file=sys.stderr)
+    sys.exit(1 if regressions or report['errors'] else 0)
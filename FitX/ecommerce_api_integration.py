@@ -6,27 +6,45 @@ Integrates with Amazon, Flipkart, Blinkit, Swiggy Instamart APIs
 import os
 import requests
 import json
+import time
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from typing import Dict, List, Any, Optional
-from datetime import datetime
-import hashlib
-import hmac
-import base64
-from urllib.parse import quote, urlencode
+from urllib.parse import urlparse
+
+from product_cache import SearchCache, SingleFlight, cache_key, get_search_cache, get_single_flight, is_cacheable
+from sigv4 import PAAPI_SERVICE, PAAPI_TARGET_PREFIX, SigV4Signer
+from vendor_http import get_vendor_client, vendor_base_url
+from vendor_stream import AMAZON_ITEMS_PATH, FLIPKART_PRODUCTS_PATH, amazon_product, flipkart_product, stream_products
+from FitX.tools.instrumentation import get_metrics, instrument, payload_size
+from FitX.tools.product_record import Product, to_jsonable
+from FitX.tools.response_shaping import dumps, shape_response
 
 # ==================== AMAZON PRODUCT ADVERTISING API ====================
 class AmazonProductAPI:
-   ## NOT ABLE TO GET AMAZON AFFILIATE API WORKING CURRENTLY DUE TO SIGNING ISSUES ##
-    def __init__(self):
+    """
+    Amazon Product Advertising API 5 (SearchItems), signed with SigV4
+
+    Results are Product records. With ``stream`` the response is parsed
+    incrementally (see vendor_stream) instead of loaded whole.
+    """
+    def __init__(self, base_url: Optional[str] = None, stream: bool = False):
         self.access_key = os.getenv('AMAZON_ACCESS_KEY')
         self.secret_key = os.getenv('AMAZON_SECRET_KEY')
         self.associate_tag = os.getenv('AMAZON_ASSOCIATE_TAG')
         self.host = "webservices.amazon.in"
         self.region = "eu-west-1"
         self.marketplace = "www.amazon.in"
+        self.base_url = base_url or vendor_base_url('amazon', f"https://{self.host}")
+        self.http = get_vendor_client('amazon')
+        self.stream = stream
+        # Caches the daily signing key; requests go out unsigned without credentials (mock vendor)
+        self.signer = (SigV4Signer(self.access_key, self.secret_key, self.region, PAAPI_SERVICE)
+                       if self.access_key and self.secret_key else None)
         
-    def search_items(self, keywords: str, category: str = "All") -> Dict:
-        """Search for items using PA-API"""
-        endpoint = f"https://{self.host}/paapi5/searchitems"
+    def search_items(self, keywords: str, category: str = "All", limit: int = 10) -> Dict:
+        """Search for items using PA-API (at most ``limit`` items; PA-API returns up to 10)"""
+        endpoint = f"{self.base_url}/paapi5/searchitems"
         
         payload = {
             "Keywords": keywords,
@@ -37,59 +55,44 @@ class AmazonProductAPI:
                 "Offers.Listings.Price"
             ],
             "SearchIndex": category,
+            "ItemCount": max(1, min(limit, 10)),
             "PartnerTag": self.associate_tag,
             "PartnerType": "Associates",
             "Marketplace": self.marketplace
         }
         
-        headers = self._get_headers(payload)
+        # Serialized once: the signature covers these exact bytes
+        body = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+        headers = self._get_headers(body)
         
         try:
-            response = requests.post(endpoint, json=payload, headers=headers)
+            # SearchItems is a read: safe to hedge
+            if self.stream:
+                response = self.http.post(endpoint, data=body, headers=headers, idempotent=True, stream=True)
+                return stream_products(response, AMAZON_ITEMS_PATH, amazon_product, limit)
+            response = self.http.post(endpoint, data=body, headers=headers, idempotent=True)
             response.raise_for_status()
-            return self._parse_amazon_response(response.json())
-        except requests.exceptions.RequestException as e:
+            return self._parse_amazon_response(response.json())[:limit]
+        except (requests.exceptions.RequestException, ValueError) as e:
             return {"error": str(e), "source": "amazon"}
     
-    def _get_headers(self, payload: Dict) -> Dict:
+    def _get_headers(self, body: bytes) -> Dict:
         """Generate AWS Signature Version 4 headers"""
-        # Implementation of AWS SigV4 signing
-
-        return {
-            "Content-Type": "application/json",
-            "X-Amz-Target": "com.amazon.paapi5.v1.ProductAdvertisingAPIv1.SearchItems",
-            "Content-Encoding": "amz-1.0"
+        headers = {
+            "content-encoding": "amz-1.0",
+            "content-type": "application/json; charset=utf-8",
+            "x-amz-target": PAAPI_TARGET_PREFIX + "SearchItems"
         }
+        if self.signer is None:
+            return headers
+        url = urlparse(self.base_url)
+        return self.signer.sign("POST", url.netloc, f"{url.path.rstrip('/')}/paapi5/searchitems",
+                                headers=headers, payload=body)
     
-    def _parse_amazon_response(self, data: Dict) -> List[Dict]:
-        """Parse Amazon API response"""
-        if 'SearchResult' not in data:
-            return []
-        
-        items = []
-        for item in data.get('SearchResult', {}).get('Items', []):
-            parsed_item = {
-                'platform': 'Amazon',
-                'asin': item.get('ASIN'),
-                'title': item.get('ItemInfo', {}).get('Title', {}).get('DisplayValue'),
-                'price': self._extract_price(item),
-                'rating': item.get('CustomerReviews', {}).get('StarRating', {}).get('Value'),
-                'image': item.get('Images', {}).get('Primary', {}).get('Large', {}).get('URL'),
-                'url': item.get('DetailPageURL'),
-                'features': item.get('ItemInfo', {}).get('Features', {}).get('DisplayValues', [])
-            }
-            items.append(parsed_item)
-        return items
-    
-    def _extract_price(self, item: Dict) -> str:
-        """Extract price from complex Amazon structure"""
-        try:
-            price_info = item.get('Offers', {}).get('Listings', [{}])[0].get('Price', {})
-            amount = price_info.get('Amount')
-            currency = price_info.get('Currency', 'INR')
-            return f"{currency} {amount}"
-        except:
-            return "Price not available"
+    def _parse_amazon_response(self, data: Dict) -> List[Product]:
+        """Parse a fully loaded Amazon API response"""
+        items = (data.get('SearchResult') or {}).get('Items') or []
+        return [amazon_product(item) for item in items]
 
 
 # ==================== FLIPKART AFFILIATE API ====================
@@ -97,20 +100,24 @@ class FlipkartAPI:
     """
     Flipkart Affiliate API
 
+    Results are Product records. With ``stream`` search responses are
+    parsed incrementally (see vendor_stream).
     """
     ##NOT ABLE TO TEST DUE TO LACK OF AFFILIATE ACCOUNT##
-    def __init__(self):
+    def __init__(self, base_url: Optional[str] = None, stream: bool = False):
         self.affiliate_id = os.getenv('FLIPKART_AFFILIATE_ID')
         self.affiliate_token = os.getenv('FLIPKART_AFFILIATE_TOKEN')
-        self.base_url = "https://affiliate-api.flipkart.net/affiliate"
+        self.base_url = base_url or vendor_base_url('flipkart')
+        self.http = get_vendor_client('flipkart')
+        self.stream = stream
         
-    def search_products(self, query: str, category: str = "all") -> List[Dict]:
-        """Search products on Flipkart"""
+    def search_products(self, query: str, category: str = "all", limit: int = 10) -> List[Product]:
+        """Search products on Flipkart (at most ``limit`` products)"""
         endpoint = f"{self.base_url}/search/json"
         
         params = {
             'query': query,
-            'resultCount': 10
+            'resultCount': limit
         }
         
         headers = {
@@ -119,10 +126,13 @@ class FlipkartAPI:
         }
         
         try:
-            response = requests.get(endpoint, params=params, headers=headers)
+            if self.stream:
+                response = self.http.get(endpoint, params=params, headers=headers, stream=True)
+                return stream_products(response, FLIPKART_PRODUCTS_PATH, flipkart_product, limit)
+            response = self.http.get(endpoint, params=params, headers=headers)
             response.raise_for_status()
-            return self._parse_flipkart_response(response.json())
-        except requests.exceptions.RequestException as e:
+            return self._parse_flipkart_response(response.json())[:limit]
+        except (requests.exceptions.RequestException, ValueError) as e:
             return {"error": str(e), "source": "flipkart"}
     
     def get_product_details(self, product_id: str) -> Dict:
@@ -136,30 +146,15 @@ class FlipkartAPI:
         }
         
         try:
-            response = requests.get(endpoint, params=params, headers=headers)
+            response = self.http.get(endpoint, params=params, headers=headers)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
             return {"error": str(e)}
     
-    def _parse_flipkart_response(self, data: Dict) -> List[Dict]:
-        """Parse Flipkart API response"""
-        products = []
-        for product in data.get('products', []):
-            parsed = {
-                'platform': 'Flipkart',
-                'product_id': product.get('productId'),
-                'title': product.get('productBaseInfoV1', {}).get('title'),
-                'price': product.get('productBaseInfoV1', {}).get('flipkartSellingPrice', {}).get('amount'),
-                'mrp': product.get('productBaseInfoV1', {}).get('maximumRetailPrice', {}).get('amount'),
-                'discount': product.get('productBaseInfoV1', {}).get('discountPercentage'),
-                'rating': product.get('productBaseInfoV1', {}).get('rating', {}).get('average'),
-                'image': product.get('productBaseInfoV1', {}).get('imageUrls', [{}])[0].get('400x400'),
-                'url': product.get('productBaseInfoV1', {}).get('productUrl'),
-                'in_stock': product.get('productBaseInfoV1', {}).get('inStock')
-            }
-            products.append(parsed)
-        return products
+    def _parse_flipkart_response(self, data: Dict) -> List[Product]:
+        """Parse a fully loaded Flipkart API response"""
+        return [flipkart_product(product) for product in data.get('products') or []]
 
 
 # ==================== BLINKIT API  ====================
@@ -171,10 +166,10 @@ class BlinkitAPI:
     """
     def __init__(self):
         self.base_url = "https://blinkit.com"  # No official API
-        self.session = requests.Session()
+        self.http = get_vendor_client('blinkit')
         # Note: Real implementation would need authentication tokens
         
-    def search_products(self, query: str, location: str = "default") -> List[Dict]:
+    def search_products(self, query: str, location: str = "default") -> List[Product]:
         """
         WARNING: Blinkit has no public API
         This is a mock/placeholder
@@ -186,19 +181,11 @@ class BlinkitAPI:
         # Mock data structure
         return self._get_mock_blinkit_data(query)
     
-    def _get_mock_blinkit_data(self, query: str) -> List[Dict]:
+    def _get_mock_blinkit_data(self, query: str) -> List[Product]:
         """Return mock data structure"""
         return [
-            {
-                'platform': 'Blinkit',
-                'name': f'{query} - Fresh',
-                'price': '₹199',
-                'discount': '10% off',
-                'delivery_time': '10 mins',
-                'image': 'https://example.com/image.jpg',
-                'in_stock': True,
-                'note': 'Mock data - Blinkit has no public API'
-            }
+            Product('blinkit', title=f'{query} - Fresh', price_paise=19900, discount=10.0,
+                    in_stock=True, delivery_mins=10)
         ]
 
 
@@ -211,7 +198,7 @@ class SwiggyInstamartAPI:
     def __init__(self):
         self.base_url = "https://www.swiggy.com/instamart"  # No official API
         
-    def search_products(self, query: str, location_id: str = None) -> List[Dict]:
+    def search_products(self, query: str, location_id: str = None) -> List[Product]:
         """
         WARNING: No public API available
         Options:
@@ -221,19 +208,11 @@ class SwiggyInstamartAPI:
         """
         return self._get_mock_instamart_data(query)
     
-    def _get_mock_instamart_data(self, query: str) -> List[Dict]:
+    def _get_mock_instamart_data(self, query: str) -> List[Product]:
         """Return mock data structure"""
         return [
-            {
-                'platform': 'Swiggy Instamart',
-                'name': f'{query} - Premium',
-                'price': '₹249',
-                'discount': '15% off',
-                'delivery_time': '15-20 mins',
-                'image': 'https://example.com/image.jpg',
-                'in_stock': True,
-                'note': 'Mock data - Swiggy has no public API'
-            }
+            Product('instamart', title=f'{query} - Premium', price_paise=24900, discount=15.0,
+                    in_stock=True, delivery_mins=20)
         ]
 
 
@@ -244,76 +223,215 @@ class UnifiedEcommerceAPI:
     """
     Unified interface for all e-commerce platforms
     Handles fallbacks and aggregation
+
+    ``base_urls`` ({'amazon': ..., 'flipkart': ...}) overrides vendor API
+    roots, e.g. to run against a local mock_vendor server. With
+    ``stream_responses`` Amazon and Flipkart responses are parsed
+    incrementally. Platforms return Product records; serialize results
+    with ``product_record.to_jsonable`` (or ``serialize``).
     """
-    def __init__(self):
-        self.amazon = AmazonProductAPI()#Currently NO WORKING DUE TO SIGNING ISSUES
-        self.flipkart = FlipkartAPI()
+    # Per-platform wait budgets (seconds) and the overall fan-out deadline
+    PLATFORM_TIMEOUTS = {
+        'amazon': 3.0,
+        'flipkart': 3.0,
+        'blinkit': 1.0,
+        'instamart': 1.0
+    }
+    SEARCH_DEADLINE = 4.0
+    MOCK_PLATFORMS = ('blinkit', 'instamart')
+
+    def __init__(self, max_workers: int = 16, cache: Optional[SearchCache] = None,
+                 inflight: Optional[SingleFlight] = None,
+                 base_urls: Optional[Dict[str, str]] = None, stream_responses: bool = False):
+        base_urls = base_urls or {}
+        self.amazon = AmazonProductAPI(base_urls.get('amazon'), stream=stream_responses)
+        self.flipkart = FlipkartAPI(base_urls.get('flipkart'), stream=stream_responses)
         self.blinkit = BlinkitAPI()  # Mock
         self.instamart = SwiggyInstamartAPI()  # Mock
-        
-        
-    def search_all_platforms(self, query: str, platforms: List[str] = None) -> Dict[str, List[Dict]]:
+        # Searches are cached per vendor endpoint and response mode
+        self._sources = {
+            platform: f"{client.base_url}|{'stream' if getattr(client, 'stream', False) else 'body'}"
+            for platform, client in (('amazon', self.amazon), ('flipkart', self.flipkart),
+                                     ('blinkit', self.blinkit), ('instamart', self.instamart))
+        }
+        self.cache = cache or get_search_cache()
+        self.inflight = inflight or get_single_flight()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='fitx-vendor')
+
+    def close(self) -> None:
+        """Release the worker threads (searches already running finish in the background)"""
+        self._executor.shutdown(wait=False)
+
+    def __enter__(self) -> 'UnifiedEcommerceAPI':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _cache_key(self, platform: str, query: str, category: Optional[str] = None):
+        return cache_key(query, category, platform, self._sources[platform])
+
+    def _fetch(self, platform: str, query: str, category: Optional[str] = None):
+        """Query one platform directly (no cache), recording 'platform' metrics"""
+        metrics = get_metrics()
+        if not metrics.enabled:
+            return self._fetch_platform(platform, query, category)
+        start = time.perf_counter()
+        try:
+            result = self._fetch_platform(platform, query, category)
+        except Exception:
+            metrics.record('platform', platform, time.perf_counter() - start, error=True)
+            raise
+        metrics.record('platform', platform, time.perf_counter() - start, payload_size(result),
+                       not is_cacheable(result))
+        return result
+
+    def _fetch_platform(self, platform: str, query: str, category: Optional[str] = None):
+        if platform == 'amazon':
+            return self.amazon.search_items(query, category) if category else self.amazon.search_items(query)
+        if platform == 'flipkart':
+            return self.flipkart.search_products(query, category) if category else self.flipkart.search_products(query)
+        if platform == 'blinkit':
+            return self.blinkit.search_products(query)
+        return self.instamart.search_products(query)
+
+    def _fetch_and_cache(self, platform: str, query: str, category: Optional[str] = None):
+        result = self._fetch(platform, query, category)
+        if is_cacheable(result):
+            self.cache.put(self._cache_key(platform, query, category), result)
+        return result
+
+    @instrument(kind='api')
+    def search_all_platforms(self, query: str, platforms: List[str] = None,
+                             concurrent: bool = True,
+                             timeouts: Optional[Dict[str, float]] = None,
+                             deadline: Optional[float] = None,
+                             category: Optional[str] = None,
+                             use_cache: bool = True) -> Dict[str, List[Product]]:
         """
         Search across multiple platforms
         Returns aggregated results
+
+        Results are served from the shared search cache when possible
+        (stale entries are returned immediately and refreshed in the
+        background). With ``concurrent`` (the default) the remaining
+        platforms are queried in parallel. Each platform gets its own
+        timeout and the whole search stops at ``deadline``; platforms that
+        have not answered by then are reported as ``{'error': 'timeout', ...}``
+        while the others return normally, so latency is bounded by the
+        slowest platform that answers in time rather than the sum of all
+        of them.
         """
         if platforms is None:
             platforms = ['amazon', 'flipkart']  # Only real APIs by default
-        
+        platforms = [p for p in ('amazon', 'flipkart', 'blinkit', 'instamart') if p in platforms]
+
         results = {}
+        to_fetch = []
+        for platform in platforms:
+            cached = None
+            if use_cache:
+                cached = self.cache.get(
+                    self._cache_key(platform, query, category),
+                    refresh=lambda platform=platform: self.inflight.do(
+                        self._cache_key(platform, query, category), self._fetch_and_cache, platform, query, category),
+                    executor=self._executor
+                )
+            if cached is not None:
+                results[platform] = cached
+            else:
+                to_fetch.append(platform)
+
+        if concurrent:
+            results.update(self._search_concurrently(query, to_fetch, timeouts, deadline, category))
+        else:
+            for platform in to_fetch:
+                try:
+                    results[platform] = self.inflight.do(self._cache_key(platform, query, category),
+                                                         self._fetch_and_cache, platform, query, category)
+                except Exception as e:
+                    results[platform] = {'error': str(e)}
+        results = {platform: results[platform] for platform in platforms}
         
-        if 'amazon' in platforms:
-            try:
-                results['amazon'] = self.amazon.search_items(query)
-            except Exception as e:
-                results['amazon'] = {'error': str(e)}
-        
-        if 'flipkart' in platforms:
-            try:
-                results['flipkart'] = self.flipkart.search_products(query)
-            except Exception as e:
-                results['flipkart'] = {'error': str(e)}
-        
-        if 'blinkit' in platforms:
-            results['blinkit'] = self.blinkit.search_products(query)
-            results['blinkit_note'] = 'Mock data - no public API'
-        
-        if 'instamart' in platforms:
-            results['instamart'] = self.instamart.search_products(query)
-            results['instamart_note'] = 'Mock data - no public API'
+        for platform in self.MOCK_PLATFORMS:
+            if platform in results:
+                results[f'{platform}_note'] = 'Mock data - no public API'
         
         return results
+
+    def _search_concurrently(self, query: str, platforms: List[str],
+                             timeouts: Optional[Dict[str, float]],
+                             deadline: Optional[float],
+                             category: Optional[str] = None) -> Dict:
+        start = time.monotonic()
+        overall = start + (deadline if deadline is not None else self.SEARCH_DEADLINE)
+        budgets = dict(self.PLATFORM_TIMEOUTS, **(timeouts or {}))
+
+        futures = {}
+        for platform in platforms:
+            # Identical searches already in flight (from any session) share one upstream call
+            future = self.inflight.submit(self._cache_key(platform, query, category), self._executor,
+                                          self._fetch_and_cache, platform, query, category)
+            futures[future] = (platform, min(start + budgets.get(platform, self.SEARCH_DEADLINE), overall))
+
+        results = {}
+        pending = set(futures)
+        while pending:
+            now = time.monotonic()
+            for future in [f for f in pending if futures[f][1] <= now]:
+                # Expired: stop waiting (the worker finishes in the background and still fills the cache)
+                platform = futures[future][0]
+                pending.discard(future)
+                results[platform] = {'error': f'timeout after {futures[future][1] - start:.1f}s',
+                                     'source': platform}
+            if not pending:
+                break
+            next_expiry = min(futures[f][1] for f in pending)
+            done, pending = wait(pending, timeout=max(0.0, next_expiry - now), return_when=FIRST_COMPLETED)
+            for future in done:
+                platform = futures[future][0]
+                try:
+                    results[platform] = future.result()
+                except Exception as e:
+                    results[platform] = {'error': str(e), 'source': platform}
+
+        return results
+
+    async def search_all_platforms_async(self, query: str, platforms: List[str] = None,
+                                         timeouts: Optional[Dict[str, float]] = None,
+                                         deadline: Optional[float] = None,
+                                         category: Optional[str] = None) -> Dict[str, List[Product]]:
+        """Awaitable search_all_platforms for async callers (e.g. ADK async tools)"""
+        return await asyncio.get_running_loop().run_in_executor(
+            None, lambda: self.search_all_platforms(query, platforms, True, timeouts, deadline, category)
+        )
     
-    def compare_prices(self, product_name: str) -> List[Dict]:
-        """Compare prices across platforms"""
+    def compare_prices(self, product_name: str) -> List[Product]:
+        """Compare prices across platforms, cheapest first"""
         all_results = self.search_all_platforms(product_name)
         
-        # Flatten and sort by price
+        # Flatten and sort by the price normalized at parse time
         all_products = []
         for platform, products in all_results.items():
             if isinstance(products, list):
                 all_products.extend(products)
         
-        # Sort by price (implement proper price parsing)
+        all_products.sort(key=self._price_sort_key)
         return all_products
     
-    def get_best_deal(self, product_name: str) -> Dict:
-        """Find the best deal across all platforms"""
+    def get_best_deal(self, product_name: str) -> Optional[Product]:
+        """Find the best deal across all platforms (None when nothing is priced)"""
         products = self.compare_prices(product_name)
         
-        # Logic to determine "best" (lowest price, fastest delivery, etc.)
-        if products:
-            return min(products, key=lambda x: self._extract_numeric_price(x.get('price', '9999')))
-        return {}
+        # compare_prices is sorted, so the first priced product is the cheapest
+        if products and products[0].price_paise is not None:
+            return products[0]
+        return None
     
-    def _extract_numeric_price(self, price_string: str) -> float:
-        """Extract numeric price from string"""
-        try:
-            import re
-            numbers = re.findall(r'\d+\.?\d*', str(price_string))
-            return float(numbers[0]) if numbers else float('inf')
-        except:
-            return float('inf')
+    @staticmethod
+    def _price_sort_key(product: Product):
+        # Unpriced products last; INR before other currencies
+        return (product.price_paise is None, product.currency != 'INR', product.price_paise or 0)
 
 
 # ==================== INTEGRATION WITH FITX AGENTS ====================
@@ -321,6 +439,8 @@ class UnifiedEcommerceAPI:
 def integrate_with_fitness_agent():
     """
     Example of integrating with the main FitX agent
+
+    Tools return compact shaped JSON (see FitX.tools.response_shaping).
     """
     ecommerce = UnifiedEcommerceAPI()
     
@@ -328,7 +448,7 @@ def integrate_with_fitness_agent():
     def search_fitness_equipment_real(query: str, category: str = "fitness") -> str:
         """Real API version"""
         results = ecommerce.search_all_platforms(query, platforms=['amazon', 'flipkart'])
-        return json.dumps(results, indent=2)
+        return dumps(shape_response('search_all_platforms', results))
     
     def search_healthy_food_real(dietary_type: str, meal_type: str = "any") -> str:
         """Real API version (mock for Blinkit/Instamart)"""
@@ -338,12 +458,12 @@ def integrate_with_fitness_agent():
             'instamart': ecommerce.instamart.search_products(f"{dietary_type} {meal_type}"),
             'note': 'These platforms do not have public APIs. Consider web scraping or partnerships.'
         }
-        return json.dumps(results, indent=2)
+        return dumps(shape_response('search_all_platforms', results))
     
     def search_athletic_wear_real(item_type: str, activity: str = "general") -> str:
         """Real API version"""
         results = ecommerce.search_all_platforms(item_type, platforms=['amazon', 'flipkart'])
-        return json.dumps(results, indent=2)
+        return dumps(shape_response('search_all_platforms', results))
     
     return {
         'search_fitness_equipment': search_fitness_equipment_real,
@@ -360,14 +480,13 @@ if __name__ == "__main__":
     print("="*60)
     
     # Example usage
-    ecommerce = UnifiedEcommerceAPI()
-    
-    # Search for fitness equipment
-    print("\nSearching for 'dumbbells'...")
-    results = ecommerce.search_all_platforms('dumbbells', platforms=['amazon', 'flipkart'])
-    print(json.dumps(results, indent=2))
-    
-    # Find best deal
-    print("\nFinding best deal for 'yoga mat'...")
-    best_deal = ecommerce.get_best_deal('yoga mat')
-    print(json.dumps(best_deal, indent=2))
+    with UnifiedEcommerceAPI() as ecommerce:
+        # Search for fitness equipment
+        print("\nSearching for 'dumbbells'...")
+        results = ecommerce.search_all_platforms('dumbbells', platforms=['amazon', 'flipkart'])
+        print(json.dumps(results, indent=2, default=to_jsonable))
+
+        # Find best deal
+        print("\nFinding best deal for 'yoga mat'...")
+        best_deal = ecommerce.get_best_deal('yoga mat')
+        print(json.dumps(best_deal, indent=2, default=to_jsonable))
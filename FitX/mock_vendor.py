@@ -0,0 +1,434 @@
+"""
+Local mock vendor server for offline load testing of the e-commerce layer
+
+Speaks the Amazon PA-API 5 SearchItems and Flipkart affiliate search /
+product response shapes on their real paths, with configurable latency
+distributions, error rates and 429 throttling per vendor. Point the
+clients at it with ``FITX_MOCK_VENDOR_URL`` (or the per-vendor
+``FITX_AMAZON_BASE_URL`` / ``FITX_FLIPKART_BASE_URL``, see vendor_http).
+
+Usage (from the FitX directory):
+    python -m mock_vendor --port 8765 --latency lognormal:40:0.5 --error-rate 0.01 --rate-limit 50
+    FITX_MOCK_VENDOR_URL=http://127.0.0.1:8765 python -m benchmarks.bench_load
+"""
+
+import argparse
+import json
+import math
+import random
+import sys
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+
+VENDORS = ('amazon', 'flipkart')
+
+# Path prefixes of each vendor's API, matching vendor_http.MOCK_VENDOR_PATHS
+AMAZON_SEARCH_PATH = '/paapi5/searchitems'
+FLIPKART_SEARCH_PATH = '/affiliate/search/json'
+FLIPKART_PRODUCT_PATH = '/affiliate/product/json'
+STATS_PATH = '/__mock/stats'
+
+DEFAULT_RESULT_COUNT = 10
+
+_PRODUCT_VARIANTS = ('Pro', 'Classic', 'Lite', 'Max', 'Essential', 'Sport', 'Elite', 'Flex', 'Core', 'Plus')
+_BRANDS = ('Boldfit', 'Decathlon', 'Nivia', 'Cockatoo', 'Kore', 'Strauss', 'Lifelong', 'PowerMax')
+
+
+class LatencyModel:
+    """
+    Response delay distribution.
+
+    Specs are ``fixed:MS``, ``uniform:LO_MS:HI_MS``, ``lognormal:MEDIAN_MS:SIGMA``
+    or ``exp:MEAN_MS``, optionally followed by ``@P:MS`` to add a tail:
+    with probability P the delay is MS instead (e.g. ``lognormal:40:0.4@0.01:2000``).
+
+    Example:
+        >>> LatencyModel.parse('uniform:20:80').sample(random.Random(0))
+        0.0706...
+    """
+
+    KINDS = ('fixed', 'uniform', 'lognormal', 'exp')
+
+    def __init__(self, kind: str = 'fixed', a: float = 0.0, b: float = 0.0,
+                 tail_probability: float = 0.0, tail_ms: float = 0.0):
+        if kind not in self.KINDS:
+            raise ValueError(f'unknown latency distribution {kind!r} (expected one of {self.KINDS})')
+        self.kind = kind
+        self.a = a
+        self.b = b
+        self.tail_probability = tail_probability
+        self.tail_ms = tail_ms
+
+    @classmethod
+    def parse(cls, spec: str) -> 'LatencyModel':
+        spec, _, tail = spec.partition('@')
+        kind, *params = spec.split(':')
+        values = [float(p) for p in params] + [0.0, 0.0]
+        tail_probability, tail_ms = (float(p) for p in tail.split(':')) if tail else (0.0, 0.0)
+        return cls(kind, values[0], values[1], tail_probability, tail_ms)
+
+    def sample(self, rng: random.Random) -> float:
+        """Delay in seconds"""
+        if self.tail_probability and rng.random() < self.tail_probability:
+            return self.tail_ms / 1000
+        if self.kind == 'fixed':
+            ms = self.a
+        elif self.kind == 'uniform':
+            ms = rng.uniform(self.a, self.b)
+        elif self.kind == 'lognormal':
+            ms = self.a * math.exp(rng.gauss(0.0, self.b))
+        else:
+            ms = rng.expovariate(1.0 / self.a) if self.a > 0 else 0.0
+        return max(ms, 0.0) / 1000
+
+    def __repr__(self) -> str:
+        tail = f'@{self.tail_probability}:{self.tail_ms}' if self.tail_probability else ''
+        return f'LatencyModel({self.kind}:{self.a}:{self.b}{tail})'
+
+
+class VendorBehavior:
+    """
+    How one mocked vendor responds.
+
+    Args:
+        latency: Delay distribution applied to every request
+        error_rate: Probability of a 500 (Amazon: InternalFailure) response
+        rate_limit: Sustained requests/second before 429s (0 = unlimited),
+                    enforced with a token bucket of ``burst`` requests
+        burst: Token bucket size (defaults to one second of ``rate_limit``)
+        throttle_rate: Extra probability of a 429 regardless of rate
+        result_count: Products per search response
+    """
+
+    def __init__(self, latency: Optional[LatencyModel] = None, error_rate: float = 0.0,
+                 rate_limit: float = 0.0, burst: Optional[float] = None, throttle_rate: float = 0.0,
+                 result_count: int = DEFAULT_RESULT_COUNT):
+        self.latency = latency or LatencyModel()
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.burst = burst if burst is not None else max(rate_limit, 1.0)
+        self.throttle_rate = throttle_rate
+        self.result_count = result_count
+
+
+class _VendorState:
+    """Token bucket and counters for one vendor (guarded by the server lock)"""
+
+    def __init__(self, behavior: VendorBehavior):
+        self.behavior = behavior
+        self.tokens = behavior.burst
+        self.refilled = time.monotonic()
+        self.counts = {'requests': 0, 'ok': 0, 'errors': 0, 'throttled': 0}
+
+    def take_token(self, now: float) -> bool:
+        rate = self.behavior.rate_limit
+        if not rate:
+            return True
+        self.tokens = min(self.behavior.burst, self.tokens + (now - self.refilled) * rate)
+        self.refilled = now
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return True
+        return False
+
+    def retry_after(self) -> int:
+        rate = self.behavior.rate_limit
+        return max(1, math.ceil((1.0 - self.tokens) / rate)) if rate else 1
+
+
+# ==================== RESPONSE SHAPES ====================
+
+def _query_seed(vendor: str, query: str) -> int:
+    return zlib.crc32(f'{vendor}|{" ".join(query.lower().split())}'.encode('utf-8'))
+
+
+def _mock_products(vendor: str, query: str, count: int) -> List[Dict]:
+    """Deterministic products for a query: same query, same results"""
+    rng = random.Random(_query_seed(vendor, query))
+    title = ' '.join(word.capitalize() for word in query.split()) or 'Fitness Product'
+    products = []
+    for i in range(count):
+        price = rng.randrange(299, 19999, 10)
+        products.append({
+            'id': f'{zlib.crc32(f"{vendor}{query}{i}".encode()):08X}',
+            'title': f'{rng.choice(_BRANDS)} {title} {_PRODUCT_VARIANTS[i % len(_PRODUCT_VARIANTS)]}',
+            'price': price,
+            'mrp': price + rng.randrange(0, price // 2 + 10, 10),
+            'rating': round(rng.uniform(3.2, 4.9), 1),
+            'reviews': rng.randrange(5, 20000),
+            'in_stock': rng.random() > 0.05
+        })
+    return products
+
+
+def amazon_search_response(query: str, count: int, search_index: str = 'All') -> Dict:
+    """PA-API 5 SearchItems response body"""
+    items = []
+    for product in _mock_products('amazon', query, count):
+        asin = f'B0{product["id"]}'
+        items.append({
+            'ASIN': asin,
+            'DetailPageURL': f'https://www.amazon.in/dp/{asin}?tag=mock-21&linkCode=ogi&th=1&psc=1',
+            'Images': {'Primary': {'Large': {'URL': f'https://m.media-amazon.com/images/I/{asin}._SL500_.jpg',
+                                             'Height': 500, 'Width': 500}}},
+            'ItemInfo': {
+                'Title': {'DisplayValue': product['title'], 'Label': 'Title', 'Locale': 'en_IN'},
+                'Features': {'DisplayValues': ['Durable build', 'Ideal for home workouts'],
+                             'Label': 'Features', 'Locale': 'en_IN'}
+            },
+            'Offers': {'Listings': [{
+                'Id': f'mock-listing-{asin}',
+                'Availability': {'Message': 'In stock' if product['in_stock'] else 'Currently unavailable',
+                                 'Type': 'Now' if product['in_stock'] else 'Unavailable'},
+                'Price': {'Amount': float(product['price']), 'Currency': 'INR',
+                          'DisplayAmount': f'₹{product["price"]:,}.00'},
+                'SavingBasis': {'Amount': float(product['mrp']), 'Currency': 'INR',
+                                'DisplayAmount': f'₹{product["mrp"]:,}.00'}
+            }]},
+            'CustomerReviews': {'Count': product['reviews'], 'StarRating': {'Value': product['rating']}}
+        })
+    return {'SearchResult': {
+        'Items': items,
+        'SearchURL': f'https://www.amazon.in/s?k={query.replace(" ", "+")}&i={search_index}&tag=mock-21',
+        'TotalResultCount': count
+    }}
+
+
+def _flipkart_product(product: Dict, query: str) -> Dict:
+    discount = round(100 * (product['mrp'] - product['price']) / product['mrp']) if product['mrp'] else 0
+    return {
+        'productBaseInfoV1': {
+            'productId': f'FK{product["id"]}',
+            'title': product['title'],
+            'productDescription': f'{product["title"]} for {query}',
+            'imageUrls': {'200x200': f'https://rukminim1.flixcart.com/image/200/200/{product["id"]}.jpeg',
+                          '400x400': f'https://rukminim1.flixcart.com/image/400/400/{product["id"]}.jpeg'},
+            'maximumRetailPrice': {'amount': float(product['mrp']), 'currency': 'INR'},
+            'flipkartSellingPrice': {'amount': float(product['price']), 'currency': 'INR'},
+            'flipkartSpecialPrice': {'amount': float(product['price']), 'currency': 'INR'},
+            'productUrl': f'https://dl.flipkart.com/dl/p/itm{product["id"].lower()}?affid=mock',
+            'productBrand': product['title'].split()[0],
+            'inStock': product['in_stock'],
+            'codAvailable': True,
+            'discountPercentage': float(discount),
+            'rating': {'average': product['rating'], 'count': product['reviews']},
+            'categoryPath': 'Sports, Books and More>Exercise & Fitness'
+        },
+        'productShippingInfoV1': {'shippingCharges': {'amount': 0.0, 'currency': 'INR'},
+                                  'sellerName': 'MockRetail', 'sellerAverageRating': 4.3},
+        'categorySpecificInfoV1': {'keySpecs': [], 'detailedSpecs': []}
+    }
+
+
+def flipkart_search_response(query: str, count: int) -> Dict:
+    """Flipkart affiliate search (v1, JSON) response body"""
+    return {'products': [_flipkart_product(product, query)
+                         for product in _mock_products('flipkart', query, count)]}
+
+
+# Error bodies in each vendor's own format
+def _amazon_error(status: int) -> Dict:
+    if status == 429:
+        return {'__type': 'com.amazon.paapi5#TooManyRequestsException',
+                'Errors': [{'Code': 'TooManyRequests',
+                            'Message': 'The request was denied due to request throttling.'}]}
+    return {'__type': 'com.amazon.paapi5#InternalFailure',
+            'Errors': [{'Code': 'InternalFailure',
+                        'Message': 'The request processing has failed because of an unknown error.'}]}
+
+
+def _flipkart_error(status: int) -> Dict:
+    message = 'Rate limit exceeded' if status == 429 else 'Internal server error'
+    return {'error': message, 'errorCode': status}
+
+
+# ==================== SERVER ====================
+
+class _ThreadingServer(ThreadingHTTPServer):
+    def handle_error(self, request, client_address):
+        # Clients hang up on purpose (early-stopping parsers, timeouts, hedge losers)
+        if isinstance(sys.exc_info()[1], ConnectionError):
+            return
+        super().handle_error(request, client_address)
+
+
+class MockVendorServer:
+    """
+    Threaded HTTP server mocking the vendor APIs.
+
+    Args:
+        behaviors: Per-vendor VendorBehavior (missing vendors use ``default``)
+        default: Behavior for vendors not listed in ``behaviors``
+        host, port: Bind address (port 0 picks a free port)
+        seed: Seed for latency/error sampling, so runs are repeatable
+
+    Example:
+        >>> server = MockVendorServer(default=VendorBehavior(LatencyModel.parse('lognormal:40:0.5'))).start()
+        >>> os.environ['FITX_MOCK_VENDOR_URL'] = server.url
+        >>> ...
+        >>> server.stop()
+    """
+
+    def __init__(self, behaviors: Optional[Dict[str, VendorBehavior]] = None,
+                 default: Optional[VendorBehavior] = None,
+                 host: str = '127.0.0.1', port: int = 0, seed: int = 0):
+        default = default or VendorBehavior()
+        self._states = {vendor: _VendorState((behaviors or {}).get(vendor, default)) for vendor in VENDORS}
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = _ThreadingServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._server.request_queue_size = 1024
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self) -> 'MockVendorServer':
+        self._thread = threading.Thread(target=self._server.serve_forever, name='fitx-mock-vendor', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def serve_forever(self) -> None:
+        self._server.serve_forever()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {vendor: dict(state.counts) for vendor, state in self._states.items()}
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            for state in self._states.values():
+                state.counts = dict.fromkeys(state.counts, 0)
+
+    def _decide(self, vendor: str):
+        """Sample (delay seconds, status, Retry-After) for one request"""
+        with self._lock:
+            state = self._states[vendor]
+            behavior = state.behavior
+            state.counts['requests'] += 1
+            delay = behavior.latency.sample(self._rng)
+            if not state.take_token(time.monotonic()) or self._rng.random() < behavior.throttle_rate:
+                state.counts['throttled'] += 1
+                return delay, 429, state.retry_after()
+            if self._rng.random() < behavior.error_rate:
+                state.counts['errors'] += 1
+                return delay, 500, None
+            state.counts['ok'] += 1
+            return delay, 200, None
+
+    def _handler_class(self):
+        mock = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True
+
+            def _send(self, status: int, body: Dict, retry_after: Optional[int] = None) -> None:
+                payload = json.dumps(body).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                if retry_after is not None:
+                    self.send_header('Retry-After', str(retry_after))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def _respond(self, vendor: str, build_body, build_error) -> None:
+                delay, status, retry_after = mock._decide(vendor)
+                if delay:
+                    time.sleep(delay)
+                if status != 200:
+                    self._send(status, build_error(status), retry_after)
+                else:
+                    self._send(200, build_body(mock._states[vendor].behavior.result_count))
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+                if urlparse(self.path).path.lower() != AMAZON_SEARCH_PATH:
+                    self._send(404, {'error': f'unknown path {self.path}'})
+                    return
+                try:
+                    request = json.loads(body or b'{}')
+                except ValueError:
+                    self._send(400, {'__type': 'com.amazon.paapi5#ValidationException',
+                                     'Errors': [{'Code': 'InvalidInput', 'Message': 'Malformed JSON body'}]})
+                    return
+                keywords = str(request.get('Keywords') or '')
+                self._respond('amazon',
+                              lambda count: amazon_search_response(keywords, count,
+                                                                   request.get('SearchIndex') or 'All'),
+                              _amazon_error)
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+                if url.path == STATS_PATH:
+                    self._send(200, mock.stats())
+                elif url.path == FLIPKART_SEARCH_PATH:
+                    query = params.get('query', '')
+                    self._respond('flipkart',
+                                  lambda count: flipkart_search_response(
+                                      query, min(count, int(params.get('resultCount') or count))),
+                                  _flipkart_error)
+                elif url.path == FLIPKART_PRODUCT_PATH:
+                    product_id = params.get('id', '')
+                    self._respond('flipkart',
+                                  lambda count: _flipkart_product(_mock_products('flipkart', product_id, 1)[0],
+                                                                  product_id),
+                                  _flipkart_error)
+                else:
+                    self._send(404, {'error': f'unknown path {url.path}'})
+
+            def log_message(self, *args):
+                pass
+
+        return _Handler
+
+
+def _behavior_from_args(args, prefix: str = '') -> VendorBehavior:
+    def pick(name):
+        value = getattr(args, f'{prefix}{name}', None)
+        return value if value is not None else getattr(args, name)
+
+    return VendorBehavior(latency=LatencyModel.parse(pick('latency')), error_rate=pick('error_rate'),
+                          rate_limit=pick('rate_limit'), throttle_rate=pick('throttle_rate'),
+                          result_count=args.results)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', default='fixed:0', help='Latency spec, e.g. lognormal:40:0.5@0.01:1500')
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--rate-limit', type=float, default=0.0, help='Requests/second per vendor before 429s')
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help='Random 429 probability')
+    parser.add_argument('--results', type=int, default=DEFAULT_RESULT_COUNT, help='Products per search')
+    parser.add_argument('--seed', type=int, default=0)
+    for vendor in VENDORS:
+        parser.add_argument(f'--{vendor}-latency', help=f'Override --latency for {vendor}')
+        parser.add_argument(f'--{vendor}-error-rate', type=float)
+        parser.add_argument(f'--{vendor}-rate-limit', type=float)
+        parser.add_argument(f'--{vendor}-throttle-rate', type=float)
+    args = parser.parse_args()
+
+    server = MockVendorServer({vendor: _behavior_from_args(args, f'{vendor}_') for vendor in VENDORS},
+                              host=args.host, port=args.port, seed=args.seed)
+    print(f'mock vendors listening on {server.url} (stats at {server.url}{STATS_PATH})')
+    print(f'  export FITX_MOCK_VENDOR_URL={server.url}')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,94 @@
+"""
+Price normalization for FitX e-commerce results
+
+Vendor prices arrive as numbers (Flipkart ``amount``, PA-API ``Amount``)
+or display strings ("₹2,499", "INR 1499.00", "Rs. 999", "₹350/kg"). They
+are parsed once, when a vendor response is parsed, into integer paise plus
+an ISO currency code so comparisons never re-parse strings.
+"""
+
+import math
+import re
+from typing import Any, Optional
+
+from FitX.tools.product_record import format_price
+
+
+_CURRENCY_SYMBOLS = {
+    '₹': 'INR',
+    'rs': 'INR',
+    'inr': 'INR',
+    '$': 'USD',
+    'usd': 'USD'
+}
+
+# Optional currency marker, then an amount with optional thousands
+# separators (Indian "1,00,000" or western "100,000") and up to 2 decimals
+_PRICE_RE = re.compile(
+    r'(?P<currency>₹|\$|\b(?:rs|inr|usd)\b\.?)?\s*'
+    r'(?P<whole>\d{1,3}(?:,\d{2,3})+|\d+)(?:\.(?P<fraction>\d{1,2})\d*)?',
+    re.IGNORECASE
+)
+
+
+class Price:
+    """Exact price as integer minor units (paise for INR) plus currency"""
+
+    __slots__ = ('minor_units', 'currency')
+
+    def __init__(self, minor_units: int, currency: str = 'INR'):
+        self.minor_units = minor_units
+        self.currency = currency
+
+    @classmethod
+    def from_amount(cls, amount: Any, currency: Optional[str] = None) -> Optional['Price']:
+        """Build from a numeric amount in major units (None when missing or not finite)"""
+        if amount is None or isinstance(amount, bool):
+            return None
+        if isinstance(amount, (int, float)):
+            if not math.isfinite(amount):
+                return None
+            return cls(int(round(amount * 100)), (currency or 'INR').upper())
+        return parse_price(amount, currency or 'INR')
+
+    @property
+    def amount(self) -> float:
+        return self.minor_units / 100
+
+    def __eq__(self, other) -> bool:
+        return (isinstance(other, Price) and self.minor_units == other.minor_units
+                and self.currency == other.currency)
+
+    def __lt__(self, other: 'Price') -> bool:
+        return (self.currency, self.minor_units) < (other.currency, other.minor_units)
+
+    def __hash__(self) -> int:
+        return hash((self.minor_units, self.currency))
+
+    def __repr__(self) -> str:
+        return f'Price({format_price(self.minor_units, self.currency)!r})'
+
+
+def parse_price(value: Any, default_currency: str = 'INR') -> Optional[Price]:
+    """
+    Parse a vendor price (number or display string) into a Price.
+
+    Returns None when no amount can be found (e.g. "Price not available")
+    or a numeric amount is NaN or infinite.
+    For unit prices like "₹350/kg" the leading amount is used.
+    """
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        if not math.isfinite(value):
+            return None
+        return Price(int(round(value * 100)), default_currency)
+
+    match = _PRICE_RE.search(str(value))
+    if match is None:
+        return None
+    marker = (match.group('currency') or '').rstrip('.').lower()
+    currency = _CURRENCY_SYMBOLS.get(marker, default_currency)
+    whole = int(match.group('whole').replace(',', ''))
+    fraction = (match.group('fraction') or '0').ljust(2, '0')
+    return Price(whole * 100 + int(fraction), currency)
@@ -0,0 +1,239 @@
+"""
+Product search result cache for FitX e-commerce lookups
+
+TTL + LRU cache keyed by vendor endpoint and normalized (query, category,
+platform), with
+per-platform TTLs, stale-while-revalidate and hit/miss counters, plus
+single-flight coalescing of identical in-flight searches. Both are shared
+by every UnifiedEcommerceAPI instance in the process so repeated searches
+("dumbbells", "yoga mat", ...) are answered without calling the vendors.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+# Fresh lifetime per platform (seconds); quick-commerce stock moves faster
+PLATFORM_TTLS = {
+    'amazon': 900,
+    'flipkart': 900,
+    'blinkit': 300,
+    'instamart': 300
+}
+DEFAULT_TTL = 600
+
+
+def normalize_query(query: str) -> str:
+    """Lowercase and collapse whitespace so trivially different queries share an entry"""
+    return ' '.join(str(query).lower().split())
+
+
+def cache_key(query: str, category: Optional[str], platform: str, source: str = '') -> Tuple[str, str, str, str]:
+    """
+    Cache and single-flight key for one platform search.
+
+    ``source`` identifies the vendor endpoint and response mode the result
+    came from, so clients pointed at different servers (or parsing
+    differently) never share entries. The platform stays last: it selects
+    the entry's TTL.
+    """
+    return (source, normalize_query(query), normalize_query(category or ''), platform)
+
+
+class SearchCache:
+    """
+    Size-bounded LRU cache with per-platform TTLs and stale-while-revalidate.
+
+    An entry is fresh for its platform TTL, then stale for ``stale_factor``
+    times that long: stale reads return the old value immediately and
+    schedule one background refresh per key. Cached values are shared
+    between callers and must be treated as read-only.
+    """
+
+    def __init__(self, max_entries: int = 5000,
+                 ttls: Optional[Dict[str, float]] = None,
+                 default_ttl: float = DEFAULT_TTL,
+                 stale_factor: float = 1.0):
+        self.max_entries = max_entries
+        self.ttls = dict(PLATFORM_TTLS, **(ttls or {}))
+        self.default_ttl = default_ttl
+        self.stale_factor = stale_factor
+        self._entries: "OrderedDict[Tuple, Tuple[Any, float, float]]" = OrderedDict()
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.refreshes = 0
+
+    def get(self, key: Tuple, refresh: Callable[[], Any] = None, executor=None) -> Optional[Any]:
+        """
+        Look up a key, returning None on a miss.
+
+        If the entry is stale and ``refresh``/``executor`` are given, the
+        stale value is returned and ``refresh()`` is run on the executor to
+        repopulate the entry.
+        """
+        schedule = False
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, fresh_until, stale_until = entry
+            now = time.monotonic()
+            if now < fresh_until:
+                self.hits += 1
+            elif now < stale_until:
+                self.stale_hits += 1
+                if refresh is not None and executor is not None and key not in self._refreshing:
+                    self._refreshing.add(key)
+                    schedule = True
+            else:
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+
+        if schedule:
+            executor.submit(self._refresh, key, refresh)
+        return value
+
+    def put(self, key: Tuple, value: Any) -> None:
+        ttl = self.ttls.get(key[-1], self.default_ttl)
+        now = time.monotonic()
+        with self._lock:
+            self._entries[key] = (value, now + ttl, now + ttl * (1 + self.stale_factor))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def _refresh(self, key: Tuple, refresh: Callable[[], Any]) -> None:
+        try:
+            value = refresh()
+            if is_cacheable(value):
+                self.put(key, value)
+                self.refreshes += 1
+        except Exception:
+            pass  # keep serving the stale value until it expires
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.stale_hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'hits': self.hits,
+                'stale_hits': self.stale_hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'background_refreshes': self.refreshes,
+                'hit_rate': round((self.hits + self.stale_hits) / lookups, 3) if lookups else 0.0
+            }
+
+
+def is_cacheable(result: Any) -> bool:
+    """Only successful vendor results are cached; errors are retried next time"""
+    return not (isinstance(result, dict) and 'error' in result)
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls with the same key into one upstream call.
+
+    The first caller for a key (the leader) runs the function; callers that
+    arrive while it is in flight receive the same Future/result instead of
+    issuing their own request. The key is released as soon as the call
+    completes, so later calls go upstream again (or hit the cache).
+    """
+
+    def __init__(self):
+        self._calls: Dict[Tuple, Future] = {}
+        self._lock = threading.Lock()
+        self.leaders = 0
+        self.coalesced = 0
+
+    def _join_or_lead(self, key: Tuple) -> Tuple[Future, bool]:
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                self.coalesced += 1
+                return future, False
+            future = self._calls[key] = Future()
+            self.leaders += 1
+            return future, True
+
+    def _run(self, key: Tuple, future: Future, fn: Callable, args: tuple) -> None:
+        try:
+            result = fn(*args)
+        except BaseException as e:
+            with self._lock:
+                self._calls.pop(key, None)
+            future.set_exception(e)
+        else:
+            with self._lock:
+                self._calls.pop(key, None)
+            future.set_result(result)
+
+    def submit(self, key: Tuple, executor, fn: Callable, *args) -> Future:
+        """Run ``fn(*args)`` on ``executor`` unless an identical call is already in flight"""
+        future, leader = self._join_or_lead(key)
+        if leader:
+            try:
+                executor.submit(self._run, key, future, fn, args)
+            except BaseException as e:
+                # e.g. the executor is shut down: release the key so later calls are not stuck
+                with self._lock:
+                    self._calls.pop(key, None)
+                future.set_exception(e)
+                raise
+        return future
+
+    def do(self, key: Tuple, fn: Callable, *args) -> Any:
+        """Run ``fn(*args)`` in the calling thread, or wait for the in-flight identical call"""
+        future, leader = self._join_or_lead(key)
+        if leader:
+            self._run(key, future, fn, args)
+        return future.result()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {'in_flight': len(self._calls), 'upstream_calls': self.leaders, 'coalesced': self.coalesced}
+
+
+_default_cache: Optional[SearchCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_search_cache() -> SearchCache:
+    """Return the process-wide product search cache"""
+    global _default_cache
+    if _default_cache is None:
+        with _default_cache_lock:
+            if _default_cache is None:
+                _default_cache = SearchCache()
+    return _default_cache
+
+
+_default_single_flight: Optional[SingleFlight] = None
+
+
+def get_single_flight() -> SingleFlight:
+    """Return the process-wide in-flight search registry"""
+    global _default_single_flight
+    if _default_single_flight is None:
+        with _default_cache_lock:
+            if _default_single_flight is None:
+                _default_single_flight = SingleFlight()
+    return _default_single_flight
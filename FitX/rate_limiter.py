@@ -0,0 +1,168 @@
+"""
+Client-side rate limiting and adaptive concurrency for vendor APIs
+
+Each vendor client admits a request only when its token bucket (the
+vendor's published quota, e.g. PA-API's 1 request/second for new
+associates) has a token and fewer requests are in flight than the
+current concurrency limit. The limit follows AIMD: it grows by about one
+per round of successful requests and is halved on overload signals (429,
+5xx, transport errors, responses slower than the latency target), at
+most once per round. A 429 with Retry-After pauses the vendor entirely.
+Requests that cannot be admitted within ``acquire_timeout`` fail locally
+with VendorThrottled instead of adding to an error storm.
+"""
+
+import math
+import threading
+import time
+from typing import Dict, Optional
+
+import requests
+
+
+MAX_RETRY_AFTER = 30.0
+
+
+class VendorThrottled(requests.exceptions.RequestException):
+    """Raised when the client-side limiter refuses a request (never sent to the vendor)"""
+
+
+class AdaptiveLimiter:
+    """
+    Token bucket plus AIMD concurrency limit for one vendor.
+
+    Args:
+        name: Vendor name (for error messages)
+        rate_limit: Sustained requests/second (0 = no quota)
+        burst: Token bucket size (defaults to one second of ``rate_limit``, at least 1)
+        max_concurrency: Upper bound of the adaptive limit
+        min_concurrency: Lower bound of the adaptive limit
+        initial_concurrency: Starting limit (defaults to ``max_concurrency``)
+        latency_target: Seconds; slower responses count as overload (None = off)
+        backoff: Multiplicative decrease factor
+        acquire_timeout: Longest a caller waits for admission
+
+    Example:
+        >>> limiter = AdaptiveLimiter('amazon', rate_limit=1.0, max_concurrency=4)
+        >>> started = limiter.acquire()
+        >>> limiter.release(started, status=200)
+    """
+
+    def __init__(self, name: str = 'default', rate_limit: float = 0.0, burst: Optional[float] = None,
+                 max_concurrency: int = 32, min_concurrency: int = 1,
+                 initial_concurrency: Optional[int] = None, latency_target: Optional[float] = None,
+                 backoff: float = 0.5, acquire_timeout: float = 2.0):
+        self.name = name
+        self.rate_limit = rate_limit
+        self.burst = burst if burst is not None else max(rate_limit, 1.0)
+        self.max_concurrency = max(max_concurrency, 1)
+        self.min_concurrency = max(min(min_concurrency, self.max_concurrency), 1)
+        self.limit = float(initial_concurrency or self.max_concurrency)
+        self.latency_target = latency_target
+        self.backoff = backoff
+        self.acquire_timeout = acquire_timeout
+
+        self.inflight = 0
+        self._tokens = self.burst
+        self._refilled = time.monotonic()
+        self._paused_until = 0.0
+        self._decreased_at = 0.0
+        self._cond = threading.Condition()
+        self.admitted = 0
+        self.rejected = 0
+        self.decreases = 0
+
+    def _refill(self, now: float) -> None:
+        if self.rate_limit:
+            self._tokens = min(self.burst, self._tokens + (now - self._refilled) * self.rate_limit)
+        self._refilled = now
+
+    def acquire(self, timeout: Optional[float] = None) -> float:
+        """
+        Wait for admission.
+
+        Returns:
+            The admission time (pass it back to ``release``)
+
+        Raises:
+            VendorThrottled: Not admitted within ``timeout`` (default ``acquire_timeout``)
+        """
+        timeout = self.acquire_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                if now < self._paused_until:
+                    ready_at = self._paused_until
+                elif self.inflight >= int(self.limit):
+                    ready_at = now  # unknown: woken by the next release
+                elif self.rate_limit and self._tokens < 1.0:
+                    ready_at = now + (1.0 - self._tokens) / self.rate_limit
+                else:
+                    if self.rate_limit:
+                        self._tokens -= 1.0
+                    self.inflight += 1
+                    self.admitted += 1
+                    return now
+                if now >= deadline or ready_at > deadline:
+                    self.rejected += 1
+                    if now < self._paused_until:
+                        raise VendorThrottled(f'{self.name}: client-side limit reached (paused '
+                                              f'{self._paused_until - now:.1f}s more after a 429)')
+                    raise VendorThrottled(
+                        f'{self.name}: client-side limit reached ({self.inflight} in flight, '
+                        f'limit {int(self.limit)}, waited {timeout:.1f}s)')
+                self._cond.wait(max((ready_at if ready_at > now else deadline) - now, 0.001))
+
+    def release(self, started: float, status: Optional[int] = None,
+                retry_after: Optional[float] = None) -> None:
+        """
+        Finish a request admitted at ``started`` and adapt the limit.
+
+        Args:
+            started: Value returned by ``acquire``
+            status: HTTP status, or None for a transport error/timeout
+            retry_after: Seconds from a 429's Retry-After header
+        """
+        with self._cond:
+            now = time.monotonic()
+            self.inflight -= 1
+            overloaded = (status is None or status == 429 or status >= 500
+                          or (self.latency_target is not None and now - started > self.latency_target))
+            if overloaded:
+                # One decrease per round: requests admitted before the last decrease are ignored
+                if started >= self._decreased_at:
+                    self.limit = max(self.min_concurrency, self.limit * self.backoff)
+                    self._decreased_at = now
+                    self.decreases += 1
+                if status == 429 and retry_after:
+                    self._paused_until = max(self._paused_until, now + min(retry_after, MAX_RETRY_AFTER))
+            elif status < 400:
+                self.limit = min(self.max_concurrency, self.limit + 1.0 / self.limit)
+            self._cond.notify_all()
+
+    def snapshot(self) -> Dict:
+        with self._cond:
+            now = time.monotonic()
+            self._refill(now)
+            return {
+                'limit': round(self.limit, 2),
+                'inflight': self.inflight,
+                'tokens': round(self._tokens, 2) if self.rate_limit else None,
+                'paused_for_s': round(max(self._paused_until - now, 0.0), 2),
+                'admitted': self.admitted,
+                'rejected': self.rejected,
+                'decreases': self.decreases
+            }
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds from a Retry-After header (delta-seconds form; HTTP dates are ignored)"""
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        return None
+    return seconds if seconds >= 0 and math.isfinite(seconds) else None
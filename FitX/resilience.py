@@ -0,0 +1,192 @@
+"""
+Circuit breakers and hedged-request bookkeeping for vendor APIs
+
+A CircuitBreaker tracks the failure rate of one vendor over a sliding time
+window. When enough calls fail it opens and calls are refused immediately
+(CircuitOpen) instead of each waiting for its own failure; after a
+cool-down one probe is let through (half-open) and its outcome closes the
+circuit or reopens it for twice as long. LatencyWindow and HedgeBudget
+decide when a slow call to a healthy vendor deserves a backup request.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional
+
+import requests
+
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitOpen(requests.exceptions.RequestException):
+    """Raised instead of calling a vendor whose circuit is open"""
+
+
+class CircuitBreaker:
+    """
+    Closed/open/half-open breaker over a sliding failure-rate window.
+
+    Args:
+        name: Vendor name (for error messages)
+        failure_rate: Fraction of failed calls in the window that opens the circuit
+        min_calls: Calls the window must hold before the rate is trusted
+        consecutive_failures: Failures in a row that open the circuit however
+                              sparse the traffic (0 = rate only)
+        window: Window length in seconds (kept as ``buckets`` time buckets)
+        open_seconds: First cool-down; doubles after each failed probe
+        max_open_seconds: Cap for the cool-down
+        buckets: Number of time buckets in the window
+
+    Example:
+        >>> breaker = CircuitBreaker('amazon')
+        >>> breaker.before_call()       # raises CircuitOpen while open
+        >>> breaker.record(success=False)
+    """
+
+    def __init__(self, name: str = 'default', failure_rate: float = 0.5, min_calls: int = 10,
+                 consecutive_failures: int = 5, window: float = 30.0, open_seconds: float = 30.0,
+                 max_open_seconds: float = 300.0, buckets: int = 10):
+        self.name = name
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.consecutive_failures = consecutive_failures
+        self._failure_streak = 0
+        self.bucket_seconds = window / buckets
+        self.open_seconds = open_seconds
+        self.max_open_seconds = max_open_seconds
+        self.state = CLOSED
+        self._buckets = deque(maxlen=buckets)  # [bucket start, calls, failures]
+        self._opened_until = 0.0
+        self._cooldown = open_seconds
+        self._probing = False
+        self._lock = threading.Lock()
+        self.rejected = 0
+        self.opened = 0
+
+    def before_call(self) -> None:
+        """Admit a call or raise CircuitOpen"""
+        with self._lock:
+            if self.state == CLOSED:
+                return
+            now = time.monotonic()
+            if self.state == OPEN and now >= self._opened_until:
+                self.state = HALF_OPEN
+                self._probing = False
+            if self.state == HALF_OPEN and not self._probing:
+                self._probing = True
+                return
+            self.rejected += 1
+            retry_in = max(self._opened_until - now, 0.0)
+        raise CircuitOpen(f'{self.name}: circuit open after repeated failures (retry in {retry_in:.0f}s)')
+
+    def record(self, success: bool) -> None:
+        """Record the outcome of an admitted call"""
+        with self._lock:
+            now = time.monotonic()
+            if self.state == HALF_OPEN:
+                self._probing = False
+                if success:
+                    self.state = CLOSED
+                    self._buckets.clear()
+                    self._failure_streak = 0
+                    self._cooldown = self.open_seconds
+                else:
+                    self._cooldown = min(self._cooldown * 2, self.max_open_seconds)
+                    self._open(now)
+                return
+            if self.state == OPEN:
+                return  # a call admitted before the circuit opened
+
+            if not self._buckets or now - self._buckets[-1][0] >= self.bucket_seconds:
+                self._buckets.append([now, 0, 0])
+            bucket = self._buckets[-1]
+            bucket[1] += 1
+            bucket[2] += not success
+            self._failure_streak = 0 if success else self._failure_streak + 1
+            if self.consecutive_failures and self._failure_streak >= self.consecutive_failures:
+                self._open(now)
+            elif not success:
+                horizon = now - self.bucket_seconds * self._buckets.maxlen
+                calls = failures = 0
+                for start, bucket_calls, bucket_failures in self._buckets:
+                    if start >= horizon:
+                        calls += bucket_calls
+                        failures += bucket_failures
+                if calls >= self.min_calls and failures >= self.failure_rate * calls:
+                    self._open(now)
+
+    def release_probe(self) -> None:
+        """Give back a half-open probe slot without an outcome (call never reached the vendor)"""
+        with self._lock:
+            self._probing = False
+
+    def _open(self, now: float) -> None:
+        self.state = OPEN
+        self._opened_until = now + self._cooldown
+        self.opened += 1
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            calls = sum(bucket[1] for bucket in self._buckets)
+            failures = sum(bucket[2] for bucket in self._buckets)
+            return {
+                'state': self.state,
+                'calls_in_window': calls,
+                'failure_rate': round(failures / calls, 3) if calls else 0.0,
+                'open_for_s': round(max(self._opened_until - time.monotonic(), 0.0), 1)
+                if self.state == OPEN else 0.0,
+                'opened': self.opened,
+                'rejected': self.rejected
+            }
+
+
+class LatencyWindow:
+    """Recent successful call latencies; ``quantile`` is recomputed every ``refresh`` samples"""
+
+    def __init__(self, size: int = 256, min_samples: int = 20, refresh: int = 16):
+        self._samples = deque(maxlen=size)
+        self.min_samples = min_samples
+        self.refresh = refresh
+        self._since_refresh = 0
+        self._sorted = []
+        self._lock = threading.Lock()
+
+    def add(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+            self._since_refresh += 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Latency quantile in seconds, or None until ``min_samples`` were seen"""
+        with self._lock:
+            if len(self._samples) < self.min_samples:
+                return None
+            if self._since_refresh >= self.refresh or not self._sorted:
+                self._sorted = sorted(self._samples)
+                self._since_refresh = 0
+            return self._sorted[min(int(q * len(self._sorted)), len(self._sorted) - 1)]
+
+
+class HedgeBudget:
+    """Caps hedged requests at ``ratio`` of all requests (each request earns ``ratio`` of a hedge)"""
+
+    def __init__(self, ratio: float = 0.1, burst: float = 5.0):
+        self.ratio = ratio
+        self.burst = burst
+        self._credit = burst
+        self._lock = threading.Lock()
+
+    def earn(self) -> None:
+        with self._lock:
+            self._credit = min(self.burst, self._credit + self.ratio)
+
+    def spend(self) -> bool:
+        with self._lock:
+            if self._credit >= 1.0:
+                self._credit -= 1.0
+                return True
+            return False
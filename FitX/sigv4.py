@@ -0,0 +1,144 @@
+"""
+AWS Signature Version 4 request signing for the Amazon PA-API 5 client
+
+The signing key is four chained HMACs of the secret over (date, region,
+service, 'aws4_request'); it only changes at UTC midnight, so it is
+derived once per day and kept as a primed HMAC object that is copied for
+each signature. Sorted header layouts, credential scopes and timestamps
+are memoized too, leaving one SHA-256 of the payload, one of the
+canonical request and one HMAC copy per request.
+"""
+
+import hashlib
+import hmac
+import threading
+import time
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+from urllib.parse import quote
+
+
+ALGORITHM = 'AWS4-HMAC-SHA256'
+EMPTY_PAYLOAD_HASH = hashlib.sha256(b'').hexdigest()
+
+# PA-API 5 endpoint constants (the India marketplace is served from eu-west-1)
+PAAPI_SERVICE = 'ProductAdvertisingAPI'
+PAAPI_TARGET_PREFIX = 'com.amazon.paapi5.v1.ProductAdvertisingAPIv1.'
+
+
+@lru_cache(maxsize=64)
+def _header_layout(names: Tuple[str, ...]) -> Tuple[Tuple[str, ...], str]:
+    """Sorted lowercase header names and the SignedHeaders value for a set of header names"""
+    ordered = tuple(sorted({name.lower() for name in names}))
+    return ordered, ';'.join(ordered)
+
+
+def _canonical_query(query: Optional[Dict[str, str]]) -> str:
+    if not query:
+        return ''
+    return '&'.join(f"{quote(str(key), safe='-_.~')}={quote(str(value), safe='-_.~')}"
+                    for key, value in sorted(query.items()))
+
+
+class SigV4Signer:
+    """
+    Signs HTTP requests for one set of credentials, region and service.
+
+    Args:
+        access_key: AWS access key id
+        secret_key: AWS secret access key
+        region: Signing region (e.g. 'eu-west-1' for webservices.amazon.in)
+        service: Signing service name (e.g. 'ProductAdvertisingAPI')
+
+    Example:
+        >>> signer = SigV4Signer(access_key, secret_key, 'eu-west-1', PAAPI_SERVICE)
+        >>> headers = signer.sign('POST', 'webservices.amazon.in', '/paapi5/searchitems',
+        ...                       headers={'content-type': 'application/json; charset=utf-8'},
+        ...                       payload=body)
+        >>> headers['Authorization']
+        'AWS4-HMAC-SHA256 Credential=AKIA.../20251125/eu-west-1/ProductAdvertisingAPI/aws4_request, ...'
+    """
+
+    def __init__(self, access_key: str, secret_key: str, region: str, service: str):
+        self.access_key = access_key
+        self.region = region
+        self.service = service
+        self._secret = ('AWS4' + secret_key).encode('utf-8')
+        self._lock = threading.Lock()
+        # date stamp -> (primed HMAC-SHA256 keyed with the signing key, credential scope)
+        self._keys: Dict[str, Tuple[hmac.HMAC, str]] = {}
+        self._clock: Tuple[int, str] = (-1, '')
+
+    def signing_key(self, date_stamp: str) -> bytes:
+        """Derive the signing key for a YYYYMMDD date (uncached; see ``_key_for``)"""
+        key = hmac.new(self._secret, date_stamp.encode('utf-8'), hashlib.sha256).digest()
+        for part in (self.region, self.service, 'aws4_request'):
+            key = hmac.new(key, part.encode('utf-8'), hashlib.sha256).digest()
+        return key
+
+    def _key_for(self, date_stamp: str) -> Tuple[hmac.HMAC, str]:
+        entry = self._keys.get(date_stamp)
+        if entry is None:
+            entry = (hmac.new(self.signing_key(date_stamp), digestmod=hashlib.sha256),
+                     f'{date_stamp}/{self.region}/{self.service}/aws4_request')
+            with self._lock:
+                # Keep today and yesterday (requests signed around midnight)
+                if len(self._keys) >= 2:
+                    self._keys.pop(min(self._keys))
+                self._keys[date_stamp] = entry
+        return entry
+
+    def _amz_date(self) -> str:
+        now = int(time.time())
+        second, formatted = self._clock
+        if second != now:
+            formatted = time.strftime('%Y%m%dT%H%M%SZ', time.gmtime(now))
+            self._clock = (now, formatted)
+        return formatted
+
+    def sign(self, method: str, host: str, path: str = '/', query: Optional[Dict[str, str]] = None,
+             headers: Optional[Dict[str, str]] = None, payload: bytes = b'',
+             amz_date: Optional[str] = None) -> Dict[str, str]:
+        """
+        Sign one request.
+
+        Args:
+            method: HTTP method
+            host: Host header value (host[:port]) the request is sent to
+            path: Absolute URI path
+            query: Query parameters
+            headers: Headers to send and sign (Host and X-Amz-Date are added)
+            payload: Exact request body bytes
+            amz_date: Timestamp override as YYYYMMDDTHHMMSSZ (defaults to now)
+
+        Returns:
+            ``headers`` plus Host, X-Amz-Date and Authorization
+        """
+        amz_date = amz_date or self._amz_date()
+        signed = dict(headers or {})
+        signed['host'] = host
+        signed['x-amz-date'] = amz_date
+        names, signed_headers = _header_layout(tuple(signed))
+        lowered = {name.lower(): value for name, value in signed.items()}
+
+        canonical_request = '\n'.join((
+            method.upper(),
+            quote(path or '/', safe='/-_.~'),
+            _canonical_query(query),
+            ''.join(f"{name}:{' '.join(str(lowered[name]).split())}\n" for name in names),
+            signed_headers,
+            hashlib.sha256(payload).hexdigest() if payload else EMPTY_PAYLOAD_HASH
+        ))
+        primed, scope = self._key_for(amz_date[:8])
+        string_to_sign = (f'{ALGORITHM}\n{amz_date}\n{scope}\n'
+                          f'{hashlib.sha256(canonical_request.encode("utf-8")).hexdigest()}')
+        mac = primed.copy()
+        mac.update(string_to_sign.encode('utf-8'))
+
+        result = dict(headers or {})
+        result['Host'] = host
+        result['X-Amz-Date'] = amz_date
+        result['Authorization'] = (f'{ALGORITHM} Credential={self.access_key}/{scope}, '
+                                   f'SignedHeaders={signed_headers}, Signature={mac.hexdigest()}')
+        return result
+
@@ -0,0 +1,37 @@
+"""Rule routes and past misroutes of the intent router."""
+
+import pytest
+
+from FitX.tools.intent_router import get_intent_router
+
+
+@pytest.fixture(scope='module')
+def router():
+    return get_intent_router()
+
+
+@pytest.mark.parametrize('text, agent', [
+    ('I want to buy a yoga mat', 'shopping_assistant'),
+    ('place an order for whey protein', 'shopping_assistant'),
+    ('order some resistance bands', 'shopping_assistant'),
+    ('track my workouts this week', 'progress_tracker'),
+    ('record my workout', 'progress_tracker'),
+    ('what is my current streak', 'progress_tracker'),
+    ('my knee hurts after squats', 'medical_advisor'),
+    ('is a push/pull/legs split good for beginners', 'fitness_coach'),
+    ('how many reps for hypertrophy', 'fitness_coach'),
+])
+def test_routes(router, text, agent):
+    decision = router.route(text)
+    assert decision is not None and decision.agent == agent
+
+
+@pytest.mark.parametrize('text, agent', [
+    ('In what order should I do my exercises?', 'shopping_assistant'),
+    ('what is the world record for the marathon?', 'progress_tracker'),
+    ('Can you track my sleep?', 'progress_tracker'),
+    ('how much protein in split peas', 'fitness_coach'),
+])
+def test_misroutes(router, text, agent):
+    decision = router.route(text)
+    assert decision is None or decision.agent != agent
@@ -0,0 +1,44 @@
+"""Which utterances the log parser treats as a confident log."""
+
+import pytest
+
+from FitX.tools.log_parser import parse_log
+
+
+@pytest.mark.parametrize('text', [
+    'I ran for 30 minutes at moderate pace',
+    'Had 2 eggs and toast for breakfast',
+    'just did 45 min yoga',
+    'log 30 min cycling',
+    'went for a 20 minute walk',
+])
+def test_completed_reports_are_confident(text):
+    assert parse_log(text).confident
+
+
+@pytest.mark.parametrize('text', [
+    'I used to run for 30 minutes',
+    'I usually run for 30 minutes',
+    'my goal is to run for 30 minutes',
+    'I can run for an hour',
+    'I love running for 30 minutes',
+    'I hate breakfast',
+    "I didn't run today",
+    'my wife ran for 30 minutes',
+    'how long should I run?',
+])
+def test_not_a_log(text):
+    assert parse_log(text) is None
+
+
+@pytest.mark.parametrize('text, reason', [
+    ('30 min yoga', 'completed'),
+    ('I ran for 3000 minutes', 'plausible'),
+    ('Ate 6000 calories of pizza for dinner', 'plausible'),
+    ('I ran for 30 minutes yesterday', 'date'),
+    ('I ran for 30 minutes and swam for 20 minutes', 'single_activity'),
+])
+def test_not_confident(text, reason):
+    parsed = parse_log(text)
+    assert not parsed.confident
+    assert reason in parsed.missing
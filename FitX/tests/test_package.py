@@ -0,0 +1,47 @@
+"""The FitX package builds its agent tree on first attribute access."""
+
+import importlib.util
+import os
+import sys
+import types
+
+import pytest
+
+
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def package(monkeypatch):
+    """Import the top-level FitX package from its directory, as ADK does."""
+    spec = importlib.util.spec_from_file_location(
+        'FitX', os.path.join(PACKAGE_DIR, '__init__.py'), submodule_search_locations=[PACKAGE_DIR])
+    module = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, 'FitX', module)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_import_does_not_build_agent(package):
+    assert 'agent' not in vars(package)
+    assert 'FitX.agent' not in sys.modules
+
+
+def test_root_agent_is_loaded_on_access(package, monkeypatch):
+    agent = types.ModuleType('FitX.agent')
+    agent.root_agent = object()
+    monkeypatch.setitem(sys.modules, 'FitX.agent', agent)
+
+    assert package.root_agent is agent.root_agent
+    assert package.agent is agent
+    assert vars(package)['agent'] is agent
+
+
+def test_unknown_attribute(package):
+    with pytest.raises(AttributeError):
+        package.missing
+
+
+def test_root_agent_from_package(package):
+    pytest.importorskip('google.adk')
+    assert package.root_agent.name
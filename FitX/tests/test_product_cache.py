@@ -0,0 +1,43 @@
+"""Search cache keys and single-flight coalescing."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from mock_vendor import MockVendorServer
+
+from ecommerce_api_integration import UnifiedEcommerceAPI
+from product_cache import SearchCache, SingleFlight
+
+
+def _search(server, cache, stream=False):
+    urls = {'amazon': server.url, 'flipkart': server.url + '/affiliate'}
+    with UnifiedEcommerceAPI(cache=cache, inflight=SingleFlight(), base_urls=urls, stream_responses=stream) as api:
+        return api.search_all_platforms('yoga mat')
+
+
+def test_cache_is_scoped_to_vendor_endpoint_and_mode():
+    cache = SearchCache()
+    first, second = MockVendorServer().start(), MockVendorServer().start()
+    try:
+        _search(first, cache)
+        assert cache.stats()['misses'] == 2
+        _search(first, cache)
+        assert cache.stats()['hits'] == 2
+        _search(second, cache)
+        _search(first, cache, stream=True)
+        assert cache.stats()['misses'] == 6
+        assert cache.stats()['entries'] == 6
+    finally:
+        first.stop()
+        second.stop()
+
+
+def test_single_flight_releases_key_when_submit_fails():
+    inflight = SingleFlight()
+    executor = ThreadPoolExecutor(max_workers=1)
+    executor.shutdown()
+    with pytest.raises(RuntimeError):
+        inflight.submit(('k',), executor, lambda: 1)
+    assert inflight.stats()['in_flight'] == 0
+    assert inflight.do(('k',), lambda: 2) == 2
@@ -0,0 +1,39 @@
+"""Kind-restricted search over per-kind postings, in memory and from a snapshot."""
+
+import pytest
+
+from benchmarks.bench_catalog import QUERY, skewed_products
+from FitX.tools.product_catalog import ProductCatalog
+
+
+@pytest.fixture(scope='module', params=['memory', 'snapshot'])
+def catalog(request, tmp_path_factory):
+    catalog = ProductCatalog(skewed_products(2000, apparel_share=0.01))
+    if request.param == 'snapshot':
+        path = str(tmp_path_factory.mktemp('catalog') / 'catalog.fxcat')
+        catalog.save_snapshot(path)
+        catalog = ProductCatalog.open_snapshot(path)
+    return catalog
+
+
+def _ids(hits):
+    return [product['id'] for _, product in hits]
+
+
+def test_rare_kind_is_not_crowded_out(catalog):
+    # Fewer postings read than there are equipment SKUs sharing the terms
+    hits = catalog.search(QUERY, kind='apparel', limit=5, max_postings=50)
+    assert len(hits) == 5
+    assert all(product['kind'] == 'apparel' for _, product in hits)
+    assert _ids(hits) == _ids(catalog.search(QUERY, kind='apparel', limit=5, max_postings=len(catalog)))
+
+
+def test_any_kind_merges_the_per_kind_postings(catalog):
+    hits = catalog.search(QUERY, limit=len(catalog), max_postings=len(catalog))
+    assert len(hits) == len(catalog)
+    assert [score for score, _ in hits] == sorted((score for score, _ in hits), reverse=True)
+    assert len(catalog.search(QUERY, limit=len(catalog), max_postings=50)) == 50
+
+
+def test_unknown_kind(catalog):
+    assert catalog.search(QUERY, kind='food') == []
@@ -0,0 +1,49 @@
+"""SigV4Signer against vectors from AWS's published SigV4 test suite and documentation."""
+
+import pytest
+
+from sigv4 import ALGORITHM, SigV4Signer
+
+
+ACCESS_KEY = 'AKIDEXAMPLE'
+SECRET_KEY = 'wJalrXUtnFEMI/K7MDENG+bPxRfiCYEXAMPLEKEY'
+
+
+# From the AWS SigV4 test suite (get-vanilla, post-vanilla, get-vanilla-query-order-key-case)
+# and the IAM ListUsers example
+@pytest.mark.parametrize('region, service, method, host, query, headers, expected', [
+    pytest.param('us-east-1', 'service', 'GET', 'example.amazonaws.com', None, None,
+                 '5fa00fa31553b73ebf1942676e86291e8372ff2a2260956d9b8aae1d763fbf31', id='get-vanilla'),
+    pytest.param('us-east-1', 'service', 'POST', 'example.amazonaws.com', None, None,
+                 '5da7c1a2acd57cee7505fc6676e4e544621c30862966e37dddb68e92efbe5d6b', id='post-vanilla'),
+    pytest.param('us-east-1', 'service', 'GET', 'example.amazonaws.com',
+                 {'Param2': 'value2', 'Param1': 'value1'}, None,
+                 'b97d918cfa904a5beff61c982a1b6f458b799221646efd99d3219ec94cdf2500',
+                 id='get-vanilla-query-order-key-case'),
+    pytest.param('us-east-1', 'iam', 'GET', 'iam.amazonaws.com',
+                 {'Action': 'ListUsers', 'Version': '2010-05-08'},
+                 {'Content-Type': 'application/x-www-form-urlencoded; charset=utf-8'},
+                 '5d672d79c15b13162d9279b0855cfba6789a8edb4c82c400e06b5924a6f2b5d7', id='iam-list-users'),
+])
+def test_signature(region, service, method, host, query, headers, expected):
+    signer = SigV4Signer(ACCESS_KEY, SECRET_KEY, region, service)
+    authorization = signer.sign(method, host, '/', query, headers, amz_date='20150830T123600Z')['Authorization']
+    assert authorization.startswith(f'{ALGORITHM} Credential={ACCESS_KEY}/20150830/{region}/{service}/aws4_request, ')
+    assert authorization.endswith(f'Signature={expected}')
+
+
+def test_signing_key_derivation():
+    # Signing-key example from the AWS General Reference
+    key = SigV4Signer(ACCESS_KEY, SECRET_KEY, 'us-east-1', 'iam').signing_key('20120215')
+    assert key.hex() == 'f4780e2d9f65fa895f9c67b32ce1baf0b0d8a43505a000a1a9e090d414db404d'
+
+
+def test_cached_key_matches_fresh_signer():
+    signer = SigV4Signer(ACCESS_KEY, SECRET_KEY, 'eu-west-1', 'ProductAdvertisingAPI')
+    first = signer.sign('POST', 'webservices.amazon.in', '/paapi5/searchitems', payload=b'{}',
+                        amz_date='20251125T101500Z')
+    again = signer.sign('POST', 'webservices.amazon.in', '/paapi5/searchitems', payload=b'{}',
+                        amz_date='20251125T101500Z')
+    fresh = SigV4Signer(ACCESS_KEY, SECRET_KEY, 'eu-west-1', 'ProductAdvertisingAPI').sign(
+        'POST', 'webservices.amazon.in', '/paapi5/searchitems', payload=b'{}', amz_date='20251125T101500Z')
+    assert first == again == fresh
@@ -0,0 +1,52 @@
+"""Trends, consistency and streaks computed from the columnar history."""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from FitX.tools import tracking_history
+from FitX.tools.tracking_history import TrackingHistory
+
+
+TODAY = date(2025, 11, 25)
+
+
+def _workout(days_ago: int, duration: int = 30, calories: int = 250) -> dict:
+    ts = datetime.combine(TODAY - timedelta(days=days_ago), datetime.min.time()).replace(hour=9).timestamp()
+    return {'type': 'workout', 'user_id': 'u', 'ts': ts, 'exercise': 'running',
+            'intensity': 'moderate', 'duration': duration, 'calories': calories}
+
+
+@pytest.fixture(params=['numpy', 'python'])
+def history(request, monkeypatch):
+    if request.param == 'python':
+        monkeypatch.setattr(tracking_history, 'np', None)
+    elif tracking_history.np is None:
+        pytest.skip('NumPy is not installed')
+    history = TrackingHistory()
+    # This week: today, yesterday and 2 days ago, twice today; last week: 3 days
+    for seq, days_ago in enumerate((0, 0, 1, 2, 8, 9, 10, 12), 1):
+        history.apply({**_workout(days_ago), 'seq': seq})
+    return history
+
+
+def test_trends(history):
+    trends = history.trends('u', 7, TODAY)
+    assert trends['current_period'] == {'workouts': 4, 'active_minutes': 120, 'calories_burned': 1000}
+    assert trends['previous_period'] == {'workouts': 4, 'active_minutes': 120, 'calories_burned': 1000}
+    assert trends['change_percent']['workouts'] == 0
+    assert trends['active_days'] == 3
+    assert trends['active_day_ratio'] == 0.43
+
+
+def test_streaks(history):
+    assert history.trends('u', 7, TODAY)['streaks'] == {'current_streak': 3, 'longest_streak': 3}
+    # Still alive the next day, broken the day after
+    assert history.trends('u', 7, TODAY + timedelta(days=1))['streaks']['current_streak'] == 3
+    assert history.trends('u', 7, TODAY + timedelta(days=2))['streaks']['current_streak'] == 0
+
+
+def test_unknown_user():
+    trends = TrackingHistory().trends('nobody', 7, TODAY)
+    assert trends['active_days'] == 0
+    assert trends['streaks'] == {'current_streak': 0, 'longest_streak': 0}
@@ -0,0 +1,53 @@
+"""Validation shared by the single-entry and bulk logging tools."""
+
+import pytest
+
+from FitX.tools import achievements, event_store, progress_aggregates, tracking_history, tracking_tools
+
+
+@pytest.fixture(autouse=True)
+def store(tmp_path, monkeypatch):
+    """Fresh event store and projections in a temporary data directory."""
+    monkeypatch.setenv('FITX_DATA_DIR', str(tmp_path))
+    monkeypatch.setattr(event_store, '_default_store', None)
+    monkeypatch.setattr(progress_aggregates, '_default_aggregates', None)
+    monkeypatch.setattr(tracking_history, '_default_history', None)
+    monkeypatch.setattr(achievements, '_default_index', None)
+    yield
+    if event_store._default_store is not None:
+        event_store._default_store.close()
+
+
+def _workouts_logged() -> int:
+    return progress_aggregates.get_progress_aggregates().window('default', 1)['workouts']
+
+
+@pytest.mark.parametrize('duration, calories', [(-30, 250), (30, -250), ('abc', 250), (30, float('nan'))])
+def test_log_workout_rejects_invalid_amounts(duration, calories):
+    result = tracking_tools.log_workout('running', duration, 'moderate', calories)
+    assert result['status'] == 'rejected' and 'error' in result
+    assert _workouts_logged() == 0
+
+
+def test_log_meal_rejects_negative_calories():
+    result = tracking_tools.log_meal('lunch', ['rice'], -200)
+    assert result['status'] == 'rejected' and 'error' in result
+
+
+def test_log_workout_accepts_numeric_strings():
+    result = tracking_tools.log_workout('running', '30', 'moderate', '250')
+    assert result['duration_minutes'] == 30
+    assert _workouts_logged() == 1
+
+
+def test_bulk_log_reports_bad_rows():
+    rows = [
+        {'exercise': 'running', 'duration': 30, 'intensity': 'moderate', 'calories': 250},
+        {'exercise': 'running', 'duration': -30, 'intensity': 'moderate', 'calories': 250},
+        ['running', 30],
+        None,
+    ]
+    result = tracking_tools.bulk_log_workouts(rows)
+    assert result['rows_logged'] == 1
+    assert [error['row'] for error in result['errors']] == [1, 2, 3]
+    assert result['errors'][1]['error'] == 'expected an object, got list'
@@ -0,0 +1,340 @@
+"""
+Shared HTTP connection pools for FitX e-commerce vendor clients
+
+Every vendor client gets a long-lived pooled client (keep-alive, bounded
+connections per host, default connect/read timeouts) instead of paying a
+fresh TCP+TLS handshake per call through bare ``requests.get/post``.
+HTTP/2 is used when enabled and ``httpx[http2]`` is installed.
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import httpx
+except ImportError:  # HTTP/2 support is optional
+    httpx = None
+
+from FitX.tools.instrumentation import get_metrics
+from rate_limiter import AdaptiveLimiter, VendorThrottled, parse_retry_after
+from resilience import CLOSED, CircuitBreaker, HedgeBudget, LatencyWindow
+
+
+# Production API roots. FITX_<VENDOR>_BASE_URL overrides one vendor;
+# FITX_MOCK_VENDOR_URL points every vendor at a local mock_vendor server
+VENDOR_BASE_URLS = {
+    'amazon': 'https://webservices.amazon.in',
+    'flipkart': 'https://affiliate-api.flipkart.net/affiliate'
+}
+MOCK_VENDOR_PATHS = {
+    'amazon': '',
+    'flipkart': '/affiliate'
+}
+
+
+def vendor_base_url(vendor: str, default: Optional[str] = None) -> str:
+    """
+    API root URL for a vendor, honouring base-URL overrides.
+
+    Args:
+        vendor: Vendor name ('amazon', 'flipkart')
+        default: Root to use when nothing is configured (defaults to VENDOR_BASE_URLS)
+
+    Returns:
+        Base URL without a trailing slash
+
+    Example:
+        >>> os.environ['FITX_MOCK_VENDOR_URL'] = 'http://127.0.0.1:8765'
+        >>> vendor_base_url('flipkart')
+        'http://127.0.0.1:8765/affiliate'
+    """
+    override = os.getenv(f'FITX_{vendor.upper()}_BASE_URL')
+    if override:
+        return override.rstrip('/')
+    mock = os.getenv('FITX_MOCK_VENDOR_URL')
+    if mock and vendor in MOCK_VENDOR_PATHS:
+        return mock.rstrip('/') + MOCK_VENDOR_PATHS[vendor]
+    return (default or VENDOR_BASE_URLS[vendor]).rstrip('/')
+
+
+IDEMPOTENT_METHODS = ('GET', 'HEAD', 'OPTIONS')
+# Statuses that count against the circuit breaker besides transport errors and 5xx:
+# rejected credentials/signatures mean every further call will fail too
+BREAKER_FAILURE_STATUSES = (401, 403)
+MIN_HEDGE_DELAY = 0.01
+
+
+class HTTPConfig:
+    """
+    Connection-pool, timeout and admission settings for one vendor.
+
+    Limiter, breaker and hedging settings read FITX_<VENDOR>_<NAME> (e.g.
+    FITX_AMAZON_RATE_LIMIT) when ``vendor`` is given, then the
+    FITX_HTTP_<NAME> defaults. The rate limit is off (0) unless configured;
+    the adaptive concurrency limit always backs off on 429/5xx/timeouts and
+    responses slower than ``latency_target`` (half the read timeout by
+    default). The circuit breaker is always on; hedging (HEDGE=1) is
+    opt-in and applies to idempotent requests only.
+    """
+
+    def __init__(self,
+                 pool_maxsize: int = None,
+                 connect_timeout: float = None,
+                 read_timeout: float = None,
+                 retries: int = None,
+                 http2: bool = None,
+                 rate_limit: float = None,
+                 max_concurrency: int = None,
+                 latency_target: float = None,
+                 acquire_timeout: float = None,
+                 breaker_failure_rate: float = None,
+                 breaker_consecutive_failures: int = None,
+                 breaker_open_seconds: float = None,
+                 hedge: bool = None,
+                 hedge_quantile: float = None,
+                 vendor: Optional[str] = None):
+        env = os.environ
+
+        def setting(name: str, default):
+            if vendor and env.get(f'FITX_{vendor.upper()}_{name}'):
+                return env[f'FITX_{vendor.upper()}_{name}']
+            return env.get(f'FITX_HTTP_{name}', default)
+
+        self.pool_maxsize = pool_maxsize or int(env.get('FITX_HTTP_POOL_SIZE', 32))
+        self.connect_timeout = connect_timeout or float(env.get('FITX_HTTP_CONNECT_TIMEOUT', 2.0))
+        self.read_timeout = read_timeout or float(env.get('FITX_HTTP_READ_TIMEOUT', 5.0))
+        self.retries = retries if retries is not None else int(env.get('FITX_HTTP_RETRIES', 1))
+        self.http2 = http2 if http2 is not None else env.get('FITX_HTTP2', '').lower() in ('1', 'true', 'yes')
+        self.rate_limit = rate_limit if rate_limit is not None else float(setting('RATE_LIMIT', 0.0))
+        self.max_concurrency = max_concurrency or int(setting('MAX_CONCURRENCY', self.pool_maxsize))
+        self.latency_target = latency_target if latency_target is not None else float(
+            setting('LATENCY_TARGET', self.read_timeout / 2))
+        self.acquire_timeout = acquire_timeout if acquire_timeout is not None else float(
+            setting('ACQUIRE_TIMEOUT', 2.0))
+        self.breaker_failure_rate = breaker_failure_rate or float(setting('BREAKER_FAILURE_RATE', 0.5))
+        self.breaker_consecutive_failures = (
+            breaker_consecutive_failures if breaker_consecutive_failures is not None
+            else int(setting('BREAKER_CONSECUTIVE_FAILURES', 5)))
+        self.breaker_open_seconds = breaker_open_seconds or float(setting('BREAKER_OPEN_SECONDS', 30.0))
+        self.hedge = hedge if hedge is not None else str(setting('HEDGE', '')).lower() in ('1', 'true', 'yes')
+        self.hedge_quantile = hedge_quantile or float(setting('HEDGE_QUANTILE', 0.95))
+
+    @property
+    def timeout(self):
+        return (self.connect_timeout, self.read_timeout)
+
+
+class VendorHTTPClient:
+    """
+    Pooled, keep-alive HTTP client with default timeouts.
+
+    Exposes ``get``/``post`` returning response objects with the usual
+    ``status_code``/``json()``/``raise_for_status()`` interface. Transport
+    errors always surface as ``requests.exceptions.RequestException`` so
+    callers handle both backends the same way. Every request passes the
+    client's CircuitBreaker (CircuitOpen while the vendor is known to be
+    failing) and AdaptiveLimiter (VendorThrottled when not admitted); both
+    are RequestExceptions. With hedging enabled, an idempotent request
+    still pending after the recent p95 latency gets one backup request
+    (within a 10% budget) and the first answer wins. Requests are recorded
+    under the client's ``name`` in the 'vendor' metrics.
+    """
+
+    def __init__(self, config: Optional[HTTPConfig] = None, name: str = 'default'):
+        self.config = config or HTTPConfig(vendor=name)
+        self.name = name
+        self.limiter = AdaptiveLimiter(name, rate_limit=self.config.rate_limit,
+                                       max_concurrency=self.config.max_concurrency,
+                                       latency_target=self.config.latency_target or None,
+                                       acquire_timeout=self.config.acquire_timeout)
+        self.breaker = CircuitBreaker(name, failure_rate=self.config.breaker_failure_rate,
+                                      consecutive_failures=self.config.breaker_consecutive_failures,
+                                      open_seconds=self.config.breaker_open_seconds)
+        self.latencies = LatencyWindow()
+        self.hedge_budget = HedgeBudget()
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.http2 = bool(self.config.http2 and httpx is not None)
+        if self.http2:
+            self._client = httpx.Client(
+                http2=True,
+                timeout=httpx.Timeout(self.config.read_timeout, connect=self.config.connect_timeout),
+                limits=httpx.Limits(max_connections=self.config.pool_maxsize,
+                                    max_keepalive_connections=self.config.pool_maxsize)
+            )
+        else:
+            session = requests.Session()
+            # Retry only connection setup failures; never replay POST bodies on read errors
+            retry = Retry(total=self.config.retries, connect=self.config.retries,
+                          read=0, status=0, allowed_methods=None, raise_on_status=False)
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.config.pool_maxsize,
+                                  max_retries=retry)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            self._client = session
+
+    def request(self, method: str, url: str, idempotent: Optional[bool] = None, **kwargs):
+        """
+        Send a request through the breaker, limiter and (optionally) hedging.
+
+        Args:
+            method: HTTP method
+            url: Absolute URL
+            idempotent: Safe to send twice (defaults to True for GET/HEAD/OPTIONS);
+                        only idempotent requests are hedged
+            **kwargs: Passed to the underlying client (params, json, headers, timeout, ...);
+                      with ``stream=True`` the body is left unread (see vendor_stream)
+        """
+        if idempotent is None:
+            idempotent = method.upper() in IDEMPOTENT_METHODS
+        if not (self.config.hedge and idempotent):
+            return self._send(method, url, None, kwargs)
+
+        self.hedge_budget.earn()
+        delay = self.latencies.quantile(self.config.hedge_quantile)
+        if delay is None or self.breaker.state != CLOSED:
+            return self._send(method, url, None, kwargs)
+        executor = _hedge_executor()
+        primary = executor.submit(self._send, method, url, None, kwargs)
+        done, _ = wait([primary], timeout=max(delay, MIN_HEDGE_DELAY))
+        if done or not self.hedge_budget.spend():
+            return primary.result()
+
+        # The backup never queues behind the limiter: no free slot, no hedge
+        backup = executor.submit(self._send, method, url, 0.0, kwargs)
+        self.hedged += 1
+        pending, error = {primary, backup}, None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    self.hedge_wins += future is backup
+                    # A streamed loser would otherwise hold its pooled connection
+                    (backup if future is primary else primary).add_done_callback(_close_response)
+                    return future.result()
+                if future is primary or error is None:
+                    error = future.exception()
+        raise error
+
+    def _send(self, method: str, url: str, admission_timeout: Optional[float], kwargs: Dict):
+        self.breaker.before_call()
+        try:
+            started = self.limiter.acquire(admission_timeout)
+        except VendorThrottled:
+            self.breaker.release_probe()
+            raise
+        start = time.perf_counter()
+        try:
+            response = self._request(method, url, **kwargs)
+        except BaseException as e:
+            self._settle(started, time.perf_counter() - start, getattr(e, 'response', None),
+                         isinstance(e, requests.exceptions.RequestException))
+            raise
+        self._settle(started, time.perf_counter() - start, response, False)
+        return response
+
+    def _settle(self, started: float, elapsed: float, response, request_error: bool) -> None:
+        """Feed one finished call to the limiter, breaker, latency window and metrics"""
+        status = response.status_code if response is not None else None
+        retry_after = parse_retry_after(response.headers.get('Retry-After')) if response is not None else None
+        self.limiter.release(started, status, retry_after)
+        self.breaker.record(status is not None and status < 500 and status not in BREAKER_FAILURE_STATUSES)
+        if status is not None and status < 400:
+            self.latencies.add(elapsed)
+        metrics = get_metrics()
+        if metrics.enabled and (request_error or response is not None):
+            metrics.record('vendor', self.name, elapsed, _body_size(response), request_error or status >= 400)
+
+    def _request(self, method: str, url: str, **kwargs):
+        if not self.http2:
+            kwargs.setdefault('timeout', self.config.timeout)
+            return self._client.request(method, url, **kwargs)
+
+        timeout = kwargs.pop('timeout', None)
+        stream = kwargs.pop('stream', False)
+        if isinstance(timeout, tuple):
+            kwargs['timeout'] = httpx.Timeout(timeout[1], connect=timeout[0])
+        elif timeout is not None:
+            kwargs['timeout'] = timeout
+        try:
+            response = self._client.send(self._client.build_request(method, url, **kwargs), stream=stream)
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(str(e)) from e
+        except httpx.HTTPError as e:
+            raise requests.exceptions.ConnectionError(str(e)) from e
+        if response.status_code >= 400:
+            response.close()
+            raise requests.exceptions.HTTPError(f'{response.status_code} Error for url: {url}', response=response)
+        return response
+
+    def get(self, url: str, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    def close(self) -> None:
+        self._client.close()
+
+
+def _body_size(response) -> Optional[int]:
+    """Response body size without forcing a streamed body to be read"""
+    if response is None:
+        return None
+    if getattr(response, '_content_consumed', True) and getattr(response, 'is_stream_consumed', True):
+        try:
+            return len(response.content)
+        except Exception:  # httpx: streamed and closed unread
+            pass
+    length = response.headers.get('Content-Length')
+    return int(length) if length and length.isdigit() else None
+
+
+def _close_response(future) -> None:
+    if future.exception() is None:
+        future.result().close()
+
+
+_hedge_pool: Optional[ThreadPoolExecutor] = None
+_hedge_pool_lock = threading.Lock()
+
+
+def _hedge_executor() -> ThreadPoolExecutor:
+    global _hedge_pool
+    if _hedge_pool is None:
+        with _hedge_pool_lock:
+            if _hedge_pool is None:
+                _hedge_pool = ThreadPoolExecutor(max_workers=64, thread_name_prefix='fitx-hedge')
+    return _hedge_pool
+
+
+_clients: Dict[str, VendorHTTPClient] = {}
+_configs: Dict[str, HTTPConfig] = {}
+_clients_lock = threading.Lock()
+
+
+def configure_vendor(vendor: str, config: HTTPConfig) -> None:
+    """Override pool/timeout settings for a vendor (replaces its pooled client)"""
+    with _clients_lock:
+        _configs[vendor] = config
+        client = _clients.pop(vendor, None)
+    if client is not None:
+        client.close()
+
+
+def get_vendor_client(vendor: str) -> VendorHTTPClient:
+    """Return the process-wide pooled client for a vendor"""
+    client = _clients.get(vendor)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(vendor)
+            if client is None:
+                client = _clients[vendor] = VendorHTTPClient(_configs.get(vendor), name=vendor)
+    return client
@@ -0,0 +1,236 @@
+"""
+Streaming parsers for vendor search responses
+
+The dict parsers in ecommerce_api_integration load the whole response
+with ``response.json()`` and keep every field of every item (images,
+feature lists, listings metadata) the agent never reads. In streaming
+mode the body is read chunk by chunk and only the product array is
+walked: each item is decoded on its own (with the C JSON scanner),
+projected into a compact Product record and dropped, and reading
+stops once ``limit`` items were collected. Peak memory is one chunk
+plus one item instead of the whole page, and the rest of a large page
+is never decoded.
+"""
+
+import codecs
+import json
+import math
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from pricing import Price
+from FitX.tools.product_record import Product
+
+
+DEFAULT_CHUNK_SIZE = 16 * 1024
+# After an early stop, up to this many unread bytes are drained so the
+# connection can go back to the pool; larger remainders close it instead
+DRAIN_LIMIT = 64 * 1024
+
+AMAZON_ITEMS_PATH = ('SearchResult', 'Items')
+FLIPKART_PRODUCTS_PATH = ('products',)
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+
+class JSONArrayStream:
+    """
+    Incremental reader for one array nested in a JSON object.
+
+    Args:
+        chunks: Iterable of raw body chunks (bytes, UTF-8)
+
+    Example:
+        >>> stream = JSONArrayStream(response.iter_content(DEFAULT_CHUNK_SIZE))
+        >>> for item in stream.iter_array(('SearchResult', 'Items')):
+        ...     print(item['ASIN'])
+    """
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._text = codecs.getincrementaldecoder('utf-8')()
+        self._decoder = json.JSONDecoder()
+        self._buf = ''
+        self._pos = 0
+        self._eof = False
+        self.bytes_read = 0
+
+    def _fill(self) -> bool:
+        """Append the next chunk to the buffer; False at end of body"""
+        if self._eof:
+            return False
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self._eof = True
+            tail = self._text.decode(b'', final=True)
+        else:
+            self.bytes_read += len(chunk)
+            tail = self._text.decode(chunk)
+        # Drop the consumed prefix so the buffer stays about one item long
+        self._buf = self._buf[self._pos:] + tail
+        self._pos = 0
+        return True
+
+    def _peek(self) -> str:
+        """Next non-whitespace character ('' at end of body)"""
+        while True:
+            self._pos = _WHITESPACE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ''
+
+    def _expect(self, chars: str) -> str:
+        char = self._peek()
+        if not char or char not in chars:
+            raise json.JSONDecodeError(f'Expecting one of {chars!r}', self._buf, self._pos)
+        self._pos += 1
+        return char
+
+    def _value(self) -> Any:
+        """Decode the next complete JSON value"""
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number ending exactly at the buffer end may continue in the next chunk
+            if end == len(self._buf) and not self._eof:
+                self._fill()
+                continue
+            self._pos = end
+            return value
+
+    def iter_array(self, path: Sequence[str]) -> Iterator[Any]:
+        """Yield the elements of the array at ``path`` one at a time (nothing if it is absent)"""
+        for key in path:
+            if self._peek() != '{':
+                return
+            self._pos += 1
+            if self._peek() == '}':
+                return
+            while True:
+                name = self._value()
+                self._expect(':')
+                if name == key:
+                    break
+                self._value()  # a sibling we do not need
+                if self._expect(',}') == '}':
+                    return
+
+        if self._peek() != '[':
+            return
+        self._pos += 1
+        if self._peek() == ']':
+            return
+        while True:
+            yield self._value()
+            if self._expect(',]') == ']':
+                return
+
+
+def iter_chunks(response, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """Body chunks of a streamed requests or httpx response"""
+    if hasattr(response, 'iter_content'):
+        return response.iter_content(chunk_size)
+    return response.iter_bytes(chunk_size)
+
+
+def _finish(response, chunks: Iterator[bytes]) -> None:
+    """Drain a small unread remainder (keeps the connection pooled), else close"""
+    drained = 0
+    try:
+        for chunk in chunks:
+            drained += len(chunk)
+            if drained > DRAIN_LIMIT:
+                break
+    except Exception:  # draining is best effort: the products are already parsed
+        pass
+    finally:
+        response.close()
+
+
+def stream_products(response, path: Sequence[str], project, limit: Optional[int] = None,
+                    chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[Product]:
+    """
+    Parse a streamed search response into at most ``limit`` records.
+
+    Args:
+        response: Response opened with ``stream=True``
+        path: Keys leading to the product array
+        project: Function mapping one decoded item to a Product
+        limit: Stop after this many products (None = all)
+        chunk_size: Bytes per read
+
+    Raises:
+        requests.HTTPError: Error status (the response is closed)
+        json.JSONDecodeError: Malformed body (a ValueError)
+    """
+    chunks = iter_chunks(response, chunk_size)
+    products = []
+    try:
+        response.raise_for_status()
+        if limit is None or limit > 0:
+            for item in JSONArrayStream(chunks).iter_array(path):
+                products.append(project(item))
+                if limit is not None and len(products) >= limit:
+                    break
+    except BaseException:
+        response.close()
+        raise
+    _finish(response, chunks)
+    return products
+
+
+def _paise(amount: Any) -> Optional[int]:
+    if isinstance(amount, (int, float)) and not isinstance(amount, bool):
+        return int(round(amount * 100)) if math.isfinite(amount) else None
+    price = Price.from_amount(amount)
+    return price.minor_units if price is not None else None
+
+
+def amazon_product(item: Dict) -> Product:
+    """Project one PA-API SearchItems item"""
+    listings = (item.get('Offers') or {}).get('Listings') or [{}]
+    listing = listings[0] or {}
+    price = listing.get('Price') or {}
+    availability = (listing.get('Availability') or {}).get('Type')
+    info = item.get('ItemInfo') or {}
+    reviews = item.get('CustomerReviews') or {}
+    return Product(
+        'amazon',
+        product_id=item.get('ASIN'),
+        title=(info.get('Title') or {}).get('DisplayValue'),
+        brand=((info.get('ByLineInfo') or {}).get('Brand') or {}).get('DisplayValue'),
+        price_paise=_paise(price.get('Amount')),
+        currency=(price.get('Currency') or 'INR').upper(),
+        mrp_paise=_paise((listing.get('SavingBasis') or {}).get('Amount')),
+        rating=(reviews.get('StarRating') or {}).get('Value'),
+        reviews=reviews.get('Count'),
+        url=item.get('DetailPageURL'),
+        in_stock=None if availability is None else availability == 'Now'
+    )
+
+
+def flipkart_product(product: Dict) -> Product:
+    """Project one Flipkart affiliate search product"""
+    info = product.get('productBaseInfoV1') or {}
+    price = info.get('flipkartSellingPrice') or {}
+    rating = info.get('rating') or {}
+    return Product(
+        'flipkart',
+        product_id=product.get('productId') or info.get('productId'),
+        title=info.get('title'),
+        brand=info.get('productBrand'),
+        price_paise=_paise(price.get('amount')),
+        currency=(price.get('currency') or 'INR').upper(),
+        mrp_paise=_paise((info.get('maximumRetailPrice') or {}).get('amount')),
+        discount=info.get('discountPercentage'),
+        rating=rating.get('average'),
+        reviews=rating.get('count'),
+        url=info.get('productUrl'),
+        in_stock=info.get('inStock')
+    )